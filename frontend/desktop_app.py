@@ -2,6 +2,7 @@ import sys
 import os
 import time
 import threading
+from functools import partial
 from pathlib import Path
 from typing import Optional, List, Dict
 import numpy as np
@@ -10,14 +11,17 @@ import cv2
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QCheckBox, QLabel, QFileDialog, QRadioButton,
-    QButtonGroup, QTextEdit, QTabWidget, QGroupBox, QScrollArea,
+    QButtonGroup, QTextEdit, QTextBrowser, QTabWidget, QGroupBox, QScrollArea,
     QProgressBar, QMessageBox, QSplitter, QFrame, QSlider, QComboBox,
     QSizePolicy, QTableWidget, QTableWidgetItem, QHeaderView, QLineEdit,
     QSpinBox, QListWidget, QListWidgetItem, QDialog, QDialogButtonBox,
-    QGraphicsOpacityEffect, QStyle
+    QGraphicsOpacityEffect, QStyle, QTableView, QStyledItemDelegate
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl, QSize, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QPixmap, QImage, QFont, QIcon
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QUrl, QSize, QPropertyAnimation, QEasingCurve,
+    QAbstractTableModel, QModelIndex, QEvent, QRectF
+)
+from PyQt6.QtGui import QPixmap, QImage, QFont, QIcon, QColor, QPainter, QTextDocument, QDesktopServices
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 
@@ -58,7 +62,7 @@ from main import process_video
 
 # Import manual tracking module
 try:
-    from frontend.manual_tracking import ManualTrackingData, TrackingEvent
+    from frontend.manual_tracking import ManualTrackingData, TrackingEvent, NEUTRAL_TEAM, HALF_NAMES
 except ImportError as e:
     # If import fails, create dummy classes
     import sys
@@ -69,8 +73,482 @@ except ImportError as e:
             self.events = []
     class TrackingEvent:
         pass
+    NEUTRAL_TEAM = sys.intern("กลาง")
+    HALF_NAMES = {
+        1: ("ครึ่งแรก", "First Half"),
+        2: ("ครึ่งหลัง", "Second Half"),
+        3: ("ต่อเวลาครึ่งแรก", "Extra Time First Half"),
+        4: ("ต่อเวลาครึ่งหลัง", "Extra Time Second Half"),
+    }
 from frontend.translations import get_translation_manager, t
 
+# Placeholder shown in events table cells with no value (one shared string)
+EMPTY_CELL_TEXT = "-"
+
+# How long a manual tracking video may take to report a load result
+MANUAL_VIDEO_LOAD_TIMEOUT_MS = 5000
+
+
+# Manual Tracking help dialog sections, all rendered into one QTextBrowser
+# document via HELP_SECTION_HTML (no per-section widgets):
+# (title_th, title_en, content_th, content_en, accent colour)
+MANUAL_HELP_SECTIONS = [
+    # Section 1: Introduction
+    (
+        "🎯 ภาพรวมการใช้งาน",
+        "🎯 Overview",
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'>
+        <b>Manual Tracking</b> เป็นระบบติดตามเหตุการณ์การแข่งขันฟุตบอลแบบมืออาชีพ 
+        ใช้ในการวิเคราะห์การแข่งขันฟุตบอล
+        </p>
+        <p style='font-size: 11pt; line-height: 1.6;'>
+        <b>ขั้นตอนการใช้งาน:</b><br>
+        1. กดปุ่ม <b style='color: #2196F3;'>เพิ่มวิดีโอ</b> เพื่อโหลดวิดีโอการแข่งขัน<br>
+        2. ตั้งชื่อทีม 1 และทีม 2 (หรือใช้ชื่อเริ่มต้น)<br>
+        3. ตั้งค่ารายชื่อผู้เล่น (ถ้าต้องการ)<br>
+        4. เลือกทีมและครึ่งที่ต้องการติดตาม<br>
+        5. เล่นวิดีโอและกดปุ่มเหตุการณ์ต่างๆ เมื่อเกิดเหตุการณ์<br>
+        6. ส่งออกข้อมูลเป็น Excel หรือ CSV เมื่อเสร็จสิ้น
+        </p>
+        """,
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'>
+        <b>Manual Tracking</b> is a professional football match event tracking system 
+        used for match analysis.
+        </p>
+        <p style='font-size: 11pt; line-height: 1.6;'>
+        <b>Usage Steps:</b><br>
+        1. Click the <b style='color: #2196F3;'>Add Video</b> button to load match video<br>
+        2. Set Team 1 and Team 2 names (or use default names)<br>
+        3. Set player list (if needed)<br>
+        4. Select team and half to track<br>
+        5. Play video and click event buttons when events occur<br>
+        6. Export data as Excel or CSV when finished
+        </p>
+        """,
+        "#4CAF50"
+    ),
+    # Section 2: Attacking Actions
+    (
+        "⚽ การโจมตี (Attacking Actions)",
+        "⚽ Attacking Actions",
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>ปุ่มการโจมตี:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b style='color: #FF9800;'>ยิง</b> - บันทึกการยิงประตู
+            <ul>
+            <li><b>ประตู</b> - ยิงได้ประตู</li>
+            <li><b>ยิงเข้า</b> - ยิงเข้าเป้าแต่ไม่ได้ประตู (นับเป็นสำเร็จ)</li>
+            <li><b>ยิงออก</b> - ยิงออกนอกเป้า</li>
+            <li><b>บล็อก</b> - ถูกบล็อก</li>
+            <li><b>ถูกเซฟ</b> - ถูกผู้รักษาประตูเซฟ</li>
+            </ul>
+        </li>
+        <li><b style='color: #2196F3;'>ส่งบอล</b> - บันทึกการส่งบอล
+            <ul>
+            <li><b>สำเร็จ</b> - ส่งบอลสำเร็จ</li>
+            <li><b>ไม่สำเร็จ</b> - ส่งบอลไม่สำเร็จ</li>
+            <li><b>แอสซิสต์</b> - ส่งบอลแล้วได้ประตู</li>
+            <li><b>คีย์พาส</b> - ส่งบอลที่สร้างโอกาสยิง</li>
+            </ul>
+        </li>
+        <li><b style='color: #E91E63;'>ข้ามบอล</b> - บันทึกการข้ามบอล (ผลลัพธ์เหมือนส่งบอล)</li>
+        <li><b style='color: #9C27B0;'>ผ่านบอล</b> - บันทึกการผ่านบอล (ผลลัพธ์เหมือนส่งบอล)</li>
+        <li><b style='color: #795548;'>ส่งบอลยาว</b> - บันทึกการส่งบอลยาว (ผลลัพธ์เหมือนส่งบอล)</li>
+        <li><b style='color: #607D8B;'>ส่งบอลสั้น</b> - บันทึกการส่งบอลสั้น (สำเร็จ/ไม่สำเร็จ)</li>
+        <li><b style='color: #FF5722;'>ส่งบอลในเขตโทษ</b> - บันทึกการส่งบอลในเขตโทษ (ผลลัพธ์เหมือนส่งบอล)</li>
+        </ul>
+        """,
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>Attacking Buttons:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b style='color: #FF9800;'>Shot</b> - Record shot on goal
+            <ul>
+            <li><b>Goal</b> - Shot scored</li>
+            <li><b>On Target</b> - Shot on target but no goal (counted as successful)</li>
+            <li><b>Off Target</b> - Shot off target</li>
+            <li><b>Blocked</b> - Shot blocked</li>
+            <li><b>Saved</b> - Saved by goalkeeper</li>
+            </ul>
+        </li>
+        <li><b style='color: #2196F3;'>Pass</b> - Record pass
+            <ul>
+            <li><b>Successful</b> - Pass successful</li>
+            <li><b>Unsuccessful</b> - Pass unsuccessful</li>
+            <li><b>Assist</b> - Pass that resulted in goal</li>
+            <li><b>Key Pass</b> - Pass that created shooting opportunity</li>
+            </ul>
+        </li>
+        <li><b style='color: #E91E63;'>Cross</b> - Record cross (outcomes same as pass)</li>
+        <li><b style='color: #9C27B0;'>Through Ball</b> - Record through ball (outcomes same as pass)</li>
+        <li><b style='color: #795548;'>Long Pass</b> - Record long pass (outcomes same as pass)</li>
+        <li><b style='color: #607D8B;'>Short Pass</b> - Record short pass (successful/unsuccessful)</li>
+        <li><b style='color: #FF5722;'>Pass in Penalty Area</b> - Record pass in penalty area (outcomes same as pass)</li>
+        </ul>
+        """,
+        "#FF9800"
+    ),
+    # Section 3: Set Pieces
+    (
+        "🎯 ลูกตั้งเตะ (Set Pieces)",
+        "🎯 Set Pieces",
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>ปุ่มลูกตั้งเตะ:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b style='color: #00BCD4;'>เตะมุม</b> - บันทึกการเตะมุม
+            <ul>
+            <li><b>ประตู</b> - เตะมุมแล้วได้ประตู</li>
+            <li><b>ยิงเข้า</b> - เตะมุมแล้วยิงเข้าเป้า</li>
+            <li><b>ยิงออก</b> - เตะมุมแล้วยิงออก</li>
+            <li><b>แอสซิสต์</b> - เตะมุมแล้วได้ประตู</li>
+            <li><b>คีย์พาส</b> - เตะมุมแล้วสร้างโอกาสยิง</li>
+            <li><b>เคลียร์</b> - ถูกเคลียร์ออก</li>
+            </ul>
+        </li>
+        <li><b style='color: #FFC107;'>ฟรีคิก</b> - บันทึกการเตะฟรีคิก (ผลลัพธ์เหมือนเตะมุม)</li>
+        <li><b style='color: #F44336;'>ลูกโทษ</b> - บันทึกการเตะลูกโทษ
+            <ul>
+            <li><b>ประตู</b> - เตะลูกโทษได้ประตู</li>
+            <li><b>ไม่ประตู</b> - เตะลูกโทษไม่ประตู</li>
+            <li><b>ถูกเซฟ</b> - ถูกผู้รักษาประตูเซฟ</li>
+            </ul>
+        </li>
+        <li><b style='color: #607D8B;'>ทุ่มบอล</b> - บันทึกการทุ่มบอล (สำเร็จ/ไม่สำเร็จ)</li>
+        </ul>
+        """,
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>Set Piece Buttons:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b style='color: #00BCD4;'>Corner Kick</b> - Record corner kick
+            <ul>
+            <li><b>Goal</b> - Corner kick resulted in goal</li>
+            <li><b>On Target</b> - Corner kick shot on target</li>
+            <li><b>Off Target</b> - Corner kick shot off target</li>
+            <li><b>Assist</b> - Corner kick resulted in goal</li>
+            <li><b>Key Pass</b> - Corner kick created shooting opportunity</li>
+            <li><b>Cleared</b> - Corner kick cleared</li>
+            </ul>
+        </li>
+        <li><b style='color: #FFC107;'>Free Kick</b> - Record free kick (outcomes same as corner kick)</li>
+        <li><b style='color: #F44336;'>Penalty</b> - Record penalty kick
+            <ul>
+            <li><b>Goal</b> - Penalty scored</li>
+            <li><b>Missed</b> - Penalty missed</li>
+            <li><b>Saved</b> - Penalty saved by goalkeeper</li>
+            </ul>
+        </li>
+        <li><b style='color: #607D8B;'>Throw In</b> - Record throw in (successful/unsuccessful)</li>
+        </ul>
+        """,
+        "#00BCD4"
+    ),
+    # Section 4: Defensive Actions
+    (
+        "🛡️ การป้องกัน (Defensive Actions)",
+        "🛡️ Defensive Actions",
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>ปุ่มการป้องกัน:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b style='color: #9C27B0;'>แย่งบอล</b> - บันทึกการแย่งบอล
+            <ul>
+            <li><b>สำเร็จ</b> - แย่งบอลสำเร็จ</li>
+            <li><b>ไม่สำเร็จ</b> - แย่งบอลไม่สำเร็จ</li>
+            <li><b>ฟาวล์</b> - แย่งบอลแล้วทำฟาวล์</li>
+            </ul>
+        </li>
+        <li><b style='color: #9C27B0;'>สกัดบอล</b> - บันทึกการสกัดบอล (สำเร็จ/ไม่สำเร็จ)</li>
+        <li><b style='color: #795548;'>เคลียร์บอล</b> - บันทึกการเคลียร์บอล
+            <ul>
+            <li><b>สำเร็จ</b> - เคลียร์บอลสำเร็จ</li>
+            <li><b>ไม่สำเร็จ</b> - เคลียร์บอลไม่สำเร็จ</li>
+            <li><b>อันตราย</b> - เคลียร์บอลแบบอันตราย</li>
+            </ul>
+        </li>
+        <li><b style='color: #FF5722;'>บล็อก</b> - บันทึกการบล็อก
+            <ul>
+            <li><b>บล็อก</b> - บล็อกสำเร็จ</li>
+            <li><b>บล็อกยิง</b> - บล็อกการยิง</li>
+            </ul>
+        </li>
+        <li><b style='color: #00BCD4;'>เซฟ</b> - บันทึกการเซฟของผู้รักษาประตู
+            <ul>
+            <li><b>เซฟ</b> - เซฟสำเร็จ</li>
+            <li><b>ไม่เซฟ</b> - ไม่เซฟได้</li>
+            <li><b>เซฟสำคัญ</b> - เซฟที่สำคัญ</li>
+            </ul>
+        </li>
+        </ul>
+        """,
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>Defensive Buttons:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b style='color: #9C27B0;'>Tackle</b> - Record tackle
+            <ul>
+            <li><b>Successful</b> - Tackle successful</li>
+            <li><b>Unsuccessful</b> - Tackle unsuccessful</li>
+            <li><b>Foul</b> - Tackle resulted in foul</li>
+            </ul>
+        </li>
+        <li><b style='color: #9C27B0;'>Interception</b> - Record interception (successful/unsuccessful)</li>
+        <li><b style='color: #795548;'>Clearance</b> - Record clearance
+            <ul>
+            <li><b>Successful</b> - Clearance successful</li>
+            <li><b>Unsuccessful</b> - Clearance unsuccessful</li>
+            <li><b>Dangerous</b> - Dangerous clearance</li>
+            </ul>
+        </li>
+        <li><b style='color: #FF5722;'>Block</b> - Record block
+            <ul>
+            <li><b>Block</b> - Block successful</li>
+            <li><b>Shot Block</b> - Block shot</li>
+            </ul>
+        </li>
+        <li><b style='color: #00BCD4;'>Save</b> - Record goalkeeper save
+            <ul>
+            <li><b>Save</b> - Save successful</li>
+            <li><b>No Save</b> - Could not save</li>
+            <li><b>Important Save</b> - Important save</li>
+            </ul>
+        </li>
+        </ul>
+        """,
+        "#9C27B0"
+    ),
+    # Section 5: Disciplinary
+    (
+        "⚖️ การทำผิดกติกา (Disciplinary)",
+        "⚖️ Disciplinary",
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>ปุ่มการทำผิดกติกา:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b style='color: #F44336;'>ฟาวล์</b> - บันทึกการทำฟาวล์
+            <ul>
+            <li><b>ฟาวล์</b> - ฟาวล์ธรรมดา</li>
+            <li><b>ใบเหลือง</b> - ฟาวล์แล้วได้ใบเหลือง</li>
+            <li><b>ใบแดง</b> - ฟาวล์แล้วได้ใบแดง</li>
+            </ul>
+        </li>
+        <li><b style='color: #FFEB3B;'>ใบเหลือง</b> - บันทึกการได้ใบเหลือง</li>
+        <li><b style='color: #E91E63;'>ใบแดง</b> - บันทึกการได้ใบแดง</li>
+        </ul>
+        """,
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>Disciplinary Buttons:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b style='color: #F44336;'>Foul</b> - Record foul
+            <ul>
+            <li><b>Foul</b> - Regular foul</li>
+            <li><b>Yellow Card</b> - Foul resulted in yellow card</li>
+            <li><b>Red Card</b> - Foul resulted in red card</li>
+            </ul>
+        </li>
+        <li><b style='color: #FFEB3B;'>Yellow Card</b> - Record yellow card</li>
+        <li><b style='color: #E91E63;'>Red Card</b> - Record red card</li>
+        </ul>
+        """,
+        "#F44336"
+    ),
+    # Section 6: Other Events
+    (
+        "📋 เหตุการณ์อื่นๆ (Other Events)",
+        "📋 Other Events",
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>ปุ่มเหตุการณ์อื่นๆ:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b style='color: #9E9E9E;'>ออฟไซด์</b> - บันทึกการออฟไซด์</li>
+        <li><b style='color: #607D8B;'>บอลออก</b> - บันทึกการที่บอลออกนอกสนาม</li>
+        <li><b style='color: #795548;'>เปลี่ยนตัว</b> - บันทึกการเปลี่ยนตัวผู้เล่น
+            <ul>
+            <li><b>เปลี่ยนตัวเข้า</b> - ผู้เล่นเข้า</li>
+            <li><b>เปลี่ยนตัวออก</b> - ผู้เล่นออก</li>
+            </ul>
+        </li>
+        <li><b style='color: #FF9800;'>บาดเจ็บ</b> - บันทึกการบาดเจ็บ</li>
+        <li><b style='color: #F44336;'>เสียบอล</b> - บันทึกการเสียบอล</li>
+        <li><b style='color: #4CAF50;'>ครองบอล</b> - บันทึกการครองบอล</li>
+        </ul>
+        """,
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>Other Event Buttons:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b style='color: #9E9E9E;'>Offside</b> - Record offside</li>
+        <li><b style='color: #607D8B;'>Ball Out</b> - Record ball out of play</li>
+        <li><b style='color: #795548;'>Substitution</b> - Record player substitution
+            <ul>
+            <li><b>Sub In</b> - Player coming in</li>
+            <li><b>Sub Out</b> - Player going out</li>
+            </ul>
+        </li>
+        <li><b style='color: #FF9800;'>Injury</b> - Record injury</li>
+        <li><b style='color: #F44336;'>Lost Ball</b> - Record lost ball</li>
+        <li><b style='color: #4CAF50;'>Possession</b> - Record ball possession</li>
+        </ul>
+        """,
+        "#607D8B"
+    ),
+    # Section 7: Tips and Best Practices
+    (
+        "💡 เคล็ดลับและแนวทางปฏิบัติ",
+        "💡 Tips and Best Practices",
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>เคล็ดลับการใช้งาน:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b>การบันทึกเวลา:</b> วิดีโอจะหยุดอัตโนมัติเมื่อกดปุ่มเหตุการณ์ เพื่อให้บันทึกเวลาที่แม่นยำ</li>
+        <li><b>การตั้งชื่อทีม:</b> สามารถเปลี่ยนชื่อทีมได้ตลอดเวลา และจะอัพเดทในรายการเหตุการณ์ทันที</li>
+        <li><b>การตั้งค่ารายชื่อ:</b> ตั้งค่ารายชื่อผู้เล่นเพื่อให้สามารถบันทึกชื่อผู้เล่นได้เมื่อเกิดประตู</li>
+        <li><b>การลบเหตุการณ์:</b> คลิกที่เหตุการณ์ในตารางแล้วกด "ลบที่เลือก" หรือดับเบิลคลิกเพื่อไปยังเวลานั้น</li>
+        <li><b>การปรับแต่งปุ่ม:</b> ใช้ปุ่ม "ปรับแต่งปุ่ม" เพื่อเลือกปุ่มที่ต้องการแสดง</li>
+        <li><b>การส่งออก:</b> ส่งออกเป็น Excel เพื่อดูสถิติแบบละเอียด หรือ CSV สำหรับการวิเคราะห์ต่อ</li>
+        <li><b>การบันทึกประตู:</b> เมื่อเลือกผลลัพธ์ "ประตู" จะมีหน้าต่างให้กรอกชื่อผู้ยิงและรายละเอียดเพิ่มเติม</li>
+        </ul>
+        """,
+        """
+        <p style='font-size: 11pt; line-height: 1.6;'><b>Usage Tips:</b></p>
+        <ul style='font-size: 10pt; line-height: 1.8;'>
+        <li><b>Time Recording:</b> Video will automatically pause when clicking event buttons to ensure accurate time recording</li>
+        <li><b>Team Naming:</b> You can change team names at any time, and it will update in the event list immediately</li>
+        <li><b>Player List Setup:</b> Set up player list to record player names when goals occur</li>
+        <li><b>Deleting Events:</b> Click on event in table then click "Delete Selected" or double-click to go to that time</li>
+        <li><b>Button Customization:</b> Use "Customize Buttons" button to select which buttons to display</li>
+        <li><b>Exporting:</b> Export as Excel to view detailed statistics, or CSV for further analysis</li>
+        <li><b>Goal Recording:</b> When selecting "Goal" outcome, a window will appear to enter scorer name and additional details</li>
+        </ul>
+        """,
+        "#FFD700"
+    ),
+]
+
+
+# Manual Tracking help dialog geometry (px); HELP_SECTIONS_WIDTH is derived
+# from these, so change them here rather than at their use sites
+HELP_DIALOG_MIN_WIDTH = 900
+HELP_DIALOG_MIN_HEIGHT = 700
+HELP_DIALOG_MARGIN = 20  # Dialog layout and scroll content margins
+HELP_SCROLL_BORDER = 2  # helpScroll border in HELP_DIALOG_QSS
+HELP_SCROLLBAR_WIDTH = 14  # helpScroll vertical scrollbar in HELP_DIALOG_QSS
+
+# Manual Tracking help dialog stylesheet, applied once to the dialog and
+# reaching its parts through object names
+HELP_DIALOG_QSS = """
+    QDialog {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1a1a2e, stop:1 #16213e);
+        color: #e0e0e0;
+    }
+    QLabel {
+        color: #e0e0e0;
+    }
+    QPushButton {
+        background-color: #c41e3a;
+        color: white;
+        padding: 10px 25px;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 11pt;
+    }
+    QPushButton:hover {
+        background-color: #d63347;
+    }
+    QLabel#helpTitle {
+        font-weight: bold;
+        font-size: 20pt;
+        color: #FFD700;
+        padding: 10px;
+        background-color: rgba(196, 30, 58, 0.3);
+        border-radius: 8px;
+        margin-bottom: 10px;
+    }
+    QScrollArea#helpScroll {
+        background-color: rgba(30, 30, 46, 0.5);
+        border: {scroll_border}px solid #c41e3a;
+        border-radius: 8px;
+    }
+    QScrollArea#helpScroll QScrollBar:vertical {
+        background-color: #2b2b2b;
+        width: {scrollbar_width}px;
+        border-radius: 7px;
+    }
+    QScrollArea#helpScroll QScrollBar::handle:vertical {
+        background-color: #c41e3a;
+        border-radius: 7px;
+        min-height: 30px;
+    }
+    QScrollArea#helpScroll QScrollBar::handle:vertical:hover {
+        background-color: #d63347;
+    }
+    QTextBrowser#helpSections {
+        background-color: transparent;
+        border: none;
+        color: #e0e0e0;
+        font-size: 10pt;
+    }
+    QFrame#creditsCard {
+        background-color: rgba(115, 90, 150, 0.4);
+        border: 2px solid #c41e3a;
+        border-radius: 10px;
+    }
+    QFrame#creditsCard QLabel {
+        background: transparent;
+        color: #e0e0e0;
+        font-size: 11pt;
+    }
+    QFrame#creditsCard QPushButton {
+        background: transparent;
+        color: #2196F3;
+        padding: 2px 0px;
+        border: none;
+        font-size: 11pt;
+        text-align: left;
+    }
+    QFrame#creditsCard QPushButton:hover {
+        color: #64B5F6;
+    }
+""".replace("{scroll_border}", str(HELP_SCROLL_BORDER)).replace("{scrollbar_width}", str(HELP_SCROLLBAR_WIDTH))
+
+# Help dialog credits block (one rich-text label)
+CREDITS_HTML_TH = """
+    <p style="font-size: 18pt; font-weight: bold; color: #FFD700;">👨‍💻 ผู้พัฒนา</p>
+    <p style="font-size: 15pt; font-weight: bold; color: #FFFFFF;">นายพัชระ อัลอุมารี</p>
+    <p>📍 <b>ที่อยู่:</b> กรุงเทพมหานคร, ประเทศไทย</p>
+"""
+CREDITS_HTML_EN = """
+    <p style="font-size: 18pt; font-weight: bold; color: #FFD700;">👨‍💻 Developer</p>
+    <p style="font-size: 15pt; font-weight: bold; color: #FFFFFF;">Mr.Patchara Al-umaree</p>
+    <p>📍 <b>Location:</b> Bangkok, Thailand</p>
+"""
+# Credits contact links, shown as plain-text buttons
+CREDITS_EMAIL_URL = "mailto:Patcharaalumaree@gmail.com"
+CREDITS_GITHUB_URL = "https://github.com/MrPatchara"
+
+# Wrap width of the help sections document: what the dialog's minimum size
+# leaves inside both margins, the scroll border and scrollbar, so resizing the
+# dialog never re-wraps the text
+HELP_SECTIONS_WIDTH = (
+    HELP_DIALOG_MIN_WIDTH
+    - 4 * HELP_DIALOG_MARGIN
+    - 2 * HELP_SCROLL_BORDER
+    - HELP_SCROLLBAR_WIDTH
+)
+
+# HTML for one help section: accent colour bar beside the title and body
+HELP_SECTION_HTML = """
+    <table width="100%" cellspacing="0" cellpadding="10" style="margin-bottom: 20px;">
+    <tr>
+        <td width="4" bgcolor="{color}"></td>
+        <td bgcolor="#1e1e2e">
+            <p style="font-weight: bold; font-size: 14pt; color: {color};">{title}</p>
+            {content}
+        </td>
+    </tr>
+    </table>
+"""
+# HELP_SECTION_HTML with each section's accent colour already filled in
+HELP_SECTION_HTML_BY_COLOR = {
+    color: HELP_SECTION_HTML.replace("{color}", color)
+    for *_, color in MANUAL_HELP_SECTIONS
+}
+
 
 class VideoProcessingThread(QThread):
     """Thread for processing video without freezing UI"""
@@ -526,6 +1004,142 @@ class PreviewVideoWidget(QWidget):
             pass
 
 
+class EventsTableModel(QAbstractTableModel):
+    """Table model exposing manual tracking events to a QTableView"""
+    def __init__(self, tracking_data=None, parent=None):
+        super().__init__(parent)
+        self.tracking_data = tracking_data
+        self.headers: List[str] = []
+        self._reset_translations()
+
+    def _reset_translations(self):
+        """Drop cached cell translations (called on every full refresh)"""
+        self._translations: Dict[str, str] = {}
+        self._neutral_text = t(NEUTRAL_TEAM, "Neutral")
+        self._delete_text = t("ลบ", "Delete")
+        # Language is fixed between refreshes, so translate the half names once
+        self._half_names = {half: t(th, en) for half, (th, en) in HALF_NAMES.items()}
+        self._half_prefix = "Half" if get_translation_manager().current_language == "EN" else "ครึ่ง"
+
+    def _translated(self, text: str) -> str:
+        """Translate an event type/outcome once per refresh"""
+        translated = self._translations.get(text)
+        if translated is None:
+            translated = self._translations[text] = t(text, text)
+        return translated
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or not self.tracking_data:
+            return 0
+        return len(self.tracking_data.events)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 7
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        event = self.tracking_data.events[index.row()]
+        column = index.column()
+
+        if column == 0:
+            # Time
+            minutes, seconds = divmod(int(event.timestamp), 60)
+            return f"{minutes:02d}:{seconds:02d}"
+        if column == 1:
+            # Event - translate event_type
+            return self._translated(event.event_type)
+        if column == 2:
+            # Outcome - translate outcome
+            if event.outcome:
+                return self._translated(event.outcome)
+            return EMPTY_CELL_TEXT
+        if column == 3:
+            # Team - translate NEUTRAL_TEAM if needed, otherwise keep team name
+            if event.team == NEUTRAL_TEAM:
+                return self._neutral_text
+            return event.team
+        if column == 4:
+            # Half - convert numeric to text with translation
+            return self._half_names.get(event.half, f"{self._half_prefix} {event.half}")
+        if column == 5:
+            # Player name
+            return event.player_name if event.player_name else EMPTY_CELL_TEXT
+        # Delete button label - painted by DeleteButtonDelegate
+        return self._delete_text
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal
+                and section < len(self.headers)):
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_headers(self, headers: List[str]):
+        """Set horizontal header labels"""
+        self.headers = list(headers)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self.headers) - 1)
+
+    def add_event(self, event):
+        """Add an event to the tracking data, inserting only its row"""
+        row = self.tracking_data.insert_position(event.timestamp)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.tracking_data.add_event(event)
+        self.endInsertRows()
+
+    def remove_event(self, row: int):
+        """Remove an event from the tracking data, removing only its row"""
+        if not 0 <= row < self.rowCount():
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.tracking_data.remove_event(row)
+        self.endRemoveRows()
+
+    def clear_events(self):
+        """Remove every event from the tracking data"""
+        if not self.rowCount():
+            return
+        self.beginResetModel()
+        self.tracking_data.clear_events()
+        self.endResetModel()
+
+    def refresh(self):
+        """Tell attached views that the whole event list has changed"""
+        self.beginResetModel()
+        self._reset_translations()
+        self.endResetModel()
+
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """Paints the management column as a delete button and handles its clicks"""
+    deleteRequested = pyqtSignal(int)  # row
+
+    # Parsed once and shared by every painted cell
+    BUTTON_COLOR = QColor("#f44336")
+    HOVER_COLOR = QColor("#d32f2f")
+    TEXT_COLOR = QColor("white")
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = option.rect.adjusted(4, 4, -4, -4)
+        painter.setPen(Qt.PenStyle.NoPen)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setBrush(self.HOVER_COLOR if hovered else self.BUTTON_COLOR)
+        painter.drawRoundedRect(QRectF(rect), 3, 3)
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, index.data())
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            self.deleteRequested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class FreeFootballAnalysisApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -555,6 +1169,21 @@ class FreeFootballAnalysisApp(QMainWindow):
             self.manual_tracking_data = ManualTrackingData()
         except:
             self.manual_tracking_data = None
+        # Set when an events table rebuild was skipped while the table was hidden
+        self._events_dirty = False
+        # Set while a coalesced events table rebuild is queued
+        self._events_refresh_pending = False
+        # Customize events dialog, built on first use and dropped on language change
+        self._customize_dialog: Optional[QDialog] = None
+        # Manual tracking help dialogs by language, built on first use and kept
+        self._help_dialogs: Dict[str, QDialog] = {}
+        # Video path awaiting a load result from the manual tracking player, and
+        # the one-shot fallback for loads that never report one (restarted per load)
+        self._pending_manual_video_path: Optional[str] = None
+        self._manual_video_load_timer = QTimer()
+        self._manual_video_load_timer.setSingleShot(True)
+        self._manual_video_load_timer.setInterval(MANUAL_VIDEO_LOAD_TIMEOUT_MS)
+        self._manual_video_load_timer.timeout.connect(self.on_manual_video_load_timeout)
         
         # Store team players
         self.team1_players: List[Dict[str, str]] = []
@@ -628,6 +1257,9 @@ class FreeFootballAnalysisApp(QMainWindow):
         self.ui_elements_to_translate = {}
         
         self.init_ui()
+        
+        # Build the help dialog while idle after startup so the first open is instant
+        QTimer.singleShot(2000, self._get_manual_tracking_help_dialog)
     
     def init_ui(self):
         self.setWindowTitle(t("FREE - Football Analysis", "FREE - Football Analysis"))
@@ -815,9 +1447,16 @@ class FreeFootballAnalysisApp(QMainWindow):
         logs_tab = self.create_logs_tab()
         tabs.addTab(logs_tab, t("Logs", "Logs"))
         
+        tabs.currentChanged.connect(self.on_tab_changed)
+        
         self.tabs = tabs
         return tabs
     
+    def on_tab_changed(self, index: int):
+        """Run work that was deferred while a tab was hidden"""
+        if self._events_dirty and self.events_table.isVisible():
+            self.update_events_table()
+    
     def create_usage_tab(self):
         widget = QWidget()
         widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -3790,7 +4429,8 @@ class FreeFootballAnalysisApp(QMainWindow):
                 t("เวลา", "Time"), t("เหตุการณ์", "Event"), t("ผลลัพธ์", "Outcome"),
                 t("ทีม", "Team"), t("ครึ่ง", "Half"), t("ผู้เล่น", "Player"), t("การจัดการ", "Management")
             ]
-            self.events_table.setHorizontalHeaderLabels(headers)
+            self.events_model.set_headers(headers)
+            self._schedule_events_refresh()
         
         # Update combo boxes
         if hasattr(self, 'half_combo'):
@@ -3866,6 +4506,11 @@ class FreeFootballAnalysisApp(QMainWindow):
                     translated = t(original_name, original_name)
                     radio.setText(translated)
         
+        # Rebuild the customize events dialog with the new language on next open
+        if self._customize_dialog is not None:
+            self._customize_dialog.deleteLater()
+            self._customize_dialog = None
+        
         # Update manual help button tooltip
         if hasattr(self, 'manual_help_btn') and hasattr(self, 'manual_help_btn_tooltip_text'):
             tooltip = t(self.manual_help_btn_tooltip_text[0], self.manual_help_btn_tooltip_text[1])
@@ -3957,6 +4602,7 @@ class FreeFootballAnalysisApp(QMainWindow):
         
         # Video player - responsive sizing
         self.manual_video_player = VideoPlayerWidget()
+        self.manual_video_player.media_player.mediaStatusChanged.connect(self.on_manual_media_status_changed)
         self.manual_video_player.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         # Store reference to speed label for translation
         if hasattr(self.manual_video_player, 'speed_label'):
@@ -4269,7 +4915,7 @@ class FreeFootballAnalysisApp(QMainWindow):
                     background-color: {color}aa;
                 }}
             """)
-            btn.clicked.connect(lambda checked, e=event_name: self.on_event_button_clicked(e))
+            btn.clicked.connect(partial(self.on_event_button_clicked, event_name))
             btn.setVisible(event_name in self.enabled_events)
             row_layout.addWidget(btn)
             self.event_buttons[event_name] = btn
@@ -4324,8 +4970,14 @@ class FreeFootballAnalysisApp(QMainWindow):
             }
         """)
         
-        self.events_table = QTableWidget()
-        self.events_table.setColumnCount(7)
+        self.events_table = QTableView()
+        self.events_model = EventsTableModel(self.manual_tracking_data, self.events_table)
+        self.events_table.setModel(self.events_model)
+        # Delete buttons are painted by a single delegate - no per-row widgets
+        delete_delegate = DeleteButtonDelegate(self.events_table)
+        delete_delegate.deleteRequested.connect(self.delete_event_by_index)
+        self.events_table.setItemDelegateForColumn(6, delete_delegate)
+        self.events_table.setMouseTracking(True)
         time_header_th = "เวลา"
         time_header_en = "Time"
         event_header_th = "เหตุการณ์"
@@ -4349,19 +5001,19 @@ class FreeFootballAnalysisApp(QMainWindow):
             player_header_en if current_lang == "EN" else player_header_th,
             management_header_en if current_lang == "EN" else management_header_th
         ]
-        self.events_table.setHorizontalHeaderLabels(table_headers)
+        self.events_model.set_headers(table_headers)
         self.events_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.events_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #1a1a1a;
                 color: #e0e0e0;
                 border: 1px solid #555;
                 gridline-color: #555;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #c41e3a;
             }
             QHeaderView::section {
@@ -4373,7 +5025,7 @@ class FreeFootballAnalysisApp(QMainWindow):
             }
         """)
         # Enable double-click to jump to timestamp
-        self.events_table.itemDoubleClicked.connect(self.on_event_double_clicked)
+        self.events_table.doubleClicked.connect(self.on_event_double_clicked)
         scroll_area.setWidget(self.events_table)
         events_list_layout.addWidget(scroll_area)
         
@@ -4507,7 +5159,7 @@ class FreeFootballAnalysisApp(QMainWindow):
                     border-color: #c41e3a;
                 }
             """)
-            btn.clicked.connect(lambda checked, o=outcome: self.on_outcome_selected(event_type, o, dialog, was_playing))
+            btn.clicked.connect(partial(self.on_outcome_selected, event_type, outcome, dialog, was_playing))
             layout.addWidget(btn)
             outcome_buttons.append(btn)
         
@@ -4795,17 +5447,9 @@ class FreeFootballAnalysisApp(QMainWindow):
             try:
                 current_time = self.manual_video_player.media_player.position() / 1000.0
                 team_index = team_combo.currentIndex()
-                team_name = team_combo.currentText()
+                team_name = sys.intern(team_combo.currentText())
                 
-                half_text = self.half_combo.currentText()
-                # Map half selection to numeric value - check both languages
-                half_mapping_direct = {
-                    "ครึ่งแรก": 1, "First Half": 1,
-                    "ครึ่งหลัง": 2, "Second Half": 2,
-                    "ต่อเวลาครึ่งแรก": 3, "Extra Time First Half": 3,
-                    "ต่อเวลาครึ่งหลัง": 4, "Extra Time Second Half": 4
-                }
-                half = half_mapping_direct.get(half_text, 1)
+                half = self.current_half()
                 
                 player_name = None
                 # Check if not "ไม่ระบุ" / "Not Specified" (index 0 is always the "not specified" option)
@@ -4815,15 +5459,14 @@ class FreeFootballAnalysisApp(QMainWindow):
                 if self.manual_tracking_data:
                     event = TrackingEvent(
                         timestamp=current_time,
-                        event_type=event_type,
+                        event_type=sys.intern(event_type),
                         team=team_name,
-                        outcome=outcome,
+                        outcome=sys.intern(outcome) if outcome else outcome,
                         half=half,
                         player_name=player_name
                     )
                     
-                    self.manual_tracking_data.add_event(event)
-                    self.update_events_table()
+                    self.events_model.add_event(event)
                     
                     # Show confirmation
                     player_info = f" โดย {player_name}" if player_name else ""
@@ -4848,133 +5491,89 @@ class FreeFootballAnalysisApp(QMainWindow):
             QMessageBox.warning(self, no_video_title, no_video_msg)
             return
         
+        if not self.manual_tracking_data:
+            return
+        
         try:
             current_time = self.manual_video_player.media_player.position() / 1000.0  # Convert to seconds
-            team_selection = self.team_combo.currentText()
-            # Use the team name directly from combo box (already updated with real names)
-            team = team_selection
-            
-            # Map half selection to numeric value - check both languages
-            half_text = self.half_combo.currentText()
-            half_mapping_th = {
-                t("ครึ่งแรก", "First Half"): 1,
-                t("ครึ่งหลัง", "Second Half"): 2,
-                t("ต่อเวลาครึ่งแรก", "Extra Time First Half"): 3,
-                t("ต่อเวลาครึ่งหลัง", "Extra Time Second Half"): 4
-            }
-            # Also check direct Thai/English values
-            half_mapping_direct = {
-                "ครึ่งแรก": 1, "First Half": 1,
-                "ครึ่งหลัง": 2, "Second Half": 2,
-                "ต่อเวลาครึ่งแรก": 3, "Extra Time First Half": 3,
-                "ต่อเวลาครึ่งหลัง": 4, "Extra Time Second Half": 4
-            }
-            half = half_mapping_direct.get(half_text, half_mapping_th.get(half_text, 1))
-            
-            if self.manual_tracking_data:
-                event = TrackingEvent(
-                    timestamp=current_time,
-                    event_type=event_type,
-                    team=team,
-                    outcome=outcome,
-                    half=half
-                )
-                
-                self.manual_tracking_data.add_event(event)
-                self.update_events_table()
-        except Exception as e:
+        except (RuntimeError, AttributeError) as e:
             QMessageBox.warning(self, t("ข้อผิดพลาด", "Error"), f"{t('ไม่สามารถเพิ่มเหตุการณ์ได้:', 'Cannot add event:')} {str(e)}")
+            return
+        
+        # Use the team name directly from combo box (already updated with real names)
+        team = sys.intern(self.team_combo.currentText())
+        
+        half = self.current_half()
+        
+        event = TrackingEvent(
+            timestamp=current_time,
+            event_type=sys.intern(event_type),
+            team=team,
+            outcome=sys.intern(outcome) if outcome else outcome,
+            half=half
+        )
+        self.events_model.add_event(event)
+    
+    def current_half(self) -> int:
+        """Get the selected half number (1-4)"""
+        # half_combo always lists the halves in order, in either language
+        return max(self.half_combo.currentIndex(), 0) + 1
     
     def update_events_table(self):
-        """Update the events table"""
+        """Rebuild the whole events table (language switch / bulk changes)"""
         if not self.manual_tracking_data:
             return
         
-        # Get current language for translation
-        current_lang = self.translation_manager.get_language()
-        
-        self.events_table.setRowCount(len(self.manual_tracking_data.events))
-        
-        for row, event in enumerate(self.manual_tracking_data.events):
-            # Time
-            time_str = f"{int(event.timestamp // 60):02d}:{int(event.timestamp % 60):02d}"
-            self.events_table.setItem(row, 0, QTableWidgetItem(time_str))
-            
-            # Event - translate event_type
-            translated_event_type = t(event.event_type, event.event_type)
-            self.events_table.setItem(row, 1, QTableWidgetItem(translated_event_type))
-            
-            # Outcome - translate outcome
-            if event.outcome:
-                translated_outcome = t(event.outcome, event.outcome)
-            else:
-                translated_outcome = "-"
-            self.events_table.setItem(row, 2, QTableWidgetItem(translated_outcome))
-            
-            # Team - translate "กลาง" if needed, otherwise keep team name
-            if event.team == "กลาง":
-                translated_team = t("กลาง", "Neutral")
-            else:
-                translated_team = event.team
-            self.events_table.setItem(row, 3, QTableWidgetItem(translated_team))
-            
-            # Half - convert numeric to text with translation
-            half_mapping_th = {
-                1: "ครึ่งแรก",
-                2: "ครึ่งหลัง",
-                3: "ต่อเวลาครึ่งแรก",
-                4: "ต่อเวลาครึ่งหลัง"
-            }
-            half_mapping_en = {
-                1: "First Half",
-                2: "Second Half",
-                3: "Extra Time First Half",
-                4: "Extra Time Second Half"
-            }
-            if current_lang == "EN":
-                half_text = half_mapping_en.get(event.half, f"Half {event.half}")
-            else:
-                half_text = half_mapping_th.get(event.half, f"ครึ่ง {event.half}")
-            self.events_table.setItem(row, 4, QTableWidgetItem(half_text))
-            
-            # Player name
-            player_name = event.player_name if event.player_name else "-"
-            self.events_table.setItem(row, 5, QTableWidgetItem(player_name))
-            
-            # Delete button - translate
-            delete_text = t("ลบ", "Delete")
-            delete_btn = QPushButton(delete_text)
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f44336;
-                    color: white;
-                    padding: 5px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #d32f2f;
-                }
-            """)
-            delete_btn.clicked.connect(lambda checked, r=row: self.delete_event_by_index(r))
-            self.events_table.setCellWidget(row, 6, delete_btn)
+        # Nothing to repaint while the Manual Tracking tab is hidden -
+        # rebuild once it is shown again (see on_tab_changed)
+        if not self.events_table.isVisible():
+            self._events_dirty = True
+            return
+        self._events_dirty = False
+        
+        # Rows are rendered on demand by EventsTableModel; freeze painting and
+        # view signals so the reset is laid out and repainted only once
+        table = self.events_table
+        sorting_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setSortingEnabled(False)
+        try:
+            self.events_model.refresh()
+        finally:
+            table.setSortingEnabled(sorting_enabled)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+    
+    def _schedule_events_refresh(self):
+        """Queue one update_events_table call for the next event loop pass"""
+        if self._events_refresh_pending:
+            return
+        self._events_refresh_pending = True
+        QTimer.singleShot(0, self._run_scheduled_events_refresh)
+    
+    def _run_scheduled_events_refresh(self):
+        self._events_refresh_pending = False
+        self.update_events_table()
     
     def delete_selected_event(self):
         """Delete selected event from table"""
-        current_row = self.events_table.currentRow()
+        current_row = self.events_table.currentIndex().row()
         if current_row >= 0:
             self.delete_event_by_index(current_row)
     
     def delete_event_by_index(self, index: int):
         """Delete event by index"""
-        self.manual_tracking_data.remove_event(index)
-        self.update_events_table()
+        self.events_model.remove_event(index)
     
-    def on_event_double_clicked(self, item):
+    def on_event_double_clicked(self, index: QModelIndex):
         """Handle double-click on event to jump to video timestamp"""
-        if not item:
+        # Ignore invalid cells and the delete button column
+        if not index.isValid() or index.column() == 6:
             return
         
-        row = item.row()
+        row = index.row()
         if row < 0 or not self.manual_tracking_data or row >= len(self.manual_tracking_data.events):
             return
         
@@ -5006,8 +5605,7 @@ class FreeFootballAnalysisApp(QMainWindow):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.manual_tracking_data.events.clear()
-            self.update_events_table()
+            self.events_model.clear_events()
     
     def export_tracking_to_csv(self):
         """Export tracking data to Excel with multiple sheets"""
@@ -5028,7 +5626,7 @@ class FreeFootballAnalysisApp(QMainWindow):
                 if file_path.endswith('.xlsx'):
                     # Export to Excel with multiple sheets
                     # Check if there are 2 teams for comparison sheet
-                    teams = sorted(set(e.team for e in self.manual_tracking_data.events if e.team != "กลาง"))
+                    teams = self.manual_tracking_data.get_teams()
                     has_comparison = len(teams) == 2
                     
                     self.manual_tracking_data.export_to_excel(file_path)
@@ -5074,8 +5672,10 @@ class FreeFootballAnalysisApp(QMainWindow):
         
         if file_path and os.path.exists(file_path):
             try:
-                # Reset load attempts counter
-                self._video_load_attempts = 0
+                # The result is reported by on_manual_media_status_changed, or by
+                # on_manual_video_load_timeout if the status never settles
+                self._pending_manual_video_path = file_path
+                self._manual_video_load_timer.start()
                 
                 # Load video
                 self.manual_video_player.load_video(file_path)
@@ -5084,58 +5684,75 @@ class FreeFootballAnalysisApp(QMainWindow):
                 if self.manual_tracking_data:
                     self.manual_tracking_data.video_path = file_path
                 
-                # Wait a bit for media to load, then check status
-                QTimer.singleShot(500, lambda: self.check_video_loaded(file_path))
+                # Reloading the current source emits no status change, so check it now
+                self.on_manual_media_status_changed(self.manual_video_player.media_player.mediaStatus())
                 
             except Exception as e:
+                self._pending_manual_video_path = None
+                self._manual_video_load_timer.stop()
                 QMessageBox.critical(self, "Error", f"Failed to load video:\n{str(e)}")
     
-    def check_video_loaded(self, file_path: str):
-        """Check if video loaded successfully"""
-        try:
-            media_status = self.manual_video_player.media_player.mediaStatus()
-            # Check for loaded status
-            if media_status in [QMediaPlayer.MediaStatus.LoadedMedia, QMediaPlayer.MediaStatus.BufferedMedia]:
-                success_title = t("โหลดวิดีโอสำเร็จ", "Video Loaded Successfully")
-                success_msg = t(
-                    f"โหลดวิดีโอสำเร็จ:\n{os.path.basename(file_path)}\n\nคุณสามารถเล่นวิดีโอและเพิ่มเหตุการณ์ติดตามได้แล้ว",
-                    f"Video loaded successfully:\n{os.path.basename(file_path)}\n\nYou can now play the video and add tracking events"
-                )
-                QMessageBox.information(self, success_title, success_msg)
-            elif media_status == QMediaPlayer.MediaStatus.InvalidMedia:
-                invalid_title = t("วิดีโอไม่ถูกต้อง", "Invalid Video")
-                invalid_msg = t(
-                    f"ไฟล์วิดีโออาจเสียหายหรือรูปแบบไม่รองรับ:\n{os.path.basename(file_path)}\n\nกรุณาลองใช้ไฟล์วิดีโออื่น",
-                    f"Video file may be corrupted or format not supported:\n{os.path.basename(file_path)}\n\nPlease try another video file"
-                )
-                QMessageBox.warning(self, invalid_title, invalid_msg)
-            else:
-                # Still loading, wait a bit more (max 5 seconds)
-                if not hasattr(self, '_video_load_attempts'):
-                    self._video_load_attempts = 0
-                self._video_load_attempts += 1
-                if self._video_load_attempts < 5:
-                    QTimer.singleShot(1000, lambda: self.check_video_loaded(file_path))
-                else:
-                    # Assume loaded after timeout
-                    success_title = t("โหลดวิดีโอสำเร็จ", "Video Loaded Successfully")
-                    success_msg = t(
-                        f"โหลดวิดีโอ:\n{os.path.basename(file_path)}\n\nคุณสามารถเล่นวิดีโอและเพิ่มเหตุการณ์ติดตามได้แล้ว",
-                        f"Video loaded:\n{os.path.basename(file_path)}\n\nYou can now play the video and add tracking events"
-                    )
-                    QMessageBox.information(self, success_title, success_msg)
-                    self._video_load_attempts = 0
-        except Exception as e:
-            # If check fails, assume it's loaded
+    def on_manual_media_status_changed(self, status):
+        """Report whether the video from load_video_for_manual_tracking loaded"""
+        file_path = self._pending_manual_video_path
+        if file_path is None:
+            return
+        
+        if status in [QMediaPlayer.MediaStatus.LoadedMedia, QMediaPlayer.MediaStatus.BufferedMedia]:
+            self._pending_manual_video_path = None
+            self._manual_video_load_timer.stop()
             success_title = t("โหลดวิดีโอสำเร็จ", "Video Loaded Successfully")
             success_msg = t(
-                f"โหลดวิดีโอ:\n{os.path.basename(file_path)}\n\nคุณสามารถเล่นวิดีโอและเพิ่มเหตุการณ์ติดตามได้แล้ว",
-                f"Video loaded:\n{os.path.basename(file_path)}\n\nYou can now play the video and add tracking events"
+                f"โหลดวิดีโอสำเร็จ:\n{os.path.basename(file_path)}\n\nคุณสามารถเล่นวิดีโอและเพิ่มเหตุการณ์ติดตามได้แล้ว",
+                f"Video loaded successfully:\n{os.path.basename(file_path)}\n\nYou can now play the video and add tracking events"
             )
             QMessageBox.information(self, success_title, success_msg)
+        elif status == QMediaPlayer.MediaStatus.InvalidMedia:
+            self._pending_manual_video_path = None
+            self._manual_video_load_timer.stop()
+            invalid_title = t("วิดีโอไม่ถูกต้อง", "Invalid Video")
+            invalid_msg = t(
+                f"ไฟล์วิดีโออาจเสียหายหรือรูปแบบไม่รองรับ:\n{os.path.basename(file_path)}\n\nกรุณาลองใช้ไฟล์วิดีโออื่น",
+                f"Video file may be corrupted or format not supported:\n{os.path.basename(file_path)}\n\nPlease try another video file"
+            )
+            QMessageBox.warning(self, invalid_title, invalid_msg)
+    
+    def on_manual_video_load_timeout(self):
+        """Stop waiting for a manual tracking video that never reported a load result"""
+        file_path = self._pending_manual_video_path
+        if file_path is None:
+            return
+        
+        # Stalled or still loading: disarm so a late status change shows nothing
+        self._pending_manual_video_path = None
+        success_title = t("โหลดวิดีโอสำเร็จ", "Video Loaded Successfully")
+        success_msg = t(
+            f"โหลดวิดีโอ:\n{os.path.basename(file_path)}\n\nคุณสามารถเล่นวิดีโอและเพิ่มเหตุการณ์ติดตามได้แล้ว",
+            f"Video loaded:\n{os.path.basename(file_path)}\n\nYou can now play the video and add tracking events"
+        )
+        QMessageBox.information(self, success_title, success_msg)
     
     def show_customize_events_dialog(self):
         """Show dialog to customize which tracking events are visible"""
+        # Build the dialog once and reuse it; only the check states change between opens
+        if self._customize_dialog is None:
+            self._customize_dialog = self._build_customize_events_dialog()
+        for event_name, checkbox in self.event_checkboxes.items():
+            checkbox.setChecked(event_name in self.enabled_events)
+        
+        if self._customize_dialog.exec() == QDialog.DialogCode.Accepted:
+            # Update enabled events based on checkboxes
+            self.enabled_events = {
+                event_name for event_name, checkbox in self.event_checkboxes.items()
+                if checkbox.isChecked()
+            }
+            
+            # Update button visibility
+            for event_name, btn in self.event_buttons.items():
+                btn.setVisible(event_name in self.enabled_events)
+    
+    def _build_customize_events_dialog(self) -> QDialog:
+        """Build the customize tracking buttons dialog (cached by show_customize_events_dialog)"""
         # Get current language to set initial text
         current_lang = self.translation_manager.get_language()
         
@@ -5253,7 +5870,6 @@ class FreeFootballAnalysisApp(QMainWindow):
             # Translate event name for checkbox
             translated_event_name = t(event_name, event_name)
             checkbox = QCheckBox(translated_event_name)
-            checkbox.setChecked(event_name in self.enabled_events)
             checkbox.setStyleSheet(f"""
                 QCheckBox {{
                     color: {color};
@@ -5325,556 +5941,109 @@ class FreeFootballAnalysisApp(QMainWindow):
         
         layout.addLayout(button_layout)
         
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Update enabled events based on checkboxes
-            self.enabled_events = {
-                event_name for event_name, checkbox in self.event_checkboxes.items()
-                if checkbox.isChecked()
-            }
-            
-            # Update button visibility
-            for event_name, btn in self.event_buttons.items():
-                btn.setVisible(event_name in self.enabled_events)
+        return dialog
     
     def show_manual_tracking_help(self):
-        """Show comprehensive help dialog for manual tracking in Thai"""
-        dialog = QDialog(self)
+        """Show comprehensive help dialog for manual tracking"""
+        dialog = self._get_manual_tracking_help_dialog()
+        # Only one language's guide is open at a time
+        for other in self._help_dialogs.values():
+            if other is not dialog:
+                other.hide()
+        # Non-modal: the app keeps running while the guide is open
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
+    
+    def _get_manual_tracking_help_dialog(self) -> QDialog:
+        """Get the help dialog for the current language, building it on first use"""
+        # Static content, so build once per language and reuse across switches
+        lang = self.translation_manager.current_language
+        dialog = self._help_dialogs.get(lang)
+        if dialog is None:
+            dialog = self._help_dialogs[lang] = self._build_manual_tracking_help_dialog()
+        return dialog
+    
+    def _build_manual_tracking_help_dialog(self) -> QDialog:
+        """Build the manual tracking help dialog (cached by _get_manual_tracking_help_dialog)"""
+        # Opened non-modally, so let it behave as a regular secondary window
+        dialog = QDialog(self, Qt.WindowType.Window)
         dialog.setWindowTitle(t("คู่มือการใช้งาน Manual Tracking", "Manual Tracking User Guide"))
-        dialog.setMinimumSize(900, 700)
+        # HELP_SECTIONS_WIDTH is derived from this size and the margins below
+        dialog.setMinimumSize(HELP_DIALOG_MIN_WIDTH, HELP_DIALOG_MIN_HEIGHT)
+        # Closing only hides the dialog so the cached instance stays usable
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, False)
         # Set window icon
         if os.path.exists(TITLE_ICON_PATH):
             dialog.setWindowIcon(QIcon(TITLE_ICON_PATH))
-        dialog.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1a1a2e, stop:1 #16213e);
-                color: #e0e0e0;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QPushButton {
-                background-color: #c41e3a;
-                color: white;
-                padding: 10px 25px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 11pt;
-            }
-            QPushButton:hover {
-                background-color: #d63347;
-            }
-            QScrollArea {
-                background-color: rgba(30, 30, 46, 0.8);
-                border: 2px solid #c41e3a;
-                border-radius: 8px;
-            }
-        """)
-        
-        layout = QVBoxLayout(dialog)
-        layout.setSpacing(15)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Title
-        title = QLabel(t("📖 คู่มือการใช้งาน Manual Tracking", "📖 Manual Tracking User Guide"))
-        title.setStyleSheet("""
-            font-weight: bold;
-            font-size: 20pt;
-            color: #FFD700;
-            padding: 10px;
-            background-color: rgba(196, 30, 58, 0.3);
-            border-radius: 8px;
-            margin-bottom: 10px;
-        """)
-        layout.addWidget(title)
-        
-        # Scroll area for content
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                background-color: rgba(30, 30, 46, 0.5);
-                border: 2px solid #c41e3a;
-                border-radius: 8px;
-            }
-            QScrollBar:vertical {
-                background-color: #2b2b2b;
-                width: 14px;
-                border-radius: 7px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #c41e3a;
-                border-radius: 7px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #d63347;
-            }
-        """)
+        dialog.setStyleSheet(HELP_DIALOG_QSS)
+        # Hold off repaints until the whole tree is built, then lay out once
+        dialog.setUpdatesEnabled(False)
         
+        # Scroll content is assembled detached from the dialog and only
+        # attached (and styled) once complete
         content_widget = QWidget()
         content_layout = QVBoxLayout(content_widget)
         content_layout.setSpacing(20)
-        content_layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Section 1: Introduction
-        intro_title_th = "🎯 ภาพรวมการใช้งาน"
-        intro_title_en = "🎯 Overview"
-        intro_title = t(intro_title_th, intro_title_en)
-        
-        intro_content_th = """
-            <p style='font-size: 11pt; line-height: 1.6;'>
-            <b>Manual Tracking</b> เป็นระบบติดตามเหตุการณ์การแข่งขันฟุตบอลแบบมืออาชีพ 
-            ใช้ในการวิเคราะห์การแข่งขันฟุตบอล
-            </p>
-            <p style='font-size: 11pt; line-height: 1.6;'>
-            <b>ขั้นตอนการใช้งาน:</b><br>
-            1. กดปุ่ม <b style='color: #2196F3;'>เพิ่มวิดีโอ</b> เพื่อโหลดวิดีโอการแข่งขัน<br>
-            2. ตั้งชื่อทีม 1 และทีม 2 (หรือใช้ชื่อเริ่มต้น)<br>
-            3. ตั้งค่ารายชื่อผู้เล่น (ถ้าต้องการ)<br>
-            4. เลือกทีมและครึ่งที่ต้องการติดตาม<br>
-            5. เล่นวิดีโอและกดปุ่มเหตุการณ์ต่างๆ เมื่อเกิดเหตุการณ์<br>
-            6. ส่งออกข้อมูลเป็น Excel หรือ CSV เมื่อเสร็จสิ้น
-            </p>
-            """
-        intro_content_en = """
-            <p style='font-size: 11pt; line-height: 1.6;'>
-            <b>Manual Tracking</b> is a professional football match event tracking system 
-            used for match analysis.
-            </p>
-            <p style='font-size: 11pt; line-height: 1.6;'>
-            <b>Usage Steps:</b><br>
-            1. Click the <b style='color: #2196F3;'>Add Video</b> button to load match video<br>
-            2. Set Team 1 and Team 2 names (or use default names)<br>
-            3. Set player list (if needed)<br>
-            4. Select team and half to track<br>
-            5. Play video and click event buttons when events occur<br>
-            6. Export data as Excel or CSV when finished
-            </p>
-            """
-        intro_content = t(intro_content_th, intro_content_en)
-        intro_section = self.create_help_section(intro_title, intro_content, "#4CAF50")
-        content_layout.addWidget(intro_section)
-        
-        # Section 2: Attacking Actions
-        attacking_title_th = "⚽ การโจมตี (Attacking Actions)"
-        attacking_title_en = "⚽ Attacking Actions"
-        attacking_title = t(attacking_title_th, attacking_title_en)
-        
-        attacking_content_th = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>ปุ่มการโจมตี:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b style='color: #FF9800;'>ยิง</b> - บันทึกการยิงประตู
-                <ul>
-                <li><b>ประตู</b> - ยิงได้ประตู</li>
-                <li><b>ยิงเข้า</b> - ยิงเข้าเป้าแต่ไม่ได้ประตู (นับเป็นสำเร็จ)</li>
-                <li><b>ยิงออก</b> - ยิงออกนอกเป้า</li>
-                <li><b>บล็อก</b> - ถูกบล็อก</li>
-                <li><b>ถูกเซฟ</b> - ถูกผู้รักษาประตูเซฟ</li>
-                </ul>
-            </li>
-            <li><b style='color: #2196F3;'>ส่งบอล</b> - บันทึกการส่งบอล
-                <ul>
-                <li><b>สำเร็จ</b> - ส่งบอลสำเร็จ</li>
-                <li><b>ไม่สำเร็จ</b> - ส่งบอลไม่สำเร็จ</li>
-                <li><b>แอสซิสต์</b> - ส่งบอลแล้วได้ประตู</li>
-                <li><b>คีย์พาส</b> - ส่งบอลที่สร้างโอกาสยิง</li>
-                </ul>
-            </li>
-            <li><b style='color: #E91E63;'>ข้ามบอล</b> - บันทึกการข้ามบอล (ผลลัพธ์เหมือนส่งบอล)</li>
-            <li><b style='color: #9C27B0;'>ผ่านบอล</b> - บันทึกการผ่านบอล (ผลลัพธ์เหมือนส่งบอล)</li>
-            <li><b style='color: #795548;'>ส่งบอลยาว</b> - บันทึกการส่งบอลยาว (ผลลัพธ์เหมือนส่งบอล)</li>
-            <li><b style='color: #607D8B;'>ส่งบอลสั้น</b> - บันทึกการส่งบอลสั้น (สำเร็จ/ไม่สำเร็จ)</li>
-            <li><b style='color: #FF5722;'>ส่งบอลในเขตโทษ</b> - บันทึกการส่งบอลในเขตโทษ (ผลลัพธ์เหมือนส่งบอล)</li>
-            </ul>
-            """
-        attacking_content_en = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>Attacking Buttons:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b style='color: #FF9800;'>Shot</b> - Record shot on goal
-                <ul>
-                <li><b>Goal</b> - Shot scored</li>
-                <li><b>On Target</b> - Shot on target but no goal (counted as successful)</li>
-                <li><b>Off Target</b> - Shot off target</li>
-                <li><b>Blocked</b> - Shot blocked</li>
-                <li><b>Saved</b> - Saved by goalkeeper</li>
-                </ul>
-            </li>
-            <li><b style='color: #2196F3;'>Pass</b> - Record pass
-                <ul>
-                <li><b>Successful</b> - Pass successful</li>
-                <li><b>Unsuccessful</b> - Pass unsuccessful</li>
-                <li><b>Assist</b> - Pass that resulted in goal</li>
-                <li><b>Key Pass</b> - Pass that created shooting opportunity</li>
-                </ul>
-            </li>
-            <li><b style='color: #E91E63;'>Cross</b> - Record cross (outcomes same as pass)</li>
-            <li><b style='color: #9C27B0;'>Through Ball</b> - Record through ball (outcomes same as pass)</li>
-            <li><b style='color: #795548;'>Long Pass</b> - Record long pass (outcomes same as pass)</li>
-            <li><b style='color: #607D8B;'>Short Pass</b> - Record short pass (successful/unsuccessful)</li>
-            <li><b style='color: #FF5722;'>Pass in Penalty Area</b> - Record pass in penalty area (outcomes same as pass)</li>
-            </ul>
-            """
-        attacking_content = t(attacking_content_th, attacking_content_en)
-        attacking_section = self.create_help_section(attacking_title, attacking_content, "#FF9800")
-        content_layout.addWidget(attacking_section)
-        
-        # Section 3: Set Pieces
-        setpieces_title_th = "🎯 ลูกตั้งเตะ (Set Pieces)"
-        setpieces_title_en = "🎯 Set Pieces"
-        setpieces_title = t(setpieces_title_th, setpieces_title_en)
-        
-        setpieces_content_th = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>ปุ่มลูกตั้งเตะ:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b style='color: #00BCD4;'>เตะมุม</b> - บันทึกการเตะมุม
-                <ul>
-                <li><b>ประตู</b> - เตะมุมแล้วได้ประตู</li>
-                <li><b>ยิงเข้า</b> - เตะมุมแล้วยิงเข้าเป้า</li>
-                <li><b>ยิงออก</b> - เตะมุมแล้วยิงออก</li>
-                <li><b>แอสซิสต์</b> - เตะมุมแล้วได้ประตู</li>
-                <li><b>คีย์พาส</b> - เตะมุมแล้วสร้างโอกาสยิง</li>
-                <li><b>เคลียร์</b> - ถูกเคลียร์ออก</li>
-                </ul>
-            </li>
-            <li><b style='color: #FFC107;'>ฟรีคิก</b> - บันทึกการเตะฟรีคิก (ผลลัพธ์เหมือนเตะมุม)</li>
-            <li><b style='color: #F44336;'>ลูกโทษ</b> - บันทึกการเตะลูกโทษ
-                <ul>
-                <li><b>ประตู</b> - เตะลูกโทษได้ประตู</li>
-                <li><b>ไม่ประตู</b> - เตะลูกโทษไม่ประตู</li>
-                <li><b>ถูกเซฟ</b> - ถูกผู้รักษาประตูเซฟ</li>
-                </ul>
-            </li>
-            <li><b style='color: #607D8B;'>ทุ่มบอล</b> - บันทึกการทุ่มบอล (สำเร็จ/ไม่สำเร็จ)</li>
-            </ul>
-            """
-        setpieces_content_en = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>Set Piece Buttons:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b style='color: #00BCD4;'>Corner Kick</b> - Record corner kick
-                <ul>
-                <li><b>Goal</b> - Corner kick resulted in goal</li>
-                <li><b>On Target</b> - Corner kick shot on target</li>
-                <li><b>Off Target</b> - Corner kick shot off target</li>
-                <li><b>Assist</b> - Corner kick resulted in goal</li>
-                <li><b>Key Pass</b> - Corner kick created shooting opportunity</li>
-                <li><b>Cleared</b> - Corner kick cleared</li>
-                </ul>
-            </li>
-            <li><b style='color: #FFC107;'>Free Kick</b> - Record free kick (outcomes same as corner kick)</li>
-            <li><b style='color: #F44336;'>Penalty</b> - Record penalty kick
-                <ul>
-                <li><b>Goal</b> - Penalty scored</li>
-                <li><b>Missed</b> - Penalty missed</li>
-                <li><b>Saved</b> - Penalty saved by goalkeeper</li>
-                </ul>
-            </li>
-            <li><b style='color: #607D8B;'>Throw In</b> - Record throw in (successful/unsuccessful)</li>
-            </ul>
-            """
-        setpieces_content = t(setpieces_content_th, setpieces_content_en)
-        setpieces_section = self.create_help_section(setpieces_title, setpieces_content, "#00BCD4")
-        content_layout.addWidget(setpieces_section)
-        
-        # Section 4: Defensive Actions
-        defensive_title_th = "🛡️ การป้องกัน (Defensive Actions)"
-        defensive_title_en = "🛡️ Defensive Actions"
-        defensive_title = t(defensive_title_th, defensive_title_en)
-        
-        defensive_content_th = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>ปุ่มการป้องกัน:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b style='color: #9C27B0;'>แย่งบอล</b> - บันทึกการแย่งบอล
-                <ul>
-                <li><b>สำเร็จ</b> - แย่งบอลสำเร็จ</li>
-                <li><b>ไม่สำเร็จ</b> - แย่งบอลไม่สำเร็จ</li>
-                <li><b>ฟาวล์</b> - แย่งบอลแล้วทำฟาวล์</li>
-                </ul>
-            </li>
-            <li><b style='color: #9C27B0;'>สกัดบอล</b> - บันทึกการสกัดบอล (สำเร็จ/ไม่สำเร็จ)</li>
-            <li><b style='color: #795548;'>เคลียร์บอล</b> - บันทึกการเคลียร์บอล
-                <ul>
-                <li><b>สำเร็จ</b> - เคลียร์บอลสำเร็จ</li>
-                <li><b>ไม่สำเร็จ</b> - เคลียร์บอลไม่สำเร็จ</li>
-                <li><b>อันตราย</b> - เคลียร์บอลแบบอันตราย</li>
-                </ul>
-            </li>
-            <li><b style='color: #FF5722;'>บล็อก</b> - บันทึกการบล็อก
-                <ul>
-                <li><b>บล็อก</b> - บล็อกสำเร็จ</li>
-                <li><b>บล็อกยิง</b> - บล็อกการยิง</li>
-                </ul>
-            </li>
-            <li><b style='color: #00BCD4;'>เซฟ</b> - บันทึกการเซฟของผู้รักษาประตู
-                <ul>
-                <li><b>เซฟ</b> - เซฟสำเร็จ</li>
-                <li><b>ไม่เซฟ</b> - ไม่เซฟได้</li>
-                <li><b>เซฟสำคัญ</b> - เซฟที่สำคัญ</li>
-                </ul>
-            </li>
-            </ul>
-            """
-        defensive_content_en = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>Defensive Buttons:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b style='color: #9C27B0;'>Tackle</b> - Record tackle
-                <ul>
-                <li><b>Successful</b> - Tackle successful</li>
-                <li><b>Unsuccessful</b> - Tackle unsuccessful</li>
-                <li><b>Foul</b> - Tackle resulted in foul</li>
-                </ul>
-            </li>
-            <li><b style='color: #9C27B0;'>Interception</b> - Record interception (successful/unsuccessful)</li>
-            <li><b style='color: #795548;'>Clearance</b> - Record clearance
-                <ul>
-                <li><b>Successful</b> - Clearance successful</li>
-                <li><b>Unsuccessful</b> - Clearance unsuccessful</li>
-                <li><b>Dangerous</b> - Dangerous clearance</li>
-                </ul>
-            </li>
-            <li><b style='color: #FF5722;'>Block</b> - Record block
-                <ul>
-                <li><b>Block</b> - Block successful</li>
-                <li><b>Shot Block</b> - Block shot</li>
-                </ul>
-            </li>
-            <li><b style='color: #00BCD4;'>Save</b> - Record goalkeeper save
-                <ul>
-                <li><b>Save</b> - Save successful</li>
-                <li><b>No Save</b> - Could not save</li>
-                <li><b>Important Save</b> - Important save</li>
-                </ul>
-            </li>
-            </ul>
-            """
-        defensive_content = t(defensive_content_th, defensive_content_en)
-        defensive_section = self.create_help_section(defensive_title, defensive_content, "#9C27B0")
-        content_layout.addWidget(defensive_section)
-        
-        # Section 5: Disciplinary
-        disciplinary_title_th = "⚖️ การทำผิดกติกา (Disciplinary)"
-        disciplinary_title_en = "⚖️ Disciplinary"
-        disciplinary_title = t(disciplinary_title_th, disciplinary_title_en)
-        
-        disciplinary_content_th = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>ปุ่มการทำผิดกติกา:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b style='color: #F44336;'>ฟาวล์</b> - บันทึกการทำฟาวล์
-                <ul>
-                <li><b>ฟาวล์</b> - ฟาวล์ธรรมดา</li>
-                <li><b>ใบเหลือง</b> - ฟาวล์แล้วได้ใบเหลือง</li>
-                <li><b>ใบแดง</b> - ฟาวล์แล้วได้ใบแดง</li>
-                </ul>
-            </li>
-            <li><b style='color: #FFEB3B;'>ใบเหลือง</b> - บันทึกการได้ใบเหลือง</li>
-            <li><b style='color: #E91E63;'>ใบแดง</b> - บันทึกการได้ใบแดง</li>
-            </ul>
-            """
-        disciplinary_content_en = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>Disciplinary Buttons:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b style='color: #F44336;'>Foul</b> - Record foul
-                <ul>
-                <li><b>Foul</b> - Regular foul</li>
-                <li><b>Yellow Card</b> - Foul resulted in yellow card</li>
-                <li><b>Red Card</b> - Foul resulted in red card</li>
-                </ul>
-            </li>
-            <li><b style='color: #FFEB3B;'>Yellow Card</b> - Record yellow card</li>
-            <li><b style='color: #E91E63;'>Red Card</b> - Record red card</li>
-            </ul>
-            """
-        disciplinary_content = t(disciplinary_content_th, disciplinary_content_en)
-        disciplinary_section = self.create_help_section(disciplinary_title, disciplinary_content, "#F44336")
-        content_layout.addWidget(disciplinary_section)
-        
-        # Section 6: Other Events
-        other_title_th = "📋 เหตุการณ์อื่นๆ (Other Events)"
-        other_title_en = "📋 Other Events"
-        other_title = t(other_title_th, other_title_en)
-        
-        other_content_th = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>ปุ่มเหตุการณ์อื่นๆ:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b style='color: #9E9E9E;'>ออฟไซด์</b> - บันทึกการออฟไซด์</li>
-            <li><b style='color: #607D8B;'>บอลออก</b> - บันทึกการที่บอลออกนอกสนาม</li>
-            <li><b style='color: #795548;'>เปลี่ยนตัว</b> - บันทึกการเปลี่ยนตัวผู้เล่น
-                <ul>
-                <li><b>เปลี่ยนตัวเข้า</b> - ผู้เล่นเข้า</li>
-                <li><b>เปลี่ยนตัวออก</b> - ผู้เล่นออก</li>
-                </ul>
-            </li>
-            <li><b style='color: #FF9800;'>บาดเจ็บ</b> - บันทึกการบาดเจ็บ</li>
-            <li><b style='color: #F44336;'>เสียบอล</b> - บันทึกการเสียบอล</li>
-            <li><b style='color: #4CAF50;'>ครองบอล</b> - บันทึกการครองบอล</li>
-            </ul>
-            """
-        other_content_en = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>Other Event Buttons:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b style='color: #9E9E9E;'>Offside</b> - Record offside</li>
-            <li><b style='color: #607D8B;'>Ball Out</b> - Record ball out of play</li>
-            <li><b style='color: #795548;'>Substitution</b> - Record player substitution
-                <ul>
-                <li><b>Sub In</b> - Player coming in</li>
-                <li><b>Sub Out</b> - Player going out</li>
-                </ul>
-            </li>
-            <li><b style='color: #FF9800;'>Injury</b> - Record injury</li>
-            <li><b style='color: #F44336;'>Lost Ball</b> - Record lost ball</li>
-            <li><b style='color: #4CAF50;'>Possession</b> - Record ball possession</li>
-            </ul>
-            """
-        other_content = t(other_content_th, other_content_en)
-        other_section = self.create_help_section(other_title, other_content, "#607D8B")
-        content_layout.addWidget(other_section)
-        
-        # Section 7: Tips and Best Practices
-        tips_title_th = "💡 เคล็ดลับและแนวทางปฏิบัติ"
-        tips_title_en = "💡 Tips and Best Practices"
-        tips_title = t(tips_title_th, tips_title_en)
-        
-        tips_content_th = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>เคล็ดลับการใช้งาน:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b>การบันทึกเวลา:</b> วิดีโอจะหยุดอัตโนมัติเมื่อกดปุ่มเหตุการณ์ เพื่อให้บันทึกเวลาที่แม่นยำ</li>
-            <li><b>การตั้งชื่อทีม:</b> สามารถเปลี่ยนชื่อทีมได้ตลอดเวลา และจะอัพเดทในรายการเหตุการณ์ทันที</li>
-            <li><b>การตั้งค่ารายชื่อ:</b> ตั้งค่ารายชื่อผู้เล่นเพื่อให้สามารถบันทึกชื่อผู้เล่นได้เมื่อเกิดประตู</li>
-            <li><b>การลบเหตุการณ์:</b> คลิกที่เหตุการณ์ในตารางแล้วกด "ลบที่เลือก" หรือดับเบิลคลิกเพื่อไปยังเวลานั้น</li>
-            <li><b>การปรับแต่งปุ่ม:</b> ใช้ปุ่ม "ปรับแต่งปุ่ม" เพื่อเลือกปุ่มที่ต้องการแสดง</li>
-            <li><b>การส่งออก:</b> ส่งออกเป็น Excel เพื่อดูสถิติแบบละเอียด หรือ CSV สำหรับการวิเคราะห์ต่อ</li>
-            <li><b>การบันทึกประตู:</b> เมื่อเลือกผลลัพธ์ "ประตู" จะมีหน้าต่างให้กรอกชื่อผู้ยิงและรายละเอียดเพิ่มเติม</li>
-            </ul>
-            """
-        tips_content_en = """
-            <p style='font-size: 11pt; line-height: 1.6;'><b>Usage Tips:</b></p>
-            <ul style='font-size: 10pt; line-height: 1.8;'>
-            <li><b>Time Recording:</b> Video will automatically pause when clicking event buttons to ensure accurate time recording</li>
-            <li><b>Team Naming:</b> You can change team names at any time, and it will update in the event list immediately</li>
-            <li><b>Player List Setup:</b> Set up player list to record player names when goals occur</li>
-            <li><b>Deleting Events:</b> Click on event in table then click "Delete Selected" or double-click to go to that time</li>
-            <li><b>Button Customization:</b> Use "Customize Buttons" button to select which buttons to display</li>
-            <li><b>Exporting:</b> Export as Excel to view detailed statistics, or CSV for further analysis</li>
-            <li><b>Goal Recording:</b> When selecting "Goal" outcome, a window will appear to enter scorer name and additional details</li>
-            </ul>
-            """
-        tips_content = t(tips_content_th, tips_content_en)
-        tips_section = self.create_help_section(tips_title, tips_content, "#FFD700")
-        content_layout.addWidget(tips_section)
+        content_layout.setContentsMargins(HELP_DIALOG_MARGIN, HELP_DIALOG_MARGIN, HELP_DIALOG_MARGIN, HELP_DIALOG_MARGIN)
+        
+        # Help sections (static HTML lives in MANUAL_HELP_SECTIONS), laid out
+        # as one document instead of a rich-text label pair per section
+        sections_html = "".join(
+            self.create_help_section(t(title_th, title_en), t(content_th, content_en), color)
+            for title_th, title_en, content_th, content_en, color in MANUAL_HELP_SECTIONS
+        )
+        sections_browser = QTextBrowser()
+        sections_browser.setOpenExternalLinks(True)
+        sections_browser.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Scrolls sideways only if the dialog ever ends up narrower than the wrap width
+        sections_browser.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        sections_browser.setLineWrapMode(QTextEdit.LineWrapMode.FixedPixelWidth)
+        sections_browser.setLineWrapColumnOrWidth(HELP_SECTIONS_WIDTH)
+        sections_browser.setObjectName("helpSections")
+        # Parse the HTML once into a detached document, then hand it over so
+        # the browser lays it out a single time at its real width
+        sections_document = QTextDocument(sections_browser)
+        sections_document.setHtml(sections_html)
+        sections_browser.setDocument(sections_document)
+        # The outer scroll area does the scrolling - grow to fit the document
+        sections_document.documentLayout().documentSizeChanged.connect(
+            lambda size: sections_browser.setFixedHeight(int(size.height()) + 2 * sections_browser.frameWidth())
+        )
+        content_layout.addWidget(sections_browser)
         
         # Credits section
-        credits_section = QWidget()
-        credits_section.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(196, 30, 58, 0.4), stop:1 rgba(33, 150, 243, 0.4));
-                border: 2px solid #c41e3a;
-                border-radius: 10px;
-                padding: 20px;
-            }
-        """)
+        credits_section = QFrame()
+        credits_section.setObjectName("creditsCard")
         credits_layout = QVBoxLayout(credits_section)
-        credits_layout.setSpacing(15)
-        credits_layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Title with better styling
-        about_title = QLabel(t("👨‍💻 ผู้พัฒนา", "👨‍💻 Developer"))
-        about_title.setStyleSheet("""
-            font-weight: bold;
-            font-size: 18pt;
-            color: #FFD700;
-            padding: 10px 0px;
-            background-color: rgba(255, 215, 0, 0.1);
-            border-radius: 5px;
-            border-left: 4px solid #FFD700;
-            padding-left: 10px;
-        """)
-        credits_layout.addWidget(about_title)
+        credits_layout.setContentsMargins(30, 20, 30, 20)
         
-        # Developer info with better spacing
-        developer_name_th = "นายพัชระ อัลอุมารี"
-        developer_name_en = "Mr.Patchara Al-umaree"
-        developer_name_text = t(developer_name_th, developer_name_en)
-        developer_name = QLabel(developer_name_text)
-        developer_name.setStyleSheet("""
-            font-size: 15pt;
-            color: #FFFFFF;
-            font-weight: bold;
-            padding: 10px 0px;
-            background-color: rgba(255, 255, 255, 0.05);
-            border-radius: 5px;
-            padding-left: 10px;
-        """)
-        credits_layout.addWidget(developer_name)
+        credits_body = QLabel(t(CREDITS_HTML_TH, CREDITS_HTML_EN))
+        credits_body.setTextFormat(Qt.TextFormat.RichText)
+        credits_body.setWordWrap(True)
+        credits_layout.addWidget(credits_body)
         
-        # Info container for better organization
-        info_container = QWidget()
-        info_container.setStyleSheet("""
-            QWidget {
-                background-color: rgba(30, 30, 46, 0.5);
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
-        info_layout = QVBoxLayout(info_container)
-        info_layout.setSpacing(8)
-        info_layout.setContentsMargins(15, 15, 15, 15)
-        
-        # Location
-        location_text_th = "📍 <b>ที่อยู่:</b> กรุงเทพมหานคร, ประเทศไทย"
-        location_text_en = "📍 <b>Location:</b> Bangkok, Thailand"
-        location_text = t(location_text_th, location_text_en)
-        location_label = QLabel(location_text)
-        location_label.setStyleSheet("""
-            font-size: 11pt;
-            color: #e0e0e0;
-            padding: 8px;
-            background-color: rgba(255, 255, 255, 0.03);
-            border-radius: 5px;
-        """)
-        location_label.setTextFormat(Qt.TextFormat.RichText)
-        info_layout.addWidget(location_label)
-        
-        # Email
-        email_text_th = '<a href="mailto:Patcharaalumaree@gmail.com" style="color: #2196F3; text-decoration: none;"><b>📧 อีเมล:</b> Patcharaalumaree@gmail.com</a>'
-        email_text_en = '<a href="mailto:Patcharaalumaree@gmail.com" style="color: #2196F3; text-decoration: none;"><b>📧 Email:</b> Patcharaalumaree@gmail.com</a>'
-        email_text = t(email_text_th, email_text_en)
-        email_label = QLabel(email_text)
-        email_label.setOpenExternalLinks(True)
-        email_label.setTextFormat(Qt.TextFormat.RichText)
-        email_label.setStyleSheet("""
-            font-size: 11pt;
-            color: #2196F3;
-            padding: 8px;
-            background-color: rgba(33, 150, 243, 0.1);
-            border-radius: 5px;
-        """)
-        info_layout.addWidget(email_label)
-        
-        # GitHub link
-        github_text_th = '<a href="https://github.com/MrPatchara" style="color: #2196F3; text-decoration: none; font-weight: bold;">🔗 <b>โปรไฟล์ GitHub</b></a>'
-        github_text_en = '<a href="https://github.com/MrPatchara" style="color: #2196F3; text-decoration: none; font-weight: bold;">🔗 <b>GitHub Profile</b></a>'
-        github_text = t(github_text_th, github_text_en)
-        github_link = QLabel(github_text)
-        github_link.setOpenExternalLinks(True)
-        github_link.setTextFormat(Qt.TextFormat.RichText)
-        github_link.setStyleSheet("""
-            font-size: 12pt;
-            color: #2196F3;
-            padding: 10px;
-            background-color: rgba(33, 150, 243, 0.15);
-            border: 1px solid rgba(33, 150, 243, 0.3);
-            border-radius: 5px;
-        """)
-        info_layout.addWidget(github_link)
-        
-        credits_layout.addWidget(info_container)
+        # Contact links open through QDesktopServices instead of rich-text anchors
+        email_btn = QPushButton(t("📧 อีเมล: Patcharaalumaree@gmail.com", "📧 Email: Patcharaalumaree@gmail.com"))
+        github_btn = QPushButton(t("🔗 โปรไฟล์ GitHub", "🔗 GitHub Profile"))
+        for link_btn, url in ((email_btn, CREDITS_EMAIL_URL), (github_btn, CREDITS_GITHUB_URL)):
+            link_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            link_btn.clicked.connect(partial(QDesktopServices.openUrl, QUrl(url)))
+            credits_layout.addWidget(link_btn)
         
         content_layout.addWidget(credits_section)
         
         content_layout.addStretch()
+        
+        # Title
+        title = QLabel(t("📖 คู่มือการใช้งาน Manual Tracking", "📖 Manual Tracking User Guide"))
+        title.setObjectName("helpTitle")
+        
+        # Scroll area for content
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setObjectName("helpScroll")
         scroll.setWidget(content_widget)
-        layout.addWidget(scroll)
         
         # Close button
         close_btn_text_th = "ปิด"
@@ -5882,45 +6051,23 @@ class FreeFootballAnalysisApp(QMainWindow):
         close_btn_text = t(close_btn_text_th, close_btn_text_en)
         close_btn = QPushButton(close_btn_text)
         close_btn.clicked.connect(dialog.accept)
+        
+        layout = QVBoxLayout(dialog)
+        layout.setSpacing(15)
+        layout.setContentsMargins(HELP_DIALOG_MARGIN, HELP_DIALOG_MARGIN, HELP_DIALOG_MARGIN, HELP_DIALOG_MARGIN)
+        layout.addWidget(title)
+        layout.addWidget(scroll)
         layout.addWidget(close_btn)
         
-        dialog.exec()
+        dialog.setUpdatesEnabled(True)
+        return dialog
     
-    def create_help_section(self, title: str, content: str, color: str) -> QWidget:
-        """Create a styled help section"""
-        section = QWidget()
-        section.setStyleSheet(f"""
-            QWidget {{
-                background-color: rgba(30, 30, 46, 0.6);
-                border-left: 4px solid {color};
-                border-radius: 5px;
-                padding: 10px;
-            }}
-        """)
-        
-        layout = QVBoxLayout(section)
-        layout.setSpacing(10)
-        layout.setContentsMargins(15, 15, 15, 15)
-        
-        title_label = QLabel(title)
-        title_label.setStyleSheet(f"""
-            font-weight: bold;
-            font-size: 14pt;
-            color: {color};
-            padding-bottom: 5px;
-        """)
-        layout.addWidget(title_label)
-        
-        content_label = QLabel(content)
-        content_label.setWordWrap(True)
-        content_label.setStyleSheet("""
-            font-size: 10pt;
-            color: #e0e0e0;
-            line-height: 1.6;
-        """)
-        layout.addWidget(content_label)
-        
-        return section
+    def create_help_section(self, title: str, content: str, color: str) -> str:
+        """Create the HTML for a styled help section"""
+        template = HELP_SECTION_HTML_BY_COLOR.get(color)
+        if template is None:
+            template = HELP_SECTION_HTML.replace("{color}", color)
+        return template.format(title=title, content=content)
 
 
 def main():
@@ -2,14 +2,28 @@
 Manual Tracking Module - Dartfish-like tracking system
 """
 import csv
+import os
+import sys
 from datetime import datetime
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, FrozenSet
+from dataclasses import dataclass, fields
+from collections import Counter, defaultdict
+from operator import attrgetter
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from heapq import merge
 try:
+    import numpy as np
     import pandas as pd
     PANDAS_AVAILABLE = True
 except ImportError:
     PANDAS_AVAILABLE = False
+try:
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.utils import get_column_letter
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
 
 # Import translation system
 try:
@@ -20,6 +34,146 @@ except ImportError:
     def t(text, default=None):
         return default if default else text
 
+# Outcomes that count as successful for each event type (see _get_success_outcomes)
+SUCCESS_OUTCOMES: Dict[str, FrozenSet[str]] = {
+    # Attacking Actions
+    "ส่งบอล": frozenset({"สำเร็จ", "แอสซิสต์", "คีย์พาส"}),
+    # "แอสซิสต์" = ส่งแล้วได้ประตู, "คีย์พาส" = ส่งแล้วมีโอกาสยิง
+    
+    "ข้ามบอล": frozenset({"สำเร็จ", "แอสซิสต์", "คีย์พาส"}),
+    "ผ่านบอล": frozenset({"สำเร็จ", "แอสซิสต์", "คีย์พาส"}),
+    "ส่งบอลยาว": frozenset({"สำเร็จ", "แอสซิสต์", "คีย์พาส"}),
+    "ส่งบอลสั้น": frozenset({"สำเร็จ"}),
+    "ส่งบอลในเขตโทษ": frozenset({"สำเร็จ", "แอสซิสต์", "คีย์พาส"}),
+    
+    "ยิง": frozenset({"ประตู", "ยิงเข้า"}),
+    # "ประตู" = ได้ประตู, "ยิงเข้า" = ยิงเข้าเป้าแต่ไม่ได้ประตู (นับเป็นสำเร็จ)
+    # "ยิงออก", "บล็อก", "ถูกเซฟ" = ไม่สำเร็จ
+    
+    # Set Pieces
+    "เตะมุม": frozenset({"ประตู", "ยิงเข้า", "แอสซิสต์", "คีย์พาส"}),
+    "ฟรีคิก": frozenset({"ประตู", "ยิงเข้า", "แอสซิสต์", "คีย์พาส"}),
+    "ลูกโทษ": frozenset({"ประตู"}),
+    # "ไม่ประตู", "ถูกเซฟ" = ไม่สำเร็จ
+    
+    "ทุ่มบอล": frozenset({"สำเร็จ"}),
+    
+    # Defensive Actions
+    "แย่งบอล": frozenset({"สำเร็จ"}),
+    "สกัดบอล": frozenset({"สำเร็จ"}),
+    "เคลียร์บอล": frozenset({"สำเร็จ"}),
+    "บล็อก": frozenset({"บล็อก", "บล็อกยิง"}),
+    "เซฟ": frozenset({"เซฟ", "เซฟสำคัญ"}),
+    
+    # Disciplinary (ไม่มีสำเร็จ/ไม่สำเร็จ - เป็นเหตุการณ์)
+    # หมายเหตุ: 
+    # - "ฟาวล์" = ฟาวล์ธรรมดา (outcome: "ฟาวล์" หรือ None)
+    #   ถ้า outcome เป็น "ใบเหลือง" หรือ "ใบแดง" จะถูกนับเป็นใบเหลือง/ใบแดง แทน
+    # - "ใบเหลือง" = ใบเหลือง (อาจมาจาก action "ใบเหลือง" หรือ action "ฟาวล์" ที่ outcome เป็น "ใบเหลือง")
+    # - "ใบแดง" = ใบแดง (อาจมาจาก action "ใบแดง" หรือ action "ฟาวล์" ที่ outcome เป็น "ใบแดง")
+    "ฟาวล์": frozenset(),
+    "ใบเหลือง": frozenset({"ใบเหลือง"}),
+    "ใบแดง": frozenset({"ใบแดง"}),
+    
+    # Other Events
+    "ออฟไซด์": frozenset(),
+    "บอลออก": frozenset(),
+    "เปลี่ยนตัว": frozenset({"เปลี่ยนตัวเข้า", "เปลี่ยนตัวออก"}),
+    "บาดเจ็บ": frozenset(),
+    "เสียบอล": frozenset(),
+    "ครองบอล": frozenset({"ครองบอล"}),
+}
+
+# Outcome substrings that mark an attempt as unsuccessful
+UNSUCCESSFUL_KEYWORDS = ("ไม่สำเร็จ", "ยิงออก", "ถูกเซฟ", "ไม่ประตู", "ไม่เซฟ", "เสียบอล")
+# Actions where a "บล็อก" outcome means the attempt was blocked
+BLOCKABLE_EVENTS = frozenset({"ยิง", "เตะมุม", "ฟรีคิก"})
+
+# Event groups used by the set pieces and statistics sheets
+SET_PIECE_TYPES = frozenset({"เตะมุม", "ฟรีคิก", "ลูกโทษ"})
+PASS_TYPES = frozenset({"ส่งบอล", "ข้ามบอล", "ผ่านบอล", "ส่งบอลยาว", "ส่งบอลสั้น", "ส่งบอลในเขตโทษ"})
+DEFENSIVE_TYPES = frozenset({"แย่งบอล", "สกัดบอล", "เคลียร์บอล", "บล็อก", "เซฟ"})
+ATTACKING_TYPES = frozenset({"ยิง", "ส่งบอล", "ข้ามบอล", "ผ่านบอล", "ส่งบอลยาว", "ส่งบอลในเขตโทษ", "เตะมุม", "ฟรีคิก"})
+SHOT_ON_TARGET_OUTCOMES = frozenset({"ประตู", "ยิงเข้า"})
+PASS_SUCCESS_OUTCOMES = frozenset({"สำเร็จ", "แอสซิสต์", "คีย์พาส"})
+
+# Team value stored on events not attributed to either side. Interned, like the
+# team names on new events, so comparisons hit CPython's identity fast path.
+NEUTRAL_TEAM = sys.intern("กลาง")
+
+# Write buffer for export files (fewer syscalls than the 8 KiB default)
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Sort key for events in time order (C-level, no lambda frame per item)
+BY_TIMESTAMP = attrgetter('timestamp')
+
+# Display name of each half as (Thai, English) source text for _t()
+HALF_NAMES = {
+    1: ("ครึ่งแรก", "First Half"),
+    2: ("ครึ่งหลัง", "Second Half"),
+    3: ("ต่อเวลาครึ่งแรก", "Extra Time First Half"),
+    4: ("ต่อเวลาครึ่งหลัง", "Extra Time Second Half"),
+}
+
+# Sheet styles shared by every _apply_sheet_styling call; openpyxl keeps one
+# copy of each distinct style per workbook, so the same objects can be reused
+if OPENPYXL_AVAILABLE:
+    HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+    CELL_BORDER = Border(
+        left=Side(style='thin', color='CCCCCC'),
+        right=Side(style='thin', color='CCCCCC'),
+        top=Side(style='thin', color='CCCCCC'),
+        bottom=Side(style='thin', color='CCCCCC')
+    )
+    CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
+    LEFT_ALIGN = Alignment(horizontal='left', vertical='center')
+    LIGHT_ROW_FILL = PatternFill(start_color="F8F9FA", end_color="F8F9FA", fill_type="solid")
+    WHITE_ROW_FILL = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")
+    # Statistics sheet styles
+    BOLD_FONT = Font(bold=True)
+    STATS_TITLE_FONT = Font(bold=True, size=14)
+    STATS_SECTION_FONT = Font(bold=True, size=12)
+    STATS_SECTION_FILL = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+    STATS_SUMMARY_FILL = PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid")
+    STATS_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+
+@lru_cache(maxsize=None)
+def is_unsuccessful_outcome(event_type: str, outcome: str) -> bool:
+    """
+    Check if outcome is unsuccessful for specific event type (memoized per pair)
+    
+    Unsuccessful outcomes:
+    - "ไม่สำเร็จ" = การกระทำไม่สำเร็จ
+    - "ยิงออก" = ยิงออกนอกเป้า (Shot off Target)
+    - "ถูกเซฟ" = ถูกผู้รักษาประตูเซฟ
+    - "ไม่ประตู" = ไม่ได้ประตู (เช่น ลูกโทษ)
+    - "ไม่เซฟ" = ไม่เซฟได้
+    - "เสียบอล" = เสียบอล
+    - "บล็อก" = ถูกบล็อก (เฉพาะในกรณี action "ยิง" เท่านั้น)
+    """
+    # สำหรับ action "บล็อก" ไม่มี unsuccessful (บล็อกสำเร็จ = "บล็อก" หรือ "บล็อกยิง")
+    if event_type == "บล็อก":
+        return False
+    
+    # "บล็อก" = ถูกบล็อก (เฉพาะในกรณี action "ยิง", "เตะมุม", "ฟรีคิก")
+    if outcome == "บล็อก" and event_type in BLOCKABLE_EVENTS:
+        return True
+    
+    return any(keyword in outcome for keyword in UNSUCCESSFUL_KEYWORDS)
+
+def format_match_times(events) -> List[str]:
+    """Format event timestamps as MM:SS strings in one vectorized pass"""
+    # Truncate to whole seconds once, then split into minutes/seconds in NumPy
+    seconds = np.array([e.timestamp for e in events], dtype=np.float64).astype(np.int64)
+    minutes, seconds = np.divmod(seconds, 60)
+    return [f"{m:02d}:{s:02d}" for m, s in zip(minutes.tolist(), seconds.tolist())]
+
 @dataclass
 class TrackingEvent:
     """Data class for tracking events"""
@@ -35,7 +189,19 @@ class TrackingEvent:
     y_position: Optional[float] = None
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Fields are all primitives, so a literal dict avoids asdict()'s recursive copy
+        return {
+            'timestamp': self.timestamp,
+            'event_type': self.event_type,
+            'team': self.team,
+            'outcome': self.outcome,
+            'player_number': self.player_number,
+            'player_name': self.player_name,
+            'description': self.description,
+            'half': self.half,
+            'x_position': self.x_position,
+            'y_position': self.y_position,
+        }
 
 class ManualTrackingData:
     """Manages manual tracking data"""
@@ -47,71 +213,135 @@ class ManualTrackingData:
         self.team_b_name: str = "Team B"
         self.team_a_players: List[str] = []  # รายชื่อนักเตะทีม 1
         self.team_b_players: List[str] = []  # รายชื่อนักเตะทีม 2
+        # Lookup indices over self.events, rebuilt lazily after add/remove/clear
+        self._indices_dirty = True
+        self._events_by_type: Dict[str, List[TrackingEvent]] = {}
+        self._events_by_team: Dict[str, List[TrackingEvent]] = {}
+        self._events_by_half: Dict[int, List[TrackingEvent]] = {}
+        self._goals: List[TrackingEvent] = []
+        self._lang: Optional[str] = None  # Language pinned while an export runs
+        self._half_names: Optional[Dict[int, str]] = None  # Translated HALF_NAMES for that language
     
     def _t(self, text: str, default: Optional[str] = None) -> str:
         """Get translated text based on current language"""
-        if TRANSLATIONS_AVAILABLE:
-            translation_manager = get_translation_manager()
-            # Use translate method directly to ensure correct language
-            return translation_manager.translate(text, default or text)
-        return default or text
+        # t() is memoized per language, so the export's repeated lookups are dict hits
+        return t(text, default or text)
     
     def _get_current_language(self) -> str:
-        """Get current language setting"""
+        """Get current language setting (fixed for the duration of an export)"""
+        if self._lang:
+            return self._lang
         if TRANSLATIONS_AVAILABLE:
             translation_manager = get_translation_manager()
             return translation_manager.get_language()
         return "TH"  # Default to Thai
     
-    def _get_th_text(self, th_text: str, en_text: str) -> str:
-        """Get Thai text if current language is TH, otherwise English"""
-        current_lang = self._get_current_language()
-        return th_text if current_lang == "TH" else en_text
-    
-    def _get_current_language(self) -> str:
-        """Get current language setting"""
-        if TRANSLATIONS_AVAILABLE:
-            translation_manager = get_translation_manager()
-            return translation_manager.get_language()
-        return "TH"  # Default to Thai
+    def _get_half_names(self) -> Dict[int, str]:
+        """Get translated half names (built once per export)"""
+        half_names = self._half_names
+        if half_names is None:
+            half_names = {half: self._t(th, en) for half, (th, en) in HALF_NAMES.items()}
+            if self._lang:
+                self._half_names = half_names
+        return half_names
     
     def _get_th_text(self, th_text: str, en_text: str) -> str:
         """Get Thai text if current language is TH, otherwise English"""
-        current_lang = self._get_current_language()
-        return th_text if current_lang == "TH" else en_text
+        return th_text if self._get_current_language() == "TH" else en_text
     
     def add_event(self, event: TrackingEvent):
         """Add a tracking event"""
-        self.events.append(event)
-        # Sort by timestamp
-        self.events.sort(key=lambda x: x.timestamp)
+        # Events stay sorted by timestamp, so insert in place instead of re-sorting
+        self.events.insert(self.insert_position(event.timestamp), event)
+        self._indices_dirty = True
+    
+    def insert_position(self, timestamp: float) -> int:
+        """Get the index add_event() will place an event with this timestamp at"""
+        # Binary search over the sorted events; equal timestamps keep insertion order
+        low, high = 0, len(self.events)
+        while low < high:
+            mid = (low + high) // 2
+            if timestamp < self.events[mid].timestamp:
+                high = mid
+            else:
+                low = mid + 1
+        return low
     
     def remove_event(self, index: int):
         """Remove event by index"""
         if 0 <= index < len(self.events):
             self.events.pop(index)
+            self._indices_dirty = True
+    
+    def clear_events(self):
+        """Remove all events"""
+        self.events.clear()
+        self._indices_dirty = True
+    
+    def _rebuild_indices(self):
+        """Index events by type, team and half in a single pass"""
+        by_type = defaultdict(list)
+        by_team = defaultdict(list)
+        by_half = defaultdict(list)
+        goals = []
+        for e in self.events:
+            by_type[e.event_type].append(e)
+            by_team[e.team].append(e)
+            by_half[e.half].append(e)
+            if e.outcome == "ประตู":
+                goals.append(e)
+        self._events_by_type = dict(by_type)
+        self._events_by_team = dict(by_team)
+        self._events_by_half = dict(by_half)
+        self._goals = goals
+        self._indices_dirty = False
     
     def get_events_by_type(self, event_type: str) -> List[TrackingEvent]:
         """Get all events of a specific type"""
-        return [e for e in self.events if e.event_type == event_type]
+        if self._indices_dirty:
+            self._rebuild_indices()
+        return list(self._events_by_type.get(event_type, ()))
     
     def get_events_by_team(self, team: str) -> List[TrackingEvent]:
         """Get all events for a specific team"""
-        return [e for e in self.events if e.team == team]
+        if self._indices_dirty:
+            self._rebuild_indices()
+        return list(self._events_by_team.get(team, ()))
+    
+    def get_events_by_half(self, half: int) -> List[TrackingEvent]:
+        """Get all events in a specific half"""
+        if self._indices_dirty:
+            self._rebuild_indices()
+        return list(self._events_by_half.get(half, ()))
+    
+    def get_goals(self) -> List[TrackingEvent]:
+        """Get all events whose outcome is a goal, from any action"""
+        if self._indices_dirty:
+            self._rebuild_indices()
+        return list(self._goals)
+    
+    def get_teams(self) -> List[str]:
+        """Get the sorted names of all named, non-neutral teams that have events"""
+        return sorted({e.team for e in self.events if e.team and e.team != NEUTRAL_TEAM})
     
     def export_to_csv(self, filepath: str):
         """Export tracking data to CSV (legacy method)"""
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             if not self.events:
                 return
             
-            writer = csv.DictWriter(f, fieldnames=self.events[0].to_dict().keys())
-            writer.writeheader()
-            for event in self.events:
-                writer.writerow(event.to_dict())
+            # Write rows as attribute tuples in one batch (same columns as to_dict())
+            columns = [field.name for field in fields(TrackingEvent)]
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(map(attrgetter(*columns), self.events))
     
-    def export_to_excel(self, filepath: str):
-        """Export tracking data to Excel with multiple sheets"""
+    def export_to_excel(self, filepath: str, segment_size: Optional[int] = None):
+        """Export tracking data to Excel with multiple sheets
+        
+        With segment_size set and more events than that, the events are split into
+        consecutive chunks written to <name>_001.xlsx, <name>_002.xlsx, ...
+        """
         if not PANDAS_AVAILABLE:
             # Fallback to CSV if pandas not available
             self.export_to_csv(filepath.replace('.xlsx', '.csv'))
@@ -120,7 +350,34 @@ class ManualTrackingData:
         if not self.events:
             return
         
-        # Get current language to ensure consistent translation
+        if segment_size and len(self.events) > segment_size:
+            stem, ext = os.path.splitext(filepath)
+            for i, start in enumerate(range(0, len(self.events), segment_size), 1):
+                self._segment(self.events[start:start + segment_size]).export_to_excel(f"{stem}_{i:03d}{ext or '.xlsx'}")
+            return
+        
+        # Resolve the language once so every sheet uses the same one
+        self._lang = self._get_current_language()
+        try:
+            self._write_excel(filepath)
+        finally:
+            self._lang = None
+            self._half_names = None
+    
+    def _segment(self, events: List[TrackingEvent]) -> "ManualTrackingData":
+        """Copy of this match's metadata holding only the given events"""
+        part = ManualTrackingData()
+        part.events = list(events)
+        part.video_path = self.video_path
+        part.match_name = self.match_name
+        part.team_a_name = self.team_a_name
+        part.team_b_name = self.team_b_name
+        part.team_a_players = self.team_a_players
+        part.team_b_players = self.team_b_players
+        return part
+    
+    def _write_excel(self, filepath: str):
+        """Write all export sheets to an Excel workbook"""
         current_lang = self._get_current_language()
         
         # Define column names based on language
@@ -138,13 +395,6 @@ class ManualTrackingData:
             description_col = "Description"
             x_pos_col = "X Position"
             y_pos_col = "Y Position"
-            
-            half_mapping = {
-                1: "First Half",
-                2: "Second Half",
-                3: "Extra Time First Half",
-                4: "Extra Time Second Half"
-            }
             neutral_text = "Neutral"
         else:  # TH
             time_col = "เวลา"
@@ -160,64 +410,33 @@ class ManualTrackingData:
             description_col = "คำอธิบาย"
             x_pos_col = "ตำแหน่ง X"
             y_pos_col = "ตำแหน่ง Y"
-            
-            half_mapping = {
-                1: "ครึ่งแรก",
-                2: "ครึ่งหลัง",
-                3: "ต่อเวลาครึ่งแรก",
-                4: "ต่อเวลาครึ่งหลัง"
-            }
-            neutral_text = "กลาง"
-        
-        # Prepare data
-        data = []
-        for event in self.events:
-            event_dict = event.to_dict()
-            # Format timestamp
-            minutes = int(event.timestamp // 60)
-            seconds = int(event.timestamp % 60)
-            event_dict[time_col] = f"{minutes:02d}:{seconds:02d}"
-            event_dict[time_sec_col] = event.timestamp
-            # Map half to text
-            event_dict[half_col] = half_mapping.get(event.half, f"{half_col} {event.half}")
-            # Ensure player_name is included
-            if 'player_name' not in event_dict:
-                event_dict['player_name'] = None
-            data.append(event_dict)
-        
-        # Sheet 1: Raw Data - Translate event_type and outcome values
-        for item in data:
-            if 'event_type' in item and item['event_type']:
-                item['event_type'] = self._t(item['event_type'], item['event_type'])
-            if 'outcome' in item and item['outcome']:
-                item['outcome'] = self._t(item['outcome'], item['outcome'])
-            if 'team' in item and item['team']:
-                # Translate "กลาง" to "Neutral" if needed
-                if item['team'] == "กลาง":
-                    item['team'] = neutral_text
-        
-        df_raw = pd.DataFrame(data)
-        # Reorder columns
-        column_order = [time_col, time_sec_col, 'event_type', 'outcome', 'team', half_col, 'half', 
-                       'player_number', 'player_name', 'description', 'x_position', 'y_position']
-        df_raw = df_raw[[col for col in column_order if col in df_raw.columns]]
-        df_raw.columns = [
-            time_col, 
-            time_sec_col, 
-            event_col, 
-            outcome_col, 
-            team_col, 
-            half_text_col, 
-            half_num_col, 
-            player_num_col, 
-            player_name_col, 
-            description_col, 
-            x_pos_col, 
-            y_pos_col
-        ]
-        
-        # Get current language to ensure consistent translation
-        current_lang = self._get_current_language()
+            neutral_text = NEUTRAL_TEAM
+        
+        # Half names (and the per-half sheet names) in the pinned export language
+        half_mapping = self._get_half_names()
+        
+        # Sheet 1: Raw Data - built column by column with the final column
+        # names and order, translating event_type/outcome values
+        events = self.events
+        timestamps = [e.timestamp for e in events]
+        # Translate each distinct value once, then map every row through the dict
+        event_names = {v: self._t(v, v) if v else v for v in {e.event_type for e in events}}
+        outcome_names = {v: self._t(v, v) if v else v for v in {e.outcome for e in events}}
+        df_raw = pd.DataFrame({
+            time_col: format_match_times(events),
+            time_sec_col: timestamps,
+            event_col: [event_names[e.event_type] for e in events],
+            outcome_col: [outcome_names[e.outcome] for e in events],
+            # Translate NEUTRAL_TEAM to "Neutral" if needed
+            team_col: [neutral_text if e.team == NEUTRAL_TEAM else e.team for e in events],
+            half_text_col: [half_mapping.get(e.half, f"{half_col} {e.half}") for e in events],
+            half_num_col: [e.half for e in events],
+            player_num_col: [e.player_number for e in events],
+            player_name_col: [e.player_name for e in events],
+            description_col: [e.description for e in events],
+            x_pos_col: [e.x_position for e in events],
+            y_pos_col: [e.y_position for e in events]
+        })
         
         # Sheet 2: Summary (All)
         summary_all = self._generate_summary(self.events)
@@ -237,13 +456,6 @@ class ManualTrackingData:
             event_freq_sheet = "Event Frequency"
             set_pieces_sheet = "Set Pieces"
             player_stats_sheet = "Player Statistics"
-            
-            half_sheet_names = {
-                1: "First Half",
-                2: "Second Half",
-                3: "Extra Time First Half",
-                4: "Extra Time Second Half"
-            }
         else:  # TH
             raw_data_sheet = "ข้อมูลดิบ"
             summary_sheet = "สรุปผลรวม"
@@ -255,119 +467,102 @@ class ManualTrackingData:
             event_freq_sheet = "ความถี่เหตุการณ์"
             set_pieces_sheet = "ลูกตั้งเตะ"
             player_stats_sheet = "สถิติผู้เล่น"
-            
-            half_sheet_names = {
-                1: "ครึ่งแรก",
-                2: "ครึ่งหลัง",
-                3: "ต่อเวลาครึ่งแรก",
-                4: "ต่อเวลาครึ่งหลัง"
-            }
         
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            # Sheet 1: Raw Data
-            df_raw.to_excel(writer, sheet_name=raw_data_sheet, index=False)
-            self._apply_sheet_styling(writer, raw_data_sheet)
+        # Build every sheet first, then write them back-to-back (sheet order is list order)
+        sheets = [(raw_data_sheet, df_raw), (summary_sheet, summary_all)]
+        
+        # Sheet 3: Team Comparison (only if 2 teams exist)
+        if not comparison.empty:
+            sheets.append((comparison_sheet, comparison))
+        
+        # Sheet: Players List (only if players are provided)
+        if self.team_a_players or self.team_b_players:
+            players_data = []
+            max_players = max(len(self.team_a_players), len(self.team_b_players))
             
-            # Sheet 2: Summary All
-            summary_all.to_excel(writer, sheet_name=summary_sheet, index=False)
-            self._apply_sheet_styling(writer, summary_sheet)
+            # Use actual team names
+            team_a_header = self.team_a_name if self.team_a_name else self._get_th_text("ทีม 1", "Team 1")
+            team_b_header = self.team_b_name if self.team_b_name else self._get_th_text("ทีม 2", "Team 2")
             
-            # Sheet 3: Team Comparison (only if 2 teams exist)
-            if not comparison.empty:
-                comparison.to_excel(writer, sheet_name=comparison_sheet, index=False)
-                self._apply_sheet_styling(writer, comparison_sheet)
+            order_col = self._get_th_text("ลำดับ", "Order")
             
-            # Sheet: Players List (only if players are provided)
-            if self.team_a_players or self.team_b_players:
-                players_data = []
-                max_players = max(len(self.team_a_players), len(self.team_b_players))
-                
-                # Use actual team names
-                team_a_header = self.team_a_name if self.team_a_name else self._get_th_text("ทีม 1", "Team 1")
-                team_b_header = self.team_b_name if self.team_b_name else self._get_th_text("ทีม 2", "Team 2")
-                
-                order_col = self._get_th_text("ลำดับ", "Order")
+            for i in range(max_players):
+                team1_player = self.team_a_players[i] if i < len(self.team_a_players) else ''
+                team2_player = self.team_b_players[i] if i < len(self.team_b_players) else ''
                 
-                for i in range(max_players):
-                    team1_player = self.team_a_players[i] if i < len(self.team_a_players) else ''
-                    team2_player = self.team_b_players[i] if i < len(self.team_b_players) else ''
-                    
-                    row = {
-                        order_col: i + 1,
-                        team_a_header: team1_player,
-                        team_b_header: team2_player
-                    }
-                    players_data.append(row)
-                
-                df_players = pd.DataFrame(players_data)
-                df_players.to_excel(writer, sheet_name=players_sheet, index=False)
-                self._apply_sheet_styling(writer, players_sheet)
-            
-            # Sheet: Goals Summary - Count all goals from any action with outcome "ประตู"
-            # Goals can come from: ยิง, ฟรีคิก, เตะมุม, ลูกโทษ, etc.
-            all_goals = [e for e in self.events if e.outcome == "ประตู"]
-            if all_goals:
-                goals_data = []
-                for goal in sorted(all_goals, key=lambda x: x.timestamp):
-                    minutes = int(goal.timestamp // 60)
-                    seconds = int(goal.timestamp % 60)
-                    
-                    if current_lang == "EN":
-                        goals_data.append({
-                            "Time": f"{minutes:02d}:{seconds:02d}",
-                            "Minute": f"{int(goal.timestamp // 60)}",
-                            "Type": self._t(goal.event_type, goal.event_type),
-                            "Team": goal.team if goal.team else "Not Specified",
-                            "Scorer": goal.player_name if goal.player_name else (f"#{goal.player_number}" if goal.player_number else "Not Specified"),
-                            "Half": half_mapping.get(goal.half, f"Half {goal.half}"),
-                            "Description": goal.description if goal.description else '-'
-                        })
-                    else:  # TH
-                        goals_data.append({
-                            "เวลา": f"{minutes:02d}:{seconds:02d}",
-                            "นาที": f"{int(goal.timestamp // 60)}",
-                            "ประเภท": self._t(goal.event_type, goal.event_type),
-                            "ทีม": goal.team if goal.team else "ไม่ระบุ",
-                            "ผู้ยิง": goal.player_name if goal.player_name else (f"#{goal.player_number}" if goal.player_number else "ไม่ระบุ"),
-                            "ครึ่ง": half_mapping.get(goal.half, f"ครึ่ง {goal.half}"),
-                            "คำอธิบาย": goal.description if goal.description else '-'
-                        })
+                row = {
+                    order_col: i + 1,
+                    team_a_header: team1_player,
+                    team_b_header: team2_player
+                }
+                players_data.append(row)
+            
+            sheets.append((players_sheet, pd.DataFrame(players_data)))
+        
+        # Sheet: Goals Summary - Count all goals from any action with outcome "ประตู"
+        # Goals can come from: ยิง, ฟรีคิก, เตะมุม, ลูกโทษ, etc.
+        # get_goals() keeps event order, which add_event() holds sorted by timestamp
+        all_goals = self.get_goals()
+        if all_goals:
+            goals_data = []
+            for goal, clock in zip(all_goals, format_match_times(all_goals)):
+                minutes = int(goal.timestamp // 60)
                 
-                df_goals = pd.DataFrame(goals_data)
-                df_goals.to_excel(writer, sheet_name=goals_sheet, index=False)
-                self._apply_sheet_styling(writer, goals_sheet)
-            
-            # Sheets: By Half
-            for half_num, half_name in half_sheet_names.items():
-                half_events = [e for e in self.events if e.half == half_num]
-                if half_events:
-                    summary_half = self._generate_summary(half_events)
-                    summary_half.to_excel(writer, sheet_name=half_name, index=False)
-                    self._apply_sheet_styling(writer, half_name)
-            
-            # Add professional statistics sheet with formulas (already has styling)
-            self._add_professional_statistics_sheet(writer)
-            
-            # Add additional analysis sheets
-            self._add_timeline_sheet(writer)
-            self._apply_sheet_styling(writer, timeline_sheet)
-            
-            self._add_key_moments_sheet(writer)
-            self._apply_sheet_styling(writer, key_moments_sheet)
-            
-            self._add_event_frequency_sheet(writer)
-            self._apply_sheet_styling(writer, event_freq_sheet)
+                if current_lang == "EN":
+                    goals_data.append({
+                        "Time": clock,
+                        "Minute": f"{minutes}",
+                        "Type": self._t(goal.event_type, goal.event_type),
+                        "Team": goal.team if goal.team else "Not Specified",
+                        "Scorer": goal.player_name if goal.player_name else (f"#{goal.player_number}" if goal.player_number else "Not Specified"),
+                        "Half": half_mapping.get(goal.half, f"Half {goal.half}"),
+                        "Description": goal.description if goal.description else '-'
+                    })
+                else:  # TH
+                    goals_data.append({
+                        "เวลา": clock,
+                        "นาที": f"{minutes}",
+                        "ประเภท": self._t(goal.event_type, goal.event_type),
+                        "ทีม": goal.team if goal.team else "ไม่ระบุ",
+                        "ผู้ยิง": goal.player_name if goal.player_name else (f"#{goal.player_number}" if goal.player_number else "ไม่ระบุ"),
+                        "ครึ่ง": half_mapping.get(goal.half, f"ครึ่ง {goal.half}"),
+                        "คำอธิบาย": goal.description if goal.description else '-'
+                    })
             
-            self._add_set_pieces_sheet(writer)
-            self._apply_sheet_styling(writer, set_pieces_sheet)
+            sheets.append((goals_sheet, pd.DataFrame(goals_data)))
+        
+        # Sheets: By Half
+        for half_num, half_name in half_mapping.items():
+            half_events = self.get_events_by_half(half_num)
+            if half_events:
+                sheets.append((half_name, self._generate_summary(half_events)))
+        
+        # Additional analysis sheets
+        sheets.append((timeline_sheet, self._build_timeline_sheet()))
+        sheets.append((key_moments_sheet, self._build_key_moments_sheet()))
+        sheets.append((event_freq_sheet, self._build_event_frequency_sheet()))
+        sheets.append((set_pieces_sheet, self._build_set_pieces_sheet()))
+        if self.team_a_players or self.team_b_players:
+            sheets.append((player_stats_sheet, self._build_player_performance_sheet()))
+        
+        # openpyxl zips the workbook into this handle, so one large buffer is the only layer
+        with open(filepath, 'wb', buffering=EXPORT_BUFFER_SIZE) as f, pd.ExcelWriter(f, engine='openpyxl') as writer:
+            for sheet_name, df in sheets:
+                if df is None:
+                    continue
+                if sheet_name == raw_data_sheet:
+                    # The largest sheet: append plain rows instead of pandas' per-cell formatter
+                    self._append_sheet_rows(writer, sheet_name, df)
+                else:
+                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+                self._apply_sheet_styling(writer, sheet_name)
             
-            if self.team_a_players or self.team_b_players:
-                self._add_player_performance_sheet(writer)
-                self._apply_sheet_styling(writer, player_stats_sheet)
+            # Professional statistics sheet with formulas (inserted first, already has styling)
+            self._add_professional_statistics_sheet(writer)
     
-    def _get_success_outcomes(self, event_type: str) -> List[str]:
+    def _get_success_outcomes(self, event_type: str) -> FrozenSet[str]:
         """
-        Get list of successful outcomes for a specific event type
+        Get the frozenset of successful outcomes for a specific event type (empty if none)
         
         คำอธิบาย:
         - "ประตู" = ได้ประตู (Goal)
@@ -376,91 +571,19 @@ class ManualTrackingData:
         - "คีย์พาส" = ส่งบอลที่สร้างโอกาสยิง (Key Pass - ส่งแล้วมีโอกาสยิง - นับเป็นสำเร็จ)
         - "สำเร็จ" = การกระทำสำเร็จ
         """
-        success_mapping = {
-            # Attacking Actions
-            "ส่งบอล": ["สำเร็จ", "แอสซิสต์", "คีย์พาส"],
-            # "แอสซิสต์" = ส่งแล้วได้ประตู, "คีย์พาส" = ส่งแล้วมีโอกาสยิง
-            
-            "ข้ามบอล": ["สำเร็จ", "แอสซิสต์", "คีย์พาส"],
-            "ผ่านบอล": ["สำเร็จ", "แอสซิสต์", "คีย์พาส"],
-            "ส่งบอลยาว": ["สำเร็จ", "แอสซิสต์", "คีย์พาส"],
-            "ส่งบอลสั้น": ["สำเร็จ"],
-            "ส่งบอลในเขตโทษ": ["สำเร็จ", "แอสซิสต์", "คีย์พาส"],
-            
-            "ยิง": ["ประตู", "ยิงเข้า"],
-            # "ประตู" = ได้ประตู, "ยิงเข้า" = ยิงเข้าเป้าแต่ไม่ได้ประตู (นับเป็นสำเร็จ)
-            # "ยิงออก", "บล็อก", "ถูกเซฟ" = ไม่สำเร็จ
-            
-            # Set Pieces
-            "เตะมุม": ["ประตู", "ยิงเข้า", "แอสซิสต์", "คีย์พาส"],
-            "ฟรีคิก": ["ประตู", "ยิงเข้า", "แอสซิสต์", "คีย์พาส"],
-            "ลูกโทษ": ["ประตู"],
-            # "ไม่ประตู", "ถูกเซฟ" = ไม่สำเร็จ
-            
-            "ทุ่มบอล": ["สำเร็จ"],
-            
-            # Defensive Actions
-            "แย่งบอล": ["สำเร็จ"],
-            "สกัดบอล": ["สำเร็จ"],
-            "เคลียร์บอล": ["สำเร็จ"],
-            "บล็อก": ["บล็อก", "บล็อกยิง"],
-            "เซฟ": ["เซฟ", "เซฟสำคัญ"],
-            
-            # Disciplinary (ไม่มีสำเร็จ/ไม่สำเร็จ - เป็นเหตุการณ์)
-            # หมายเหตุ: 
-            # - "ฟาวล์" = ฟาวล์ธรรมดา (outcome: "ฟาวล์" หรือ None)
-            #   ถ้า outcome เป็น "ใบเหลือง" หรือ "ใบแดง" จะถูกนับเป็นใบเหลือง/ใบแดง แทน
-            # - "ใบเหลือง" = ใบเหลือง (อาจมาจาก action "ใบเหลือง" หรือ action "ฟาวล์" ที่ outcome เป็น "ใบเหลือง")
-            # - "ใบแดง" = ใบแดง (อาจมาจาก action "ใบแดง" หรือ action "ฟาวล์" ที่ outcome เป็น "ใบแดง")
-            "ฟาวล์": [],
-            "ใบเหลือง": ["ใบเหลือง"],
-            "ใบแดง": ["ใบแดง"],
-            
-            # Other Events
-            "ออฟไซด์": [],
-            "บอลออก": [],
-            "เปลี่ยนตัว": ["เปลี่ยนตัวเข้า", "เปลี่ยนตัวออก"],
-            "บาดเจ็บ": [],
-            "เสียบอล": [],
-            "ครองบอล": ["ครองบอล"],
-        }
-        return success_mapping.get(event_type, [])
+        return SUCCESS_OUTCOMES.get(event_type, frozenset())
     
     def _is_successful_outcome(self, event_type: str, outcome: str) -> bool:
         """Check if outcome is successful for specific event type"""
         if not outcome:
             return False
-        success_outcomes = self._get_success_outcomes(event_type)
-        return outcome in success_outcomes
+        return outcome in SUCCESS_OUTCOMES.get(event_type, ())
     
     def _is_unsuccessful_outcome(self, event_type: str, outcome: str) -> bool:
-        """
-        Check if outcome is unsuccessful for specific event type
-        
-        Unsuccessful outcomes:
-        - "ไม่สำเร็จ" = การกระทำไม่สำเร็จ
-        - "ยิงออก" = ยิงออกนอกเป้า (Shot off Target)
-        - "ถูกเซฟ" = ถูกผู้รักษาประตูเซฟ
-        - "ไม่ประตู" = ไม่ได้ประตู (เช่น ลูกโทษ)
-        - "ไม่เซฟ" = ไม่เซฟได้
-        - "เสียบอล" = เสียบอล
-        - "บล็อก" = ถูกบล็อก (เฉพาะในกรณี action "ยิง" เท่านั้น)
-        """
+        """Check if outcome is unsuccessful for specific event type"""
         if not outcome:
             return False
-        
-        # สำหรับ action "บล็อก" ไม่มี unsuccessful (บล็อกสำเร็จ = "บล็อก" หรือ "บล็อกยิง")
-        if event_type == "บล็อก":
-            return False
-        
-        # Unsuccessful keywords
-        unsuccessful_keywords = ["ไม่สำเร็จ", "ยิงออก", "ถูกเซฟ", "ไม่ประตู", "ไม่เซฟ", "เสียบอล"]
-        
-        # "บล็อก" = ถูกบล็อก (เฉพาะในกรณี action "ยิง", "เตะมุม", "ฟรีคิก")
-        if outcome == "บล็อก" and event_type in ["ยิง", "เตะมุม", "ฟรีคิก"]:
-            return True
-        
-        return any(keyword in outcome for keyword in unsuccessful_keywords)
+        return is_unsuccessful_outcome(event_type, outcome)
     
     def _generate_summary(self, events: List[TrackingEvent]) -> pd.DataFrame:
         """Generate comprehensive summary statistics for events (without percentages)"""
@@ -468,48 +591,68 @@ class ManualTrackingData:
             return pd.DataFrame()
         
         summary_data = []
-        
-        # Get all teams
-        teams = sorted(set(e.team for e in events if e.team != "กลาง"))
+        category_col = self._t('หมวดหมู่', 'Category')
+        item_col = self._t('รายการ', 'Item')
+        count_col = self._t('จำนวน', 'Count')
+        note_col = self._t('หมายเหตุ', 'Note')
+        # Labels repeated on every event-type and team row, resolved once
+        event_type_label = self._t('ประเภทเหตุการณ์', 'Event Type')
+        by_team_text = self._get_th_text('แบ่งตามทีม:', 'By Team:')
+        no_team_data_text = self._t('ไม่มีข้อมูลทีม', 'No Team Data')
+        outcome_text = self._get_th_text('ผลลัพธ์:', 'Outcome:')
+        success_rate_label = self._t('อัตราความสำเร็จ', 'Success Rate')
+        success_text = self._get_th_text("สำเร็จ", "Success")
+        failed_text = self._get_th_text("ไม่สำเร็จ", "Failed")
+        rate_text = self._get_th_text("อัตรา", "Rate")
+        from_team_text = self._get_th_text("จาก", "From")
+        team_events_text = self._get_th_text("เหตุการณ์ของทีม", "Team Events")
+        
+        # Count each (event type, outcome, team) once; the sections below fold these counts
+        no_result = self._t("ไม่มีผลลัพธ์", "No Result")
+        event_counts = Counter((e.event_type, e.outcome or no_result, e.team) for e in events)
+        
+        # Get all teams from the distinct counted keys rather than another scan of events
+        teams = sorted({team for _, _, team in event_counts if team and team != NEUTRAL_TEAM})
         total_events = len(events)
         
         # === ส่วนที่ 1: สรุปภาพรวม ===
         summary_data.append({
-            self._t('หมวดหมู่', 'Category'): self._t('ภาพรวม', 'Overview'),
-            self._t('รายการ', 'Item'): self._t('จำนวนเหตุการณ์ทั้งหมด', 'Total Events'),
-            self._t('จำนวน', 'Count'): total_events,
-            self._t('หมายเหตุ', 'Note'): self._get_th_text('รวมทุกทีมและทุกประเภทเหตุการณ์', 'All teams and all event types')
+            category_col: self._t('ภาพรวม', 'Overview'),
+            item_col: self._t('จำนวนเหตุการณ์ทั้งหมด', 'Total Events'),
+            count_col: total_events,
+            note_col: self._get_th_text('รวมทุกทีมและทุกประเภทเหตุการณ์', 'All teams and all event types')
         })
         
         summary_data.append({
-            self._t('หมวดหมู่', 'Category'): self._t('ภาพรวม', 'Overview'),
-            self._t('รายการ', 'Item'): self._t('จำนวนทีมที่วิเคราะห์', 'Number of Teams Analyzed'),
-            self._t('จำนวน', 'Count'): len(teams),
-            self._t('หมายเหตุ', 'Note'): ', '.join(teams) if teams else self._t('ไม่มีทีม', 'No Teams')
+            category_col: self._t('ภาพรวม', 'Overview'),
+            item_col: self._t('จำนวนทีมที่วิเคราะห์', 'Number of Teams Analyzed'),
+            count_col: len(teams),
+            note_col: ', '.join(teams) if teams else self._t('ไม่มีทีม', 'No Teams')
         })
         
         # === ส่วนที่ 2: สรุปตามประเภทเหตุการณ์ ===
         event_stats = {}
-        for event in events:
-            event_type = event.event_type
-            outcome = event.outcome if event.outcome else self._t("ไม่มีผลลัพธ์", "No Result")
-            
+        team_results = defaultdict(lambda: [0, 0, 0])  # (team, event_type) -> [total, successful, unsuccessful]
+        for (event_type, outcome, team), count in event_counts.items():
             if event_type not in event_stats:
                 event_stats[event_type] = {
                     'total': 0, 
                     'outcomes': {}, 
-                    'by_team': {},
+                    'by_team': Counter(),
                     'successful': 0,
                     'unsuccessful': 0,
                     'attempts': 0  # สำหรับคำนวณอัตราความสำเร็จ (successful + unsuccessful)
                 }
+            stats = event_stats[event_type]
+            stats['total'] += count
             
-            event_stats[event_type]['total'] += 1
+            # Count by outcome, and by team for this outcome
+            outcome_stats = stats['outcomes'].setdefault(outcome, {'total': 0, 'by_team': {}})
+            outcome_stats['total'] += count
+            outcome_stats['by_team'][team] = count
             
-            # Count by outcome
-            if outcome not in event_stats[event_type]['outcomes']:
-                event_stats[event_type]['outcomes'][outcome] = {'total': 0, 'by_team': {}}
-            event_stats[event_type]['outcomes'][outcome]['total'] += 1
+            # Count by team for event type
+            stats['by_team'][team] += count
             
             # Count successful/unsuccessful ตาม event type ที่ชัดเจน
             # หมายเหตุ: 
@@ -518,187 +661,146 @@ class ManualTrackingData:
             # - "แอสซิสต์" = ส่งแล้วได้ประตู (สำเร็จมาก)
             # - "คีย์พาส" = ส่งแล้วมีโอกาสยิง (สำเร็จ)
             # - "ยิงออก", "บล็อก", "ถูกเซฟ" = ไม่สำเร็จ (เฉพาะใน action "ยิง")
+            # The team section below reuses team_results
+            team_counts = team_results[(team, event_type)]
+            team_counts[0] += count
             if self._is_successful_outcome(event_type, outcome):
-                event_stats[event_type]['successful'] += 1
-                event_stats[event_type]['attempts'] += 1
+                stats['successful'] += count
+                stats['attempts'] += count
+                team_counts[1] += count
             elif self._is_unsuccessful_outcome(event_type, outcome):
-                event_stats[event_type]['unsuccessful'] += 1
-                event_stats[event_type]['attempts'] += 1
+                stats['unsuccessful'] += count
+                stats['attempts'] += count
+                team_counts[2] += count
             # หมายเหตุ: outcome ที่ไม่ใช่ success หรือ unsuccessful (เช่น "ออฟไซด์", "บอลออก") 
             # จะไม่นับใน attempts เพื่อความแม่นยำในการคำนวณอัตราความสำเร็จ
-            
-            # Count by team for this outcome
-            team = event.team
-            if team not in event_stats[event_type]['outcomes'][outcome]['by_team']:
-                event_stats[event_type]['outcomes'][outcome]['by_team'][team] = 0
-            event_stats[event_type]['outcomes'][outcome]['by_team'][team] += 1
-            
-            # Count by team for event type
-            if team not in event_stats[event_type]['by_team']:
-                event_stats[event_type]['by_team'][team] = 0
-            event_stats[event_type]['by_team'][team] += 1
+        
+        # "Team: count" breakdowns; only the neutral team name is translated
+        neutral_name = self._t(NEUTRAL_TEAM, "Neutral")
+        def format_team_counts(counts: Dict[str, int]) -> str:
+            return ", ".join(f"{neutral_name if team == NEUTRAL_TEAM else team}: {count}"
+                             for team, count in sorted(counts.items()))
         
         # Add event type summaries
         for event_type, stats in sorted(event_stats.items()):
             event_total = stats['total']
-            # Translate team names
-            team_counts_list = []
-            for team, count in sorted(stats['by_team'].items()):
-                if team == "กลาง":
-                    translated_team = self._t("กลาง", "Neutral")
-                else:
-                    translated_team = team  # Keep actual team name
-                team_counts_list.append(f"{translated_team}: {count}")
-            team_counts = ", ".join(team_counts_list)
+            team_counts = format_team_counts(stats['by_team'])
             translated_event_type = self._t(event_type, event_type)
             
             summary_data.append({
-                self._t('หมวดหมู่', 'Category'): self._t('ประเภทเหตุการณ์', 'Event Type'),
-                self._t('รายการ', 'Item'): translated_event_type,
-                self._t('จำนวน', 'Count'): event_total,
-                self._t('หมายเหตุ', 'Note'): f"{self._get_th_text('แบ่งตามทีม:', 'By Team:')} {team_counts}" if team_counts else self._t('ไม่มีข้อมูลทีม', 'No Team Data')
+                category_col: event_type_label,
+                item_col: translated_event_type,
+                count_col: event_total,
+                note_col: f"{by_team_text} {team_counts}" if team_counts else no_team_data_text
             })
             
             # Add outcome details
             for outcome, outcome_data in sorted(stats['outcomes'].items()):
                 outcome_count = outcome_data['total']
-                # Translate team names
-                team_breakdown_list = []
-                for team, count in sorted(outcome_data['by_team'].items()):
-                    if team == "กลาง":
-                        translated_team = self._t("กลาง", "Neutral")
-                    else:
-                        translated_team = team  # Keep actual team name
-                    team_breakdown_list.append(f"{translated_team}: {count}")
-                team_breakdown = ", ".join(team_breakdown_list)
+                team_breakdown = format_team_counts(outcome_data['by_team'])
                 translated_outcome = self._t(outcome, outcome)
                 
                 summary_data.append({
-                    self._t('หมวดหมู่', 'Category'): f'  └─ {translated_event_type}',
-                    self._t('รายการ', 'Item'): f"{self._get_th_text('ผลลัพธ์:', 'Outcome:')} {translated_outcome}",
-                    self._t('จำนวน', 'Count'): outcome_count,
-                    self._t('หมายเหตุ', 'Note'): f"{self._get_th_text('แบ่งตามทีม:', 'By Team:')} {team_breakdown}" if team_breakdown else '-'
+                    category_col: f'  └─ {translated_event_type}',
+                    item_col: f"{outcome_text} {translated_outcome}",
+                    count_col: outcome_count,
+                    note_col: f"{by_team_text} {team_breakdown}" if team_breakdown else '-'
                 })
             
             # Add success rate info (คำนวณจาก attempts ที่มีผลสำเร็จ/ไม่สำเร็จเท่านั้น)
             attempts = stats['attempts']  # successful + unsuccessful
             if attempts > 0:
                 success_rate = (stats['successful'] / attempts * 100) if attempts > 0 else 0
-                success_text = self._get_th_text("สำเร็จ", "Success")
-                failed_text = self._get_th_text("ไม่สำเร็จ", "Failed")
-                rate_text = self._get_th_text("อัตรา", "Rate")
                 summary_data.append({
-                    self._t('หมวดหมู่', 'Category'): f'  └─ {translated_event_type}',
-                    self._t('รายการ', 'Item'): self._t('อัตราความสำเร็จ', 'Success Rate'),
-                    self._t('จำนวน', 'Count'): f"{stats['successful']}/{attempts}",
-                    self._t('หมายเหตุ', 'Note'): f'{success_text}: {stats["successful"]}, {failed_text}: {stats["unsuccessful"]}, {rate_text}: {success_rate:.1f}%'
+                    category_col: f'  └─ {translated_event_type}',
+                    item_col: success_rate_label,
+                    count_col: f"{stats['successful']}/{attempts}",
+                    note_col: f'{success_text}: {stats["successful"]}, {failed_text}: {stats["unsuccessful"]}, {rate_text}: {success_rate:.1f}%'
                 })
             elif stats['successful'] > 0:
                 # กรณีที่ไม่มี unsuccessful แต่มี successful (เช่น ประตู)
-                success_text = self._get_th_text("สำเร็จ", "Success")
                 summary_data.append({
-                    self._t('หมวดหมู่', 'Category'): f'  └─ {translated_event_type}',
-                    self._t('รายการ', 'Item'): self._t('อัตราความสำเร็จ', 'Success Rate'),
-                    self._t('จำนวน', 'Count'): f"{stats['successful']}/{stats['successful']}",
-                    self._t('หมายเหตุ', 'Note'): f'{success_text}: {stats["successful"]} (100%)'
+                    category_col: f'  └─ {translated_event_type}',
+                    item_col: success_rate_label,
+                    count_col: f"{stats['successful']}/{stats['successful']}",
+                    note_col: f'{success_text}: {stats["successful"]} (100%)'
                 })
         
         # === ส่วนที่ 3: สรุปตามทีม ===
+        # Group the single-pass counts by team instead of re-filtering events per team
+        team_event_types = defaultdict(dict)
+        for (team, event_type), counts in team_results.items():
+            team_event_types[team][event_type] = counts
+        
+        team_summary_label = self._t('สรุปตามทีม', 'Team Summary')
+        total_text = self._t("รวมทั้งหมด", "Total")
+        from_total_text = self._t("จากทั้งหมด", "From Total")
+        events_text = self._t("เหตุการณ์", "Events")
+        team_note = f'{from_total_text} {total_events} {events_text}'
         for team in teams:
-            team_events = [e for e in events if e.team == team]
-            team_total = len(team_events)
+            type_counts = team_event_types[team]
+            team_total = sum(counts[0] for counts in type_counts.values())
             
             summary_data.append({
-                self._t('หมวดหมู่', 'Category'): self._t('สรุปตามทีม', 'Team Summary'),
-                self._t('รายการ', 'Item'): f'{team} - {self._t("รวมทั้งหมด", "Total")}',
-                self._t('จำนวน', 'Count'): team_total,
-                self._t('หมายเหตุ', 'Note'): f'{self._t("จากทั้งหมด", "From Total")} {total_events} {self._t("เหตุการณ์", "Events")}'
+                category_col: team_summary_label,
+                item_col: f'{team} - {total_text}',
+                count_col: team_total,
+                note_col: team_note
             })
             
-            # Team events by type
-            team_event_types = {}
-            team_outcomes = {}
-            for event in team_events:
-                # Count by type
-                if event.event_type not in team_event_types:
-                    team_event_types[event.event_type] = 0
-                team_event_types[event.event_type] += 1
-                
-                # Count outcomes
-                outcome = event.outcome if event.outcome else self._t("ไม่มีผลลัพธ์", "No Result")
-                if outcome not in team_outcomes:
-                    team_outcomes[outcome] = 0
-                team_outcomes[outcome] += 1
-            
             # Add team event types
-            for event_type, count in sorted(team_event_types.items()):
-                # Calculate success rate for this team and event type
-                team_events_of_type = [e for e in team_events if e.event_type == event_type]
-                success_outcomes = self._get_success_outcomes(event_type)
-                # Translate unsuccessful keywords for matching
-                unsuccessful_keywords_th = ["ไม่สำเร็จ", "ยิงออก", "ถูกเซฟ", "ไม่ประตู", "ไม่เซฟ", "เสียบอล"]
-                unsuccessful_keywords_en = ["Failed", "Shot off Target", "Saved", "No Goal", "No Save", "Lost Ball"]
-                # Use both Thai and English keywords for matching
-                unsuccessful_keywords = unsuccessful_keywords_th + unsuccessful_keywords_en
-                
-                team_successful = len([e for e in team_events_of_type 
-                                      if e.outcome and e.outcome in success_outcomes])
-                team_unsuccessful = len([e for e in team_events_of_type 
-                                        if e.outcome and self._is_unsuccessful_outcome(event_type, e.outcome)])
+            for event_type, (count, team_successful, team_unsuccessful) in sorted(type_counts.items()):
+                # Success rate for this team and event type
                 team_attempts = team_successful + team_unsuccessful
                 
                 translated_event_type = self._t(event_type, event_type)
                 if team_attempts > 0:
                     team_rate = (team_successful / team_attempts * 100)
-                    success_text = self._get_th_text("สำเร็จ", "Success")
-                    from_team_text = self._get_th_text("จาก", "From")
-                    team_events_text = self._get_th_text("เหตุการณ์ของทีม", "Team Events")
                     summary_data.append({
-                        self._t('หมวดหมู่', 'Category'): f'  └─ {team}',
-                        self._t('รายการ', 'Item'): f'{translated_event_type} ({self._t("อัตราความสำเร็จ", "Success Rate")}: {team_rate:.1f}%)',
-                        self._t('จำนวน', 'Count'): count,
-                        self._t('หมายเหตุ', 'Note'): f'{success_text}: {team_successful}/{team_attempts}, {from_team_text} {team_total} {team_events_text}'
+                        category_col: f'  └─ {team}',
+                        item_col: f'{translated_event_type} ({success_rate_label}: {team_rate:.1f}%)',
+                        count_col: count,
+                        note_col: f'{success_text}: {team_successful}/{team_attempts}, {from_team_text} {team_total} {team_events_text}'
                     })
                 else:
-                    from_team_text = self._get_th_text("จาก", "From")
-                    team_events_text = self._get_th_text("เหตุการณ์ของทีม", "Team Events")
                     summary_data.append({
-                        self._t('หมวดหมู่', 'Category'): f'  └─ {team}',
-                        self._t('รายการ', 'Item'): translated_event_type,
-                        self._t('จำนวน', 'Count'): count,
-                        self._t('หมายเหตุ', 'Note'): f'{from_team_text} {team_total} {team_events_text}'
+                        category_col: f'  └─ {team}',
+                        item_col: translated_event_type,
+                        count_col: count,
+                        note_col: f'{from_team_text} {team_total} {team_events_text}'
                     })
         
         # === ส่วนที่ 4: สถิติเบื้องต้น ===
         # Calculate time distribution
         if events:
-            times = [e.timestamp for e in events]
-            min_time = min(times)
-            max_time = max(times)
+            # Events are kept sorted by timestamp, so the extremes are the ends of the list
+            min_time = events[0].timestamp
+            max_time = events[-1].timestamp
             total_duration = max_time - min_time
             total_minutes = total_duration / 60 if total_duration > 0 else 1
             
+            time_stats_label = self._t('สถิติเวลา', 'Time Statistics')
             seconds_text = self._t("วินาที", "seconds")
             summary_data.append({
-                self._t('หมวดหมู่', 'Category'): self._t('สถิติเวลา', 'Time Statistics'),
-                self._t('รายการ', 'Item'): self._get_th_text('เวลาตั้งแต่แรก', 'First Time'),
-                self._t('จำนวน', 'Count'): f"{int(min_time // 60)}:{int(min_time % 60):02d}",
-                self._t('หมายเหตุ', 'Note'): f'{min_time:.1f} {seconds_text}'
+                category_col: time_stats_label,
+                item_col: self._get_th_text('เวลาตั้งแต่แรก', 'First Time'),
+                count_col: f"{int(min_time // 60)}:{int(min_time % 60):02d}",
+                note_col: f'{min_time:.1f} {seconds_text}'
             })
             
             summary_data.append({
-                self._t('หมวดหมู่', 'Category'): self._t('สถิติเวลา', 'Time Statistics'),
-                self._t('รายการ', 'Item'): self._get_th_text('เวลาสุดท้าย', 'Last Time'),
-                self._t('จำนวน', 'Count'): f"{int(max_time // 60)}:{int(max_time % 60):02d}",
-                self._t('หมายเหตุ', 'Note'): f'{max_time:.1f} {seconds_text}'
+                category_col: time_stats_label,
+                item_col: self._get_th_text('เวลาสุดท้าย', 'Last Time'),
+                count_col: f"{int(max_time // 60)}:{int(max_time % 60):02d}",
+                note_col: f'{max_time:.1f} {seconds_text}'
             })
             
             minutes_text = self._t("นาที", "minutes")
             summary_data.append({
-                self._t('หมวดหมู่', 'Category'): self._t('สถิติเวลา', 'Time Statistics'),
-                self._t('รายการ', 'Item'): self._get_th_text('ระยะเวลารวม', 'Total Duration'),
-                self._t('จำนวน', 'Count'): f"{int(total_duration // 60)}:{int(total_duration % 60):02d}",
-                self._t('หมายเหตุ', 'Note'): f'{total_duration:.1f} {seconds_text} ({total_minutes:.2f} {minutes_text})'
+                category_col: time_stats_label,
+                item_col: self._get_th_text('ระยะเวลารวม', 'Total Duration'),
+                count_col: f"{int(total_duration // 60)}:{int(total_duration % 60):02d}",
+                note_col: f'{total_duration:.1f} {seconds_text} ({total_minutes:.2f} {minutes_text})'
             })
             
             # Average events per minute
@@ -706,47 +808,38 @@ class ManualTrackingData:
             avg_text = self._get_th_text("เฉลี่ย", "Average")
             events_per_min_text = self._get_th_text("เหตุการณ์/นาที", "Events/Minute")
             summary_data.append({
-                self._t('หมวดหมู่', 'Category'): self._t('สถิติเวลา', 'Time Statistics'),
-                self._t('รายการ', 'Item'): self._get_th_text('จำนวนเหตุการณ์ต่อนาที', 'Events per Minute'),
-                self._t('จำนวน', 'Count'): f"{events_per_minute:.2f}",
-                self._t('หมายเหตุ', 'Note'): f'{avg_text} {events_per_minute:.2f} {events_per_min_text}'
+                category_col: time_stats_label,
+                item_col: self._get_th_text('จำนวนเหตุการณ์ต่อนาที', 'Events per Minute'),
+                count_col: f"{events_per_minute:.2f}",
+                note_col: f'{avg_text} {events_per_minute:.2f} {events_per_min_text}'
             })
             
             # Calculate time intervals between events
-            if len(times) > 1:
-                intervals = [times[i+1] - times[i] for i in range(len(times)-1)]
-                avg_interval = sum(intervals) / len(intervals) if intervals else 0
+            if total_events > 1:
+                # The consecutive differences telescope, so their mean is (last - first) / (n - 1)
+                avg_interval = total_duration / (total_events - 1)
                 avg_per_event_text = self._get_th_text("วินาทีต่อเหตุการณ์", "seconds per event")
                 summary_data.append({
-                    self._t('หมวดหมู่', 'Category'): self._t('สถิติเวลา', 'Time Statistics'),
-                    self._t('รายการ', 'Item'): self._get_th_text('ช่วงเวลาระหว่างเหตุการณ์ (เฉลี่ย)', 'Average Interval Between Events'),
-                    self._t('จำนวน', 'Count'): f"{avg_interval:.1f} {seconds_text}",
-                    self._t('หมายเหตุ', 'Note'): f'{avg_text} {avg_interval:.1f} {avg_per_event_text}'
+                    category_col: time_stats_label,
+                    item_col: self._get_th_text('ช่วงเวลาระหว่างเหตุการณ์ (เฉลี่ย)', 'Average Interval Between Events'),
+                    count_col: f"{avg_interval:.1f} {seconds_text}",
+                    note_col: f'{avg_text} {avg_interval:.1f} {avg_per_event_text}'
                 })
         
         # Calculate half distribution
-        half_counts = {}
-        for event in events:
-            if event.half not in half_counts:
-                half_counts[event.half] = 0
-            half_counts[event.half] += 1
-        
-        half_names = {
-            1: self._t("ครึ่งแรก", "First Half"),
-            2: self._t("ครึ่งหลัง", "Second Half"),
-            3: self._t("ต่อเวลาครึ่งแรก", "Extra Time First Half"),
-            4: self._t("ต่อเวลาครึ่งหลัง", "Extra Time Second Half")
-        }
+        half_counts = Counter(e.half for e in events)
         
-        from_total_text = self._t("จากทั้งหมด", "From Total")
-        events_text = self._t("เหตุการณ์", "Events")
+        half_names = self._get_half_names()
+        
+        half_stats_label = self._t('สถิติตามครึ่ง', 'Half Statistics')
+        half_text = self._t('ครึ่ง', 'Half')
         for half_num, count in sorted(half_counts.items()):
-            half_name = half_names.get(half_num, f"{self._t('ครึ่ง', 'Half')} {half_num}")
+            half_name = half_names.get(half_num, f"{half_text} {half_num}")
             summary_data.append({
-                self._t('หมวดหมู่', 'Category'): self._t('สถิติตามครึ่ง', 'Half Statistics'),
-                self._t('รายการ', 'Item'): half_name,
-                self._t('จำนวน', 'Count'): count,
-                self._t('หมายเหตุ', 'Note'): f'{from_total_text} {total_events} {events_text}'
+                category_col: half_stats_label,
+                item_col: half_name,
+                count_col: count,
+                note_col: f'{from_total_text} {total_events} {events_text}'
             })
         
         df_summary = pd.DataFrame(summary_data)
@@ -776,98 +869,113 @@ class ManualTrackingData:
         if not events:
             return pd.DataFrame()
         
-        # Get all teams (excluding neutral)
-        teams = sorted(set(e.team for e in events if e.team != "กลาง"))
+        # One pass over the events; every section below reads these counters,
+        # and the teams, event types and halves all come from the same pass
+        no_result = self._t("ไม่มีผลลัพธ์", "No Result")
+        team_stats = defaultdict(lambda: {
+            'by_type': Counter(),
+            'outcomes': defaultdict(Counter),
+            'by_half': Counter(),
+            'successful': Counter(),
+            'unsuccessful': Counter()
+        })
+        event_types = set()
+        halves = set()
+        for e in events:
+            event_types.add(e.event_type)
+            halves.add(e.half)
+            stats = team_stats[e.team]
+            stats['by_type'][e.event_type] += 1
+            stats['outcomes'][e.event_type][e.outcome or no_result] += 1
+            stats['by_half'][e.half] += 1
+            # ใช้ logic เดียวกันกับ _is_successful_outcome/_is_unsuccessful_outcome เพื่อความสอดคล้อง
+            if e.outcome:
+                if self._is_successful_outcome(e.event_type, e.outcome):
+                    stats['successful'][e.event_type] += 1
+                elif self._is_unsuccessful_outcome(e.event_type, e.outcome):
+                    stats['unsuccessful'][e.event_type] += 1
+        
+        # Get all teams (excluding neutral and unnamed), same rule as get_teams()
+        teams = sorted(team for team in team_stats if team and team != NEUTRAL_TEAM)
         
         # Only generate comparison if exactly 2 teams
         if len(teams) != 2:
             return pd.DataFrame()
         
         team_a, team_b = teams[0], teams[1]
-        team_a_events = [e for e in events if e.team == team_a]
-        team_b_events = [e for e in events if e.team == team_b]
+        a_stats, b_stats = team_stats[team_a], team_stats[team_b]
+        team_a_total = sum(a_stats['by_type'].values())
+        team_b_total = sum(b_stats['by_type'].values())
         
         comparison_data = []
+        variable_col = self._t('ตัวแปร', 'Variable')
+        difference_col = self._t('ความแตกต่าง', 'Difference')
+        more_col = self._t('ทีมที่มากกว่า', 'Team with More')
         
         # === ส่วนที่ 1: เปรียบเทียบภาพรวม ===
         equal_text = self._t("เท่ากัน", "Equal")
         comparison_data.append({
-            self._t('ตัวแปร', 'Variable'): self._t('จำนวนเหตุการณ์ทั้งหมด', 'Total Events'),
-            team_a: len(team_a_events),
-            team_b: len(team_b_events),
-            self._t('ความแตกต่าง', 'Difference'): len(team_a_events) - len(team_b_events),
-            self._t('ทีมที่มากกว่า', 'Team with More'): team_a if len(team_a_events) > len(team_b_events) else (team_b if len(team_b_events) > len(team_a_events) else equal_text)
+            variable_col: self._t('จำนวนเหตุการณ์ทั้งหมด', 'Total Events'),
+            team_a: team_a_total,
+            team_b: team_b_total,
+            difference_col: team_a_total - team_b_total,
+            more_col: team_a if team_a_total > team_b_total else (team_b if team_b_total > team_a_total else equal_text)
         })
         
         # === ส่วนที่ 2: เปรียบเทียบตามประเภทเหตุการณ์ ===
         # Get all event types
-        all_event_types = sorted(set(e.event_type for e in events))
+        all_event_types = tuple(sorted(event_types))
         
+        number_of_text = self._t("จำนวน", "Number of")
         for event_type in all_event_types:
-            team_a_count = len([e for e in team_a_events if e.event_type == event_type])
-            team_b_count = len([e for e in team_b_events if e.event_type == event_type])
+            team_a_count = a_stats['by_type'][event_type]
+            team_b_count = b_stats['by_type'][event_type]
             diff = team_a_count - team_b_count
             translated_event_type = self._t(event_type, event_type)
             
             comparison_data.append({
-                self._t('ตัวแปร', 'Variable'): f'{self._t("จำนวน", "Number of")} {translated_event_type}',
+                variable_col: f'{number_of_text} {translated_event_type}',
                 team_a: team_a_count,
                 team_b: team_b_count,
-                self._t('ความแตกต่าง', 'Difference'): diff,
-                self._t('ทีมที่มากกว่า', 'Team with More'): team_a if diff > 0 else (team_b if diff < 0 else equal_text)
+                difference_col: diff,
+                more_col: team_a if diff > 0 else (team_b if diff < 0 else equal_text)
             })
             
             # Compare outcomes for this event type
-            team_a_outcomes = {}
-            team_b_outcomes = {}
-            
-            for e in team_a_events:
-                if e.event_type == event_type:
-                    outcome = e.outcome if e.outcome else self._t("ไม่มีผลลัพธ์", "No Result")
-                    team_a_outcomes[outcome] = team_a_outcomes.get(outcome, 0) + 1
-            
-            for e in team_b_events:
-                if e.event_type == event_type:
-                    outcome = e.outcome if e.outcome else self._t("ไม่มีผลลัพธ์", "No Result")
-                    team_b_outcomes[outcome] = team_b_outcomes.get(outcome, 0) + 1
+            team_a_outcomes = a_stats['outcomes'][event_type]
+            team_b_outcomes = b_stats['outcomes'][event_type]
             
             # Compare each outcome
-            all_outcomes = sorted(set(list(team_a_outcomes.keys()) + list(team_b_outcomes.keys())))
+            all_outcomes = sorted(set(team_a_outcomes) | set(team_b_outcomes))
             for outcome in all_outcomes:
-                a_count = team_a_outcomes.get(outcome, 0)
-                b_count = team_b_outcomes.get(outcome, 0)
+                a_count = team_a_outcomes[outcome]
+                b_count = team_b_outcomes[outcome]
                 diff = a_count - b_count
                 
-                # Translate event_type and outcome for display
-                translated_event_type = self._t(event_type, event_type)
+                # Translate outcome for display
                 translated_outcome = self._t(outcome, outcome)
                 
                 comparison_data.append({
-                    self._t('ตัวแปร', 'Variable'): f'  └─ {translated_event_type} - {translated_outcome}',
+                    variable_col: f'  └─ {translated_event_type} - {translated_outcome}',
                     team_a: a_count,
                     team_b: b_count,
-                    self._t('ความแตกต่าง', 'Difference'): diff,
-                    self._t('ทีมที่มากกว่า', 'Team with More'): team_a if diff > 0 else (team_b if diff < 0 else equal_text)
+                    difference_col: diff,
+                    more_col: team_a if diff > 0 else (team_b if diff < 0 else equal_text)
                 })
         
         # === ส่วนที่ 3: เปรียบเทียบอัตราความสำเร็จ ===
         # Calculate success rates for each team (ใช้ mapping ที่ชัดเจนและสอดคล้องกับ _is_successful_outcome/_is_unsuccessful_outcome)
+        success_rate_text = self._t("อัตราความสำเร็จ", "Success Rate")
         for event_type in all_event_types:
             # Team A
-            team_a_events_of_type = [e for e in team_a_events if e.event_type == event_type]
-            team_a_successful = len([e for e in team_a_events_of_type 
-                                    if e.outcome and self._is_successful_outcome(event_type, e.outcome)])
-            team_a_unsuccessful = len([e for e in team_a_events_of_type 
-                                      if e.outcome and self._is_unsuccessful_outcome(event_type, e.outcome)])
+            team_a_successful = a_stats['successful'][event_type]
+            team_a_unsuccessful = a_stats['unsuccessful'][event_type]
             team_a_attempts = team_a_successful + team_a_unsuccessful
             team_a_rate = (team_a_successful / team_a_attempts * 100) if team_a_attempts > 0 else 0
             
             # Team B
-            team_b_events_of_type = [e for e in team_b_events if e.event_type == event_type]
-            team_b_successful = len([e for e in team_b_events_of_type 
-                                    if e.outcome and self._is_successful_outcome(event_type, e.outcome)])
-            team_b_unsuccessful = len([e for e in team_b_events_of_type 
-                                      if e.outcome and self._is_unsuccessful_outcome(event_type, e.outcome)])
+            team_b_successful = b_stats['successful'][event_type]
+            team_b_unsuccessful = b_stats['unsuccessful'][event_type]
             team_b_attempts = team_b_successful + team_b_unsuccessful
             team_b_rate = (team_b_successful / team_b_attempts * 100) if team_b_attempts > 0 else 0
             
@@ -875,114 +983,88 @@ class ManualTrackingData:
             if team_a_attempts > 0 or team_b_attempts > 0:
                 translated_event_type = self._t(event_type, event_type)
                 comparison_data.append({
-                    self._t('ตัวแปร', 'Variable'): f'{self._t("อัตราความสำเร็จ", "Success Rate")} {translated_event_type}',
+                    variable_col: f'{success_rate_text} {translated_event_type}',
                     team_a: f"{team_a_successful}/{team_a_attempts} ({team_a_rate:.1f}%)" if team_a_attempts > 0 else "-",
                     team_b: f"{team_b_successful}/{team_b_attempts} ({team_b_rate:.1f}%)" if team_b_attempts > 0 else "-",
-                    self._t('ความแตกต่าง', 'Difference'): f"{team_a_rate - team_b_rate:.1f}%" if team_a_attempts > 0 and team_b_attempts > 0 else "-",
-                    self._t('ทีมที่มากกว่า', 'Team with More'): team_a if team_a_rate > team_b_rate else (team_b if team_b_rate > team_a_rate else equal_text) if team_a_attempts > 0 and team_b_attempts > 0 else '-'
+                    difference_col: f"{team_a_rate - team_b_rate:.1f}%" if team_a_attempts > 0 and team_b_attempts > 0 else "-",
+                    more_col: team_a if team_a_rate > team_b_rate else (team_b if team_b_rate > team_a_rate else equal_text) if team_a_attempts > 0 and team_b_attempts > 0 else '-'
                 })
         
         # === ส่วนที่ 4: เปรียบเทียบตามครึ่ง ===
-        half_names = {
-            1: self._t("ครึ่งแรก", "First Half"),
-            2: self._t("ครึ่งหลัง", "Second Half"),
-            3: self._t("ต่อเวลาครึ่งแรก", "Extra Time First Half"),
-            4: self._t("ต่อเวลาครึ่งหลัง", "Extra Time Second Half")
-        }
+        half_names = self._get_half_names()
+        
+        half_text = self._t('ครึ่ง', 'Half')
+        events_in_text = self._get_th_text("จำนวนเหตุการณ์ใน", "Events in")
         
-        all_halves = sorted(set(e.half for e in events))
+        all_halves = sorted(halves)
         for half_num in all_halves:
-            team_a_half = len([e for e in team_a_events if e.half == half_num])
-            team_b_half = len([e for e in team_b_events if e.half == half_num])
+            team_a_half = a_stats['by_half'][half_num]
+            team_b_half = b_stats['by_half'][half_num]
             diff = team_a_half - team_b_half
-            half_name = half_names.get(half_num, f"{self._t('ครึ่ง', 'Half')} {half_num}")
+            half_name = half_names.get(half_num, f"{half_text} {half_num}")
             
             comparison_data.append({
-                self._t('ตัวแปร', 'Variable'): f'{self._get_th_text("จำนวนเหตุการณ์ใน", "Events in")} {half_name}',
+                variable_col: f'{events_in_text} {half_name}',
                 team_a: team_a_half,
                 team_b: team_b_half,
-                self._t('ความแตกต่าง', 'Difference'): diff,
-                self._t('ทีมที่มากกว่า', 'Team with More'): team_a if diff > 0 else (team_b if diff < 0 else equal_text)
+                difference_col: diff,
+                more_col: team_a if diff > 0 else (team_b if diff < 0 else equal_text)
             })
         
         # === ส่วนที่ 5: สถิติเปรียบเทียบ ===
         # Average events per minute
         if events:
-            times = [e.timestamp for e in events]
-            total_time = max(times) - min(times) if times else 1
+            # Events are kept sorted by timestamp
+            total_time = events[-1].timestamp - events[0].timestamp
             minutes = total_time / 60 if total_time > 0 else 1
             
-            team_a_per_min = len(team_a_events) / minutes if minutes > 0 else 0
-            team_b_per_min = len(team_b_events) / minutes if minutes > 0 else 0
+            team_a_per_min = team_a_total / minutes if minutes > 0 else 0
+            team_b_per_min = team_b_total / minutes if minutes > 0 else 0
             
             comparison_data.append({
-                self._t('ตัวแปร', 'Variable'): self._get_th_text('จำนวนเหตุการณ์ต่อนาที', 'Events per Minute'),
+                variable_col: self._get_th_text('จำนวนเหตุการณ์ต่อนาที', 'Events per Minute'),
                 team_a: f"{team_a_per_min:.2f}",
                 team_b: f"{team_b_per_min:.2f}",
-                self._t('ความแตกต่าง', 'Difference'): f"{team_a_per_min - team_b_per_min:.2f}",
-                self._t('ทีมที่มากกว่า', 'Team with More'): team_a if team_a_per_min > team_b_per_min else (team_b if team_b_per_min > team_a_per_min else equal_text)
+                difference_col: f"{team_a_per_min - team_b_per_min:.2f}",
+                more_col: team_a if team_a_per_min > team_b_per_min else (team_b if team_b_per_min > team_a_per_min else equal_text)
             })
             
             # Calculate overall success rate (across all event types)
-            team_a_total_successful = 0
-            team_a_total_attempts = 0
-            team_b_total_successful = 0
-            team_b_total_attempts = 0
-            
-            for event_type in all_event_types:
-                # ใช้ logic เดียวกันกับ _is_successful_outcome/_is_unsuccessful_outcome เพื่อความสอดคล้อง
-                team_a_events_of_type = [e for e in team_a_events if e.event_type == event_type]
-                team_a_successful = len([e for e in team_a_events_of_type 
-                                        if e.outcome and self._is_successful_outcome(event_type, e.outcome)])
-                team_a_unsuccessful = len([e for e in team_a_events_of_type 
-                                          if e.outcome and self._is_unsuccessful_outcome(event_type, e.outcome)])
-                
-                team_b_events_of_type = [e for e in team_b_events if e.event_type == event_type]
-                team_b_successful = len([e for e in team_b_events_of_type 
-                                        if e.outcome and self._is_successful_outcome(event_type, e.outcome)])
-                team_b_unsuccessful = len([e for e in team_b_events_of_type 
-                                          if e.outcome and self._is_unsuccessful_outcome(event_type, e.outcome)])
-                
-                team_a_total_successful += team_a_successful
-                team_a_total_attempts += (team_a_successful + team_a_unsuccessful)
-                team_b_total_successful += team_b_successful
-                team_b_total_attempts += (team_b_successful + team_b_unsuccessful)
+            team_a_total_successful = sum(a_stats['successful'].values())
+            team_a_total_attempts = team_a_total_successful + sum(a_stats['unsuccessful'].values())
+            team_b_total_successful = sum(b_stats['successful'].values())
+            team_b_total_attempts = team_b_total_successful + sum(b_stats['unsuccessful'].values())
             
             if team_a_total_attempts > 0 or team_b_total_attempts > 0:
                 team_a_overall_rate = (team_a_total_successful / team_a_total_attempts * 100) if team_a_total_attempts > 0 else 0
                 team_b_overall_rate = (team_b_total_successful / team_b_total_attempts * 100) if team_b_total_attempts > 0 else 0
                 
                 comparison_data.append({
-                    self._t('ตัวแปร', 'Variable'): self._get_th_text('อัตราความสำเร็จรวม (ทุกประเภท)', 'Overall Success Rate (All Types)'),
+                    variable_col: self._get_th_text('อัตราความสำเร็จรวม (ทุกประเภท)', 'Overall Success Rate (All Types)'),
                     team_a: f"{team_a_total_successful}/{team_a_total_attempts} ({team_a_overall_rate:.1f}%)" if team_a_total_attempts > 0 else "-",
                     team_b: f"{team_b_total_successful}/{team_b_total_attempts} ({team_b_overall_rate:.1f}%)" if team_b_total_attempts > 0 else "-",
-                    self._t('ความแตกต่าง', 'Difference'): f"{team_a_overall_rate - team_b_overall_rate:.1f}%" if team_a_total_attempts > 0 and team_b_total_attempts > 0 else "-",
-                    self._t('ทีมที่มากกว่า', 'Team with More'): team_a if team_a_overall_rate > team_b_overall_rate else (team_b if team_b_overall_rate > team_a_overall_rate else equal_text) if team_a_total_attempts > 0 and team_b_total_attempts > 0 else '-'
+                    difference_col: f"{team_a_overall_rate - team_b_overall_rate:.1f}%" if team_a_total_attempts > 0 and team_b_total_attempts > 0 else "-",
+                    more_col: team_a if team_a_overall_rate > team_b_overall_rate else (team_b if team_b_overall_rate > team_a_overall_rate else equal_text) if team_a_total_attempts > 0 and team_b_total_attempts > 0 else '-'
                 })
         
         # Most common event type for each team
-        team_a_event_counts = {}
-        team_b_event_counts = {}
-        
-        for e in team_a_events:
-            team_a_event_counts[e.event_type] = team_a_event_counts.get(e.event_type, 0) + 1
+        team_a_event_counts = a_stats['by_type']
+        team_b_event_counts = b_stats['by_type']
         
-        for e in team_b_events:
-            team_b_event_counts[e.event_type] = team_b_event_counts.get(e.event_type, 0) + 1
-        
-        team_a_most_common = max(team_a_event_counts.items(), key=lambda x: x[1])[0] if team_a_event_counts else '-'
-        team_b_most_common = max(team_b_event_counts.items(), key=lambda x: x[1])[0] if team_b_event_counts else '-'
+        # most_common() breaks ties by first occurrence, like max() did
+        team_a_most_common = team_a_event_counts.most_common(1)[0][0] if team_a_event_counts else '-'
+        team_b_most_common = team_b_event_counts.most_common(1)[0][0] if team_b_event_counts else '-'
         
         # Translate most common event types
         team_a_most_common_translated = self._t(team_a_most_common, team_a_most_common) if team_a_most_common != '-' else '-'
         team_b_most_common_translated = self._t(team_b_most_common, team_b_most_common) if team_b_most_common != '-' else '-'
         
         comparison_data.append({
-            self._t('ตัวแปร', 'Variable'): self._get_th_text('ประเภทเหตุการณ์ที่เกิดขึ้นบ่อยที่สุด', 'Most Common Event Type'),
+            variable_col: self._get_th_text('ประเภทเหตุการณ์ที่เกิดขึ้นบ่อยที่สุด', 'Most Common Event Type'),
             team_a: team_a_most_common_translated,
             team_b: team_b_most_common_translated,
-            self._t('ความแตกต่าง', 'Difference'): '-',
-            self._t('ทีมที่มากกว่า', 'Team with More'): '-'
+            difference_col: '-',
+            more_col: '-'
         })
         
         df_comparison = pd.DataFrame(comparison_data)
@@ -1014,85 +1096,69 @@ class ManualTrackingData:
             df_comparison.columns = translated_columns
         return df_comparison
     
+    def _append_sheet_rows(self, writer, sheet_name: str, df: pd.DataFrame):
+        """Write a DataFrame as a header row plus plain rows (same cell values as to_excel)"""
+        ws = writer.book.create_sheet(sheet_name)
+        ws.append(list(df.columns))
+        # tolist() yields native Python values; missing values are written as "" like to_excel does
+        columns = [[value if pd.notna(value) else "" for value in df[col].tolist()] for col in df.columns]
+        for row in zip(*columns):
+            ws.append(row)
+    
     def _apply_sheet_styling(self, writer, sheet_name: str):
         """Apply beautiful styling to a sheet: auto-adjust columns, colors, borders, etc."""
+        if not OPENPYXL_AVAILABLE:
+            return
         try:
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-            from openpyxl.utils import get_column_letter
-            
             wb = writer.book
             if sheet_name not in wb.sheetnames:
                 return
             
             ws = wb[sheet_name]
             
-            # Style definitions
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF", size=11)
-            border = Border(
-                left=Side(style='thin', color='CCCCCC'),
-                right=Side(style='thin', color='CCCCCC'),
-                top=Side(style='thin', color='CCCCCC'),
-                bottom=Side(style='thin', color='CCCCCC')
-            )
-            center_align = Alignment(horizontal='center', vertical='center')
-            left_align = Alignment(horizontal='left', vertical='center')
-            
-            # Style header row (row 1)
-            if ws.max_row > 0:
-                for col in range(1, ws.max_column + 1):
-                    cell = ws.cell(row=1, column=col)
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = center_align
-                    cell.border = border
-                
-                # Apply alternating row colors and borders to data rows
-                light_fill = PatternFill(start_color="F8F9FA", end_color="F8F9FA", fill_type="solid")
-                white_fill = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")
-                
-                for row in range(2, ws.max_row + 1):
-                    is_even = (row % 2 == 0)
-                    fill_color = light_fill if is_even else white_fill
-                    
-                    for col in range(1, ws.max_column + 1):
-                        cell = ws.cell(row=row, column=col)
+            # Style every row and probe column widths in one iter_rows walk;
+            # the dimensions are read once since they do not change here
+            max_row, max_column = ws.max_row, ws.max_column
+            max_lengths = [0] * max_column
+            rows = ws.iter_rows(min_row=1, max_row=max_row, max_col=max_column)
+            for row, cells in enumerate(rows, start=1):
+                if row == 1:
+                    # Style header row (row 1)
+                    for cell in cells:
+                        cell.fill = HEADER_FILL
+                        cell.font = HEADER_FONT
+                        cell.alignment = CENTER_ALIGN
+                        cell.border = CELL_BORDER
+                else:
+                    fill_color = LIGHT_ROW_FILL if row % 2 == 0 else WHITE_ROW_FILL
+                    for cell in cells:
                         cell.fill = fill_color
-                        cell.border = border
+                        cell.border = CELL_BORDER
                         
                         # Auto-align based on data type
                         if cell.value is not None:
                             # Check if cell contains formula
                             if cell.data_type == 'f':  # Formula
-                                cell.alignment = center_align
+                                cell.alignment = CENTER_ALIGN
                             elif isinstance(cell.value, (int, float)):
-                                cell.alignment = center_align
+                                cell.alignment = CENTER_ALIGN
                             else:
-                                cell.alignment = left_align
+                                cell.alignment = LEFT_ALIGN
+                
+                # Check header and data cells (limit to first 100 rows for performance)
+                if row <= 101:
+                    for col, cell in enumerate(cells):
+                        if cell.value:
+                            try:
+                                max_lengths[col] = max(max_lengths[col], len(str(cell.value)))
+                            except:
+                                pass
             
             # Auto-adjust column widths
-            for col in range(1, ws.max_column + 1):
-                column_letter = get_column_letter(col)
-                max_length = 0
-                
-                # Check header
-                header_cell = ws.cell(row=1, column=col)
-                if header_cell.value:
-                    max_length = len(str(header_cell.value))
-                
-                # Check data cells (limit to first 100 rows for performance)
-                for row in range(2, min(ws.max_row + 1, 102)):
-                    cell = ws.cell(row=row, column=col)
-                    if cell.value:
-                        try:
-                            cell_length = len(str(cell.value))
-                            max_length = max(max_length, cell_length)
-                        except:
-                            pass
-                
+            for col, max_length in enumerate(max_lengths, start=1):
                 # Set width with some padding (min 10, max 50)
                 adjusted_width = min(max(max_length + 2, 10), 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+                ws.column_dimensions[get_column_letter(col)].width = adjusted_width
             
             # Freeze header row
             ws.freeze_panes = 'A2'
@@ -1101,138 +1167,120 @@ class ManualTrackingData:
             # If styling fails, just continue without it
             pass
     
-    def _add_timeline_sheet(self, writer):
-        """Add timeline sheet showing all events in chronological order"""
+    def _build_timeline_sheet(self) -> Optional[pd.DataFrame]:
+        """Build timeline sheet showing all events in chronological order"""
         if not self.events:
-            return
-        
-        timeline_data = []
-        for event in sorted(self.events, key=lambda x: x.timestamp):
-            minutes = int(event.timestamp // 60)
-            seconds = int(event.timestamp % 60)
-            half_names = {
-                1: self._t("ครึ่งแรก", "First Half"),
-                2: self._t("ครึ่งหลัง", "Second Half"),
-                3: self._t("ต่อเวลาครึ่งแรก", "Extra Time First Half"),
-                4: self._t("ต่อเวลาครึ่งหลัง", "Extra Time Second Half")
-            }
-            
-            timeline_data.append({
-                self._t('เวลา', 'Time'): f"{minutes:02d}:{seconds:02d}",
-                self._t('เวลา (วินาที)', 'Time (Seconds)'): event.timestamp,
-                self._t('ครึ่ง', 'Half'): half_names.get(event.half, f"{self._t('ครึ่ง', 'Half')} {event.half}"),
-                self._t('เหตุการณ์', 'Event'): self._t(event.event_type, event.event_type),
-                self._t('ผลลัพธ์', 'Outcome'): self._t(event.outcome, event.outcome) if event.outcome else '-',
-                self._t('ทีม', 'Team'): self._t(event.team, event.team) if event.team else '-',
-                self._t('หมายเลขผู้เล่น', 'Player Number'): event.player_number if event.player_number else '-',
-                self._t('ชื่อผู้เล่น', 'Player Name'): event.player_name if event.player_name else '-',
-                self._t('คำอธิบาย', 'Description'): event.description if event.description else '-'
-            })
-        
-        df_timeline = pd.DataFrame(timeline_data)
-        # Get current language to determine sheet name
-        current_lang = self._get_current_language()
-        timeline_sheet = "Timeline" if current_lang == "EN" else "ไทม์ไลน์"
-        df_timeline.to_excel(writer, sheet_name=timeline_sheet, index=False)
+            return None
+        
+        half_names = self._get_half_names()
+        half_text = self._t('ครึ่ง', 'Half')
+        
+        # One list per column; the DataFrame is built once at the end
+        events = sorted(self.events, key=BY_TIMESTAMP)
+        # Translate each distinct value once, then map every row through the dict
+        event_names = {v: self._t(v, v) for v in {e.event_type for e in events}}
+        outcome_names = {v: self._t(v, v) if v else '-' for v in {e.outcome for e in events}}
+        team_names = {v: self._t(v, v) if v else '-' for v in {e.team for e in events}}
+        return pd.DataFrame({
+            self._t('เวลา', 'Time'): format_match_times(events),
+            self._t('เวลา (วินาที)', 'Time (Seconds)'): [e.timestamp for e in events],
+            self._t('ครึ่ง', 'Half'): [half_names.get(e.half, f"{half_text} {e.half}") for e in events],
+            self._t('เหตุการณ์', 'Event'): [event_names[e.event_type] for e in events],
+            self._t('ผลลัพธ์', 'Outcome'): [outcome_names[e.outcome] for e in events],
+            self._t('ทีม', 'Team'): [team_names[e.team] for e in events],
+            self._t('หมายเลขผู้เล่น', 'Player Number'): [e.player_number if e.player_number else '-' for e in events],
+            self._t('ชื่อผู้เล่น', 'Player Name'): [e.player_name if e.player_name else '-' for e in events],
+            self._t('คำอธิบาย', 'Description'): [e.description if e.description else '-' for e in events]
+        })
     
-    def _add_key_moments_sheet(self, writer):
-        """Add key moments sheet (goals, cards, substitutions)"""
+    def _build_key_moments_sheet(self) -> Optional[pd.DataFrame]:
+        """Build key moments sheet (goals, cards, substitutions)"""
         if not self.events:
-            return
-        
-        key_moments = []
-        
-        # Goals - Count all goals from any action with outcome "ประตู"
-        goals = [e for e in self.events if e.outcome == "ประตู"]
-        for goal in sorted(goals, key=lambda x: x.timestamp):
-            minutes = int(goal.timestamp // 60)
-            seconds = int(goal.timestamp % 60)
-            goal_type = f"{self._t('ประตู', 'ประตู')} ({self._t(goal.event_type, goal.event_type)})"  # Show action type
-            key_moments.append({
-                self._t('เวลา', 'เวลา'): f"{minutes:02d}:{seconds:02d}",
-                self._t('ประเภท', 'ประเภท'): goal_type,
-                self._t('ทีม', 'ทีม'): self._t(goal.team, goal.team) if goal.team else '-',
-                self._t('ผู้เล่น', 'ผู้เล่น'): goal.player_name if goal.player_name else (f"#{goal.player_number}" if goal.player_number else '-'),
-                self._t('คำอธิบาย', 'คำอธิบาย'): goal.description if goal.description else '-',
-                self._t('ครึ่ง', 'ครึ่ง'): f"{self._t('ครึ่ง', 'ครึ่ง')} {goal.half}"
-            })
+            return None
+        
+        # One list per column; the DataFrame is built once at the end
+        moments, types, players, descriptions, halves = [], [], [], [], []
+        half_text = self._t('ครึ่ง', 'ครึ่ง')
+        
+        def add_moment(event, moment_type, description):
+            moments.append(event)
+            types.append(moment_type)
+            players.append(event.player_name if event.player_name else (f"#{event.player_number}" if event.player_number else '-'))
+            descriptions.append(description)
+            halves.append(f"{half_text} {event.half}")
+        
+        # self.events is kept sorted by timestamp, so one pass buckets every
+        # section already in time order
+        goals, substitutions = [], []
+        yellow_events, yellow_fouls, red_events, red_fouls = [], [], [], []
+        for e in self.events:
+            # Goals - Count all goals from any action with outcome "ประตู"
+            if e.outcome == "ประตู":
+                goals.append(e)
+            if e.event_type == "ใบเหลือง":
+                yellow_events.append(e)
+            elif e.event_type == "ใบแดง":
+                red_events.append(e)
+            elif e.event_type == "เปลี่ยนตัว":
+                substitutions.append(e)
+            elif e.event_type == "ฟาวล์":
+                if e.outcome == "ใบเหลือง":
+                    yellow_fouls.append(e)
+                elif e.outcome == "ใบแดง":
+                    red_fouls.append(e)
+        
+        # Card events come before fouls carded at the same time (merge is stable)
+        yellow_cards = merge(yellow_events, yellow_fouls, key=BY_TIMESTAMP)
+        red_cards = merge(red_events, red_fouls, key=BY_TIMESTAMP)
+        
+        goal_text = self._t('ประตู', 'ประตู')
+        for goal in goals:
+            goal_type = f"{goal_text} ({self._t(goal.event_type, goal.event_type)})"  # Show action type
+            add_moment(goal, goal_type, goal.description if goal.description else '-')
         
         # Yellow cards
-        yellow_cards = []
-        all_yellow = [e for e in self.events if e.event_type == "ใบเหลือง"]
-        all_yellow_from_fouls = [e for e in self.events if e.event_type == "ฟาวล์" and e.outcome == "ใบเหลือง"]
-        yellow_cards = all_yellow + all_yellow_from_fouls
-        
-        for card in sorted(yellow_cards, key=lambda x: x.timestamp):
-            minutes = int(card.timestamp // 60)
-            seconds = int(card.timestamp % 60)
-            key_moments.append({
-                self._t('เวลา', 'เวลา'): f"{minutes:02d}:{seconds:02d}",
-                self._t('ประเภท', 'ประเภท'): self._t('ใบเหลือง', 'ใบเหลือง'),
-                self._t('ทีม', 'ทีม'): self._t(card.team, card.team) if card.team else '-',
-                self._t('ผู้เล่น', 'ผู้เล่น'): card.player_name if card.player_name else (f"#{card.player_number}" if card.player_number else '-'),
-                self._t('คำอธิบาย', 'คำอธิบาย'): card.description if card.description else '-',
-                self._t('ครึ่ง', 'ครึ่ง'): f"{self._t('ครึ่ง', 'ครึ่ง')} {card.half}"
-            })
+        yellow_text = self._t('ใบเหลือง', 'ใบเหลือง')
+        for card in yellow_cards:
+            add_moment(card, yellow_text, card.description if card.description else '-')
         
         # Red cards
-        red_cards = []
-        all_red = [e for e in self.events if e.event_type == "ใบแดง"]
-        all_red_from_fouls = [e for e in self.events if e.event_type == "ฟาวล์" and e.outcome == "ใบแดง"]
-        red_cards = all_red + all_red_from_fouls
-        
-        for card in sorted(red_cards, key=lambda x: x.timestamp):
-            minutes = int(card.timestamp // 60)
-            seconds = int(card.timestamp % 60)
-            key_moments.append({
-                self._t('เวลา', 'เวลา'): f"{minutes:02d}:{seconds:02d}",
-                self._t('ประเภท', 'ประเภท'): self._t('ใบแดง', 'ใบแดง'),
-                self._t('ทีม', 'ทีม'): self._t(card.team, card.team) if card.team else '-',
-                self._t('ผู้เล่น', 'ผู้เล่น'): card.player_name if card.player_name else (f"#{card.player_number}" if card.player_number else '-'),
-                self._t('คำอธิบาย', 'คำอธิบาย'): card.description if card.description else '-',
-                self._t('ครึ่ง', 'ครึ่ง'): f"{self._t('ครึ่ง', 'ครึ่ง')} {card.half}"
-            })
+        red_text = self._t('ใบแดง', 'ใบแดง')
+        for card in red_cards:
+            add_moment(card, red_text, card.description if card.description else '-')
         
         # Substitutions
-        substitutions = [e for e in self.events if e.event_type == "เปลี่ยนตัว"]
-        for sub in sorted(substitutions, key=lambda x: x.timestamp):
-            minutes = int(sub.timestamp // 60)
-            seconds = int(sub.timestamp % 60)
-            key_moments.append({
-                self._t('เวลา', 'เวลา'): f"{minutes:02d}:{seconds:02d}",
-                self._t('ประเภท', 'ประเภท'): self._t('เปลี่ยนตัว', 'เปลี่ยนตัว'),
-                self._t('ทีม', 'ทีม'): self._t(sub.team, sub.team) if sub.team else '-',
-                self._t('ผู้เล่น', 'ผู้เล่น'): sub.player_name if sub.player_name else (f"#{sub.player_number}" if sub.player_number else '-'),
-                self._t('คำอธิบาย', 'คำอธิบาย'): sub.description if sub.description else (self._t(sub.outcome, sub.outcome) if sub.outcome else '-'),
-                self._t('ครึ่ง', 'ครึ่ง'): f"{self._t('ครึ่ง', 'ครึ่ง')} {sub.half}"
-            })
-        
-        if key_moments:
-            df_key_moments = pd.DataFrame(key_moments)
-            key_moments_sheet = self._t('ช่วงเวลาสำคัญ', 'ช่วงเวลาสำคัญ')
-            df_key_moments.to_excel(writer, sheet_name=key_moments_sheet, index=False)
+        sub_text = self._t('เปลี่ยนตัว', 'เปลี่ยนตัว')
+        for sub in substitutions:
+            add_moment(sub, sub_text, sub.description if sub.description else (self._t(sub.outcome, sub.outcome) if sub.outcome else '-'))
+        
+        if not moments:
+            return None
+        
+        # Translate each distinct team once, then map every row through the dict
+        team_names = {v: self._t(v, v) if v else '-' for v in {e.team for e in moments}}
+        return pd.DataFrame({
+            self._t('เวลา', 'เวลา'): format_match_times(moments),
+            self._t('ประเภท', 'ประเภท'): types,
+            self._t('ทีม', 'ทีม'): [team_names[e.team] for e in moments],
+            self._t('ผู้เล่น', 'ผู้เล่น'): players,
+            self._t('คำอธิบาย', 'คำอธิบาย'): descriptions,
+            self._t('ครึ่ง', 'ครึ่ง'): halves
+        })
     
-    def _add_event_frequency_sheet(self, writer):
-        """Add event frequency analysis by time periods"""
+    def _build_event_frequency_sheet(self) -> Optional[pd.DataFrame]:
+        """Build event frequency analysis by time periods"""
         if not self.events:
-            return
-        
-        # Get current language to determine sheet name
-        current_lang = self._get_current_language()
-        event_freq_sheet = "Event Frequency" if current_lang == "EN" else "ความถี่เหตุการณ์"
+            return None
         
-        # Get time range
-        times = [e.timestamp for e in self.events]
-        if not times:
-            return
-        
-        min_time = min(times)
-        max_time = max(times)
-        total_duration = max_time - min_time
+        # Get time range - events are kept sorted by timestamp, so the
+        # offsets from the first event are sorted too and can be bisected
+        events = self.events
+        min_time = events[0].timestamp
+        offsets = [e.timestamp - min_time for e in events]
+        total_duration = offsets[-1]
         
         # Divide into 10-minute periods
         period_minutes = 10
-        periods = []
         current_time = 0
         
         # Get all unique event types (limit to most common ones to avoid too many columns)
@@ -1244,140 +1292,151 @@ class ManualTrackingData:
         if len(all_event_types) <= 15:
             event_types_to_track = all_event_types
         
+        # One list per column; the DataFrame is built once at the end
+        period_labels, start_minutes, end_minutes, totals = [], [], [], []
+        type_counts = {et: [] for et in event_types_to_track}
         while current_time <= total_duration:
             period_start = current_time
             period_end = min(current_time + period_minutes * 60, total_duration)
             
-            period_events = [e for e in self.events 
-                           if period_start <= (e.timestamp - min_time) <= period_end]
+            # Slice of events with period_start <= offset <= period_end
+            period_events = events[bisect_left(offsets, period_start):bisect_right(offsets, period_end)]
             
-            event_counts = {}
-            for event in period_events:
-                event_type = event.event_type
-                event_counts[event_type] = event_counts.get(event_type, 0) + 1
+            event_counts = Counter(e.event_type for e in period_events)
             
-            period_data = {
-                self._t('ช่วงเวลา', 'Time Period'): f"{int(period_start // 60)}:00 - {int(period_end // 60)}:00",
-                self._t('เวลาเริ่มต้น (นาที)', 'Start Time (Minutes)'): int(period_start // 60),
-                self._t('เวลาสิ้นสุด (นาที)', 'End Time (Minutes)'): int(period_end // 60),
-                self._t('จำนวนเหตุการณ์ทั้งหมด', 'Total Events'): len(period_events)
-            }
+            period_labels.append(f"{int(period_start // 60)}:00 - {int(period_end // 60)}:00")
+            start_minutes.append(int(period_start // 60))
+            end_minutes.append(int(period_end // 60))
+            totals.append(len(period_events))
             
             # Add counts for tracked event types
-            for et in event_types_to_track:
-                translated_et = self._t(et, et)
-                period_data[f'{self._t("จำนวน", "Number of")} {translated_et}'] = event_counts.get(et, 0)
-            
-            periods.append(period_data)
+            for et, counts in type_counts.items():
+                counts.append(event_counts[et])
             
             current_time += period_minutes * 60
         
-        if periods:
-            df_frequency = pd.DataFrame(periods)
-            df_frequency.to_excel(writer, sheet_name=event_freq_sheet, index=False)
+        if not period_labels:
+            return None
+        
+        columns = {
+            self._t('ช่วงเวลา', 'Time Period'): period_labels,
+            self._t('เวลาเริ่มต้น (นาที)', 'Start Time (Minutes)'): start_minutes,
+            self._t('เวลาสิ้นสุด (นาที)', 'End Time (Minutes)'): end_minutes,
+            self._t('จำนวนเหตุการณ์ทั้งหมด', 'Total Events'): totals
+        }
+        number_of_text = self._t("จำนวน", "Number of")
+        for et, counts in type_counts.items():
+            columns[f'{number_of_text} {self._t(et, et)}'] = counts
+        
+        return pd.DataFrame(columns)
     
-    def _add_set_pieces_sheet(self, writer):
-        """Add set pieces summary (corners, free kicks, penalties)"""
+    def _build_set_pieces_sheet(self) -> Optional[pd.DataFrame]:
+        """Build set pieces summary (corners, free kicks, penalties)"""
         if not self.events:
-            return
+            return None
         
-        set_piece_types = ["เตะมุม", "ฟรีคิก", "ลูกโทษ"]
-        set_pieces = [e for e in self.events if e.event_type in set_piece_types]
+        set_pieces = [e for e in self.events if e.event_type in SET_PIECE_TYPES]
         
         if not set_pieces:
-            return
+            return None
+        
+        # Column keys resolved once and shared by every row dict
+        time_col = self._t('เวลา', 'เวลา')
+        type_col = self._t('ประเภท', 'ประเภท')
+        outcome_col = self._t('ผลลัพธ์', 'ผลลัพธ์')
+        team_col = self._t('ทีม', 'ทีม')
+        number_col = self._t('หมายเลขผู้เล่น', 'หมายเลขผู้เล่น')
+        name_col = self._t('ชื่อผู้เล่น', 'ชื่อผู้เล่น')
+        half_col = self._t('ครึ่ง', 'ครึ่ง')
+        description_col = self._t('คำอธิบาย', 'คำอธิบาย')
         
         set_pieces_data = []
-        for event in sorted(set_pieces, key=lambda x: x.timestamp):
-            minutes = int(event.timestamp // 60)
-            seconds = int(event.timestamp % 60)
-            half_names = {
-                1: self._t("ครึ่งแรก", "First Half"),
-                2: self._t("ครึ่งหลัง", "Second Half"),
-                3: self._t("ต่อเวลาครึ่งแรก", "Extra Time First Half"),
-                4: self._t("ต่อเวลาครึ่งหลัง", "Extra Time Second Half")
-            }
-            
+        half_names = self._get_half_names()
+        # Translate each distinct value once, then map every row through the dict
+        type_names = {v: self._t(v, v) for v in {e.event_type for e in set_pieces}}
+        outcome_names = {v: self._t(v, v) if v else '-' for v in {e.outcome for e in set_pieces}}
+        team_names = {v: self._t(v, v) if v else '-' for v in {e.team for e in set_pieces}}
+        set_pieces = sorted(set_pieces, key=BY_TIMESTAMP)
+        for event, clock in zip(set_pieces, format_match_times(set_pieces)):
             set_pieces_data.append({
-                self._t('เวลา', 'เวลา'): f"{minutes:02d}:{seconds:02d}",
-                self._t('ประเภท', 'ประเภท'): self._t(event.event_type, event.event_type),
-                self._t('ผลลัพธ์', 'ผลลัพธ์'): self._t(event.outcome, event.outcome) if event.outcome else '-',
-                self._t('ทีม', 'ทีม'): self._t(event.team, event.team) if event.team else '-',
-                self._t('หมายเลขผู้เล่น', 'หมายเลขผู้เล่น'): event.player_number if event.player_number else '-',
-                self._t('ชื่อผู้เล่น', 'ชื่อผู้เล่น'): event.player_name if event.player_name else '-',
-                self._t('ครึ่ง', 'ครึ่ง'): half_names.get(event.half, f"{self._t('ครึ่ง', 'ครึ่ง')} {event.half}"),
-                self._t('คำอธิบาย', 'คำอธิบาย'): event.description if event.description else '-'
+                time_col: clock,
+                type_col: type_names[event.event_type],
+                outcome_col: outcome_names[event.outcome],
+                team_col: team_names[event.team],
+                number_col: event.player_number if event.player_number else '-',
+                name_col: event.player_name if event.player_name else '-',
+                half_col: half_names.get(event.half, f"{half_col} {event.half}"),
+                description_col: event.description if event.description else '-'
             })
         
-        df_set_pieces = pd.DataFrame(set_pieces_data)
-        set_pieces_sheet = self._t('ลูกตั้งเตะ', 'ลูกตั้งเตะ')
-        df_set_pieces.to_excel(writer, sheet_name=set_pieces_sheet, index=False)
+        return pd.DataFrame(set_pieces_data)
     
-    def _add_player_performance_sheet(self, writer):
-        """Add player performance statistics"""
+    def _build_player_performance_sheet(self) -> Optional[pd.DataFrame]:
+        """Build player performance statistics"""
         if not self.events:
-            return
+            return None
         
         # Get teams
-        teams = sorted(set(e.team for e in self.events if e.team and e.team != "กลาง"))
+        teams = self.get_teams()
         if not teams:
-            return
+            return None
         
-        player_stats = {}
+        # Use player_number as key, fallback to player_name
+        player_events = [e for e in self.events if e.player_number or e.player_name]
+        if not player_events:
+            return None
         
-        for event in self.events:
-            if not event.player_number and not event.player_name:
-                continue
-            
-            # Use player_number as key, fallback to player_name
-            player_key = f"#{event.player_number}" if event.player_number else event.player_name
-            team = event.team if event.team else self._t("ไม่ระบุ", "Not Specified")
-            
-            if player_key not in player_stats:
-                player_stats[player_key] = {
-                    self._t('ชื่อผู้เล่น', 'Player Name'): event.player_name if event.player_name else player_key,
-                    self._t('หมายเลข', 'Number'): event.player_number if event.player_number else '-',
-                    self._t('ทีม', 'Team'): team,
-                    self._t('จำนวนเหตุการณ์', 'Total Events'): 0,
-                    self._t('ประตู', 'Goals'): 0,
-                    self._t('แอสซิสต์', 'Assists'): 0,
-                    self._t('ใบเหลือง', 'Yellow Cards'): 0,
-                    self._t('ใบแดง', 'Red Cards'): 0,
-                    self._t('ฟาวล์', 'Fouls'): 0
-                }
-            
-            player_stats[player_key][self._t('จำนวนเหตุการณ์', 'Total Events')] += 1
-            
-            # Count specific events
-            # Count goals from any action with outcome "ประตู" (not just "ยิง")
-            if event.outcome == "ประตู":
-                player_stats[player_key][self._t('ประตู', 'Goals')] += 1
-            elif event.outcome == "แอสซิสต์":
-                player_stats[player_key][self._t('แอสซิสต์', 'Assists')] += 1
-            elif event.event_type == "ใบเหลือง" or (event.event_type == "ฟาวล์" and event.outcome == "ใบเหลือง"):
-                player_stats[player_key][self._t('ใบเหลือง', 'Yellow Cards')] += 1
-            elif event.event_type == "ใบแดง" or (event.event_type == "ฟาวล์" and event.outcome == "ใบแดง"):
-                player_stats[player_key][self._t('ใบแดง', 'Red Cards')] += 1
-            elif event.event_type == "ฟาวล์":
-                player_stats[player_key][self._t('ฟาวล์', 'Fouls')] += 1
-        
-        if player_stats:
-            player_data = list(player_stats.values())
-            df_players = pd.DataFrame(player_data)
-            # Sort by team, then by goals, then by events
-            team_col = self._t('ทีม', 'Team')
-            goals_col = self._t('ประตู', 'Goals')
-            events_col = self._t('จำนวนเหตุการณ์', 'Total Events')
-            df_players = df_players.sort_values([team_col, goals_col, events_col], ascending=[True, False, False])
-            player_stats_sheet = self._t('สถิติผู้เล่น', 'Player Statistics')
-            df_players.to_excel(writer, sheet_name=player_stats_sheet, index=False)
+        df = pd.DataFrame({
+            'player_key': [f"#{e.player_number}" if e.player_number else e.player_name for e in player_events],
+            'event_type': [e.event_type for e in player_events],
+            'outcome': [e.outcome for e in player_events]
+        })
+        event_type = df['event_type']
+        outcome = df['outcome']
+        
+        # Each event counts towards at most one stat, checked in this order
+        # Count goals from any action with outcome "ประตู" (not just "ยิง")
+        is_goal = outcome.eq("ประตู")
+        is_assist = ~is_goal & outcome.eq("แอสซิสต์")
+        counted = is_goal | is_assist
+        is_yellow = ~counted & (event_type.eq("ใบเหลือง") | (event_type.eq("ฟาวล์") & outcome.eq("ใบเหลือง")))
+        counted |= is_yellow
+        is_red = ~counted & (event_type.eq("ใบแดง") | (event_type.eq("ฟาวล์") & outcome.eq("ใบแดง")))
+        counted |= is_red
+        is_foul = ~counted & event_type.eq("ฟาวล์")
+        
+        # One groupby for every count; sort=False keeps players in first-seen order
+        team_col = self._t('ทีม', 'Team')
+        goals_col = self._t('ประตู', 'Goals')
+        events_col = self._t('จำนวนเหตุการณ์', 'Total Events')
+        counts = pd.DataFrame({
+            events_col: 1,
+            goals_col: is_goal,
+            self._t('แอสซิสต์', 'Assists'): is_assist,
+            self._t('ใบเหลือง', 'Yellow Cards'): is_yellow,
+            self._t('ใบแดง', 'Red Cards'): is_red,
+            self._t('ฟาวล์', 'Fouls'): is_foul
+        }).groupby(df['player_key'], sort=False).sum()
+        
+        # Name, number and team come from each player's first event
+        first_events = [player_events[i] for i in df.drop_duplicates('player_key').index]
+        not_specified = self._t("ไม่ระบุ", "Not Specified")
+        df_players = pd.DataFrame({
+            self._t('ชื่อผู้เล่น', 'Player Name'): [e.player_name if e.player_name else key for e, key in zip(first_events, counts.index)],
+            self._t('หมายเลข', 'Number'): [e.player_number if e.player_number else '-' for e in first_events],
+            team_col: [e.team if e.team else not_specified for e in first_events]
+        })
+        for col in counts.columns:
+            df_players[col] = counts[col].to_numpy()
+        
+        # Sort by team, then by goals, then by events
+        return df_players.sort_values([team_col, goals_col, events_col], ascending=[True, False, False])
     
     def _add_professional_statistics_sheet(self, writer):
         """Add professional statistics sheet with formulas for advanced analysis"""
+        if not OPENPYXL_AVAILABLE:
+            return
         try:
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-            from openpyxl.utils import get_column_letter
-            
             # Get current language to ensure consistent translation
             current_lang = self._get_current_language()
             
@@ -1419,7 +1478,7 @@ class ManualTrackingData:
             ws = wb.create_sheet(stats_sheet_name, 0)  # Insert at beginning
             
             # Get teams
-            teams = sorted(set(e.team for e in self.events if e.team != "กลาง"))
+            teams = self.get_teams()
             if len(teams) != 2:
                 # If not 2 teams, create basic stats
                 ws['A1'] = stats_sheet_name
@@ -1428,81 +1487,101 @@ class ManualTrackingData:
                 return
             
             team_a, team_b = teams[0], teams[1]
-            # Filter events by team - use exact match and handle None/empty team values
-            # Also handle case where team might be stored as string with different formatting
-            # Use normalized string comparison (strip whitespace, case-insensitive)
-            team_a_events = [e for e in self.events 
-                           if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()]
-            team_b_events = [e for e in self.events 
-                           if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()]
-            
-            # Style definitions
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF", size=11)
-            title_font = Font(bold=True, size=14)
-            border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            center_align = Alignment(horizontal='center', vertical='center')
+            # Count events once by team -> event type -> outcome; every stat below is
+            # read from these counts instead of re-filtering self.events
+            # Teams are matched by normalized name (strip whitespace, case-insensitive)
+            # and events with None/empty team values are skipped
+            # The raw (team, type, outcome) triples are counted first, so each team
+            # name is normalized once per distinct triple rather than once per event
+            raw_counts = Counter((e.team, e.event_type, e.outcome) for e in self.events)
+            team_counts = defaultdict(lambda: defaultdict(Counter))
+            for (team, event_type, outcome), count in raw_counts.items():
+                if team:
+                    team_counts[str(team).strip().lower()][event_type][outcome] += count
+            team_a_counts = team_counts[str(team_a).strip().lower()]
+            team_b_counts = team_counts[str(team_b).strip().lower()]
+            
+            def count_events(counts, event_types, outcomes=None):
+                """Count a team's events of the given types, optionally only with the given outcomes"""
+                if outcomes is None:
+                    return sum(sum(counts[event_type].values()) for event_type in event_types)
+                return sum(counts[event_type][outcome] for event_type in event_types for outcome in outcomes)
+            
+            # Sheet writers; every cell shares the module-level style objects
+            def write_section(row, title, fill=STATS_SECTION_FILL):
+                """Write a merged section title row"""
+                ws.merge_cells(f'A{row}:F{row}')
+                cell = ws.cell(row=row, column=1, value=title)
+                cell.font = STATS_SECTION_FONT
+                cell.fill = fill
+            
+            def write_stat_row(row, stat_name, val_a, val_b, percentage, bold=False):
+                """Write one stat row: team values, difference, percentage and leading team"""
+                values = (stat_name, val_a, val_b, f'=B{row}-C{row}', percentage,
+                          f'=IF(D{row}>0, "{team_a}", IF(D{row}<0, "{team_b}", "{equal_text}"))')
+                for col, value in enumerate(values, 1):
+                    cell = ws.cell(row=row, column=col, value=value)
+                    cell.border = STATS_BORDER
+                    if bold:
+                        cell.font = BOLD_FONT
+                    if 2 <= col <= 5:
+                        cell.alignment = CENTER_ALIGN
+            
+            def share_formula(row):
+                """Team A's share of the row total, in percent"""
+                return f'=IF(B{row}+C{row}>0, B{row}/(B{row}+C{row})*100, 0)'
+            
+            def write_stat_rows(row, stats):
+                """Write (name, team A, team B) stat rows from the given row; return the next row"""
+                for stat_name, val_a, val_b in stats:
+                    write_stat_row(row, stat_name, val_a, val_b, share_formula(row) if val_a + val_b > 0 else 0)
+                    row += 1
+                return row
             
             # Title
             ws.merge_cells('A1:F1')
-            ws['A1'] = f'{match_analysis_text} {self.match_name}'
-            ws['A1'].font = title_font
-            ws['A1'].alignment = center_align
+            title_cell = ws.cell(row=1, column=1, value=f'{match_analysis_text} {self.match_name}')
+            title_cell.font = STATS_TITLE_FONT
+            title_cell.alignment = CENTER_ALIGN
             
             # Team names row
-            ws['A2'] = variable_text
-            ws['B2'] = team_a
-            ws['C2'] = team_b
-            ws['D2'] = difference_text
-            ws['E2'] = percentage_text
-            ws['F2'] = notes_text
-            
-            for col in ['A2', 'B2', 'C2', 'D2', 'E2', 'F2']:
-                ws[col].fill = header_fill
-                ws[col].font = header_font
-                ws[col].alignment = center_align
-                ws[col].border = border
+            header = (variable_text, team_a, team_b, difference_text, percentage_text, notes_text)
+            for col, value in enumerate(header, 1):
+                cell = ws.cell(row=2, column=col, value=value)
+                cell.fill = HEADER_FILL
+                cell.font = HEADER_FONT
+                cell.alignment = CENTER_ALIGN
+                cell.border = STATS_BORDER
             
             row = 3
             
             # === 1. สถิติการยิง (Shooting Statistics) ===
-            ws.merge_cells(f'A{row}:F{row}')
-            ws[f'A{row}'] = shooting_stats_text
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            ws[f'A{row}'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+            write_section(row, shooting_stats_text)
             row += 1
             
-            # Calculate shooting stats - get all shots first, then filter by team
-            all_shots = [e for e in self.events if e.event_type == "ยิง"]
-            team_a_shots = [e for e in all_shots 
-                          if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()]
-            team_b_shots = [e for e in all_shots 
-                          if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()]
+            # Calculate shooting stats
+            team_a_shots = count_events(team_a_counts, ["ยิง"])
+            team_b_shots = count_events(team_b_counts, ["ยิง"])
             
-            team_a_goals = len([e for e in team_a_shots if e.outcome == "ประตู"])
-            team_b_goals = len([e for e in team_b_shots if e.outcome == "ประตู"])
+            team_a_goals = count_events(team_a_counts, ["ยิง"], ["ประตู"])
+            team_b_goals = count_events(team_b_counts, ["ยิง"], ["ประตู"])
             
-            team_a_shots_on_target = len([e for e in team_a_shots if e.outcome in ["ประตู", "ยิงเข้า"]])
-            team_b_shots_on_target = len([e for e in team_b_shots if e.outcome in ["ประตู", "ยิงเข้า"]])
+            team_a_shots_on_target = count_events(team_a_counts, ["ยิง"], SHOT_ON_TARGET_OUTCOMES)
+            team_b_shots_on_target = count_events(team_b_counts, ["ยิง"], SHOT_ON_TARGET_OUTCOMES)
             
-            team_a_shots_off_target = len([e for e in team_a_shots if e.outcome == "ยิงออก"])
-            team_b_shots_off_target = len([e for e in team_b_shots if e.outcome == "ยิงออก"])
+            team_a_shots_off_target = count_events(team_a_counts, ["ยิง"], ["ยิงออก"])
+            team_b_shots_off_target = count_events(team_b_counts, ["ยิง"], ["ยิงออก"])
             
-            team_a_blocked = len([e for e in team_a_shots if e.outcome == "บล็อก"])
-            team_b_blocked = len([e for e in team_b_shots if e.outcome == "บล็อก"])
+            team_a_blocked = count_events(team_a_counts, ["ยิง"], ["บล็อก"])
+            team_b_blocked = count_events(team_b_counts, ["ยิง"], ["บล็อก"])
             
-            team_a_saved = len([e for e in team_a_shots if e.outcome == "ถูกเซฟ"])
-            team_b_saved = len([e for e in team_b_shots if e.outcome == "ถูกเซฟ"])
+            team_a_saved = count_events(team_a_counts, ["ยิง"], ["ถูกเซฟ"])
+            team_b_saved = count_events(team_b_counts, ["ยิง"], ["ถูกเซฟ"])
             
             # Define shooting stats based on language
             if current_lang == "EN":
                 stats_shooting = [
-                    ('Total Shots', len(team_a_shots), len(team_b_shots)),
+                    ('Total Shots', team_a_shots, team_b_shots),
                     ('Goals', team_a_goals, team_b_goals),
                     ('Shots on Target', team_a_shots_on_target, team_b_shots_on_target),
                     ('Shots off Target', team_a_shots_off_target, team_b_shots_off_target),
@@ -1513,7 +1592,7 @@ class ManualTrackingData:
                 goal_conversion_rate_text = 'Goal Conversion Rate (%)'
             else:  # TH
                 stats_shooting = [
-                    ('จำนวนการยิงทั้งหมด', len(team_a_shots), len(team_b_shots)),
+                    ('จำนวนการยิงทั้งหมด', team_a_shots, team_b_shots),
                     ('จำนวนประตู', team_a_goals, team_b_goals),
                     ('ยิงเข้าเป้า', team_a_shots_on_target, team_b_shots_on_target),
                     ('ยิงออกนอกเป้า', team_a_shots_off_target, team_b_shots_off_target),
@@ -1527,80 +1606,44 @@ class ManualTrackingData:
             row_total_shots = row  # Row for "จำนวนการยิงทั้งหมด"
             row_goals = row + 1    # Row for "จำนวนประตู"
             
-            for stat_name, val_a, val_b in stats_shooting:
-                ws[f'A{row}'] = stat_name
-                ws[f'B{row}'] = val_a
-                ws[f'C{row}'] = val_b
-                ws[f'D{row}'] = f'=B{row}-C{row}'
-                if val_a + val_b > 0:
-                    ws[f'E{row}'] = f'=IF(B{row}+C{row}>0, B{row}/(B{row}+C{row})*100, 0)'
-                else:
-                    ws[f'E{row}'] = 0
-                ws[f'F{row}'] = f'=IF(D{row}>0, "{team_a}", IF(D{row}<0, "{team_b}", "{equal_text}"))'
-                
-                for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-                    ws[f'{col}{row}'].border = border
-                    if col in ['B', 'C', 'D', 'E']:
-                        ws[f'{col}{row}'].alignment = center_align
-                row += 1
+            row = write_stat_rows(row, stats_shooting)
             
             # Shooting accuracy formulas
-            ws[f'A{row}'] = shot_on_target_rate_text
-            ws[f'B{row}'] = f'=IF(B{row-6}>0, B{row-5}/B{row-6}*100, 0)'
-            ws[f'C{row}'] = f'=IF(C{row-6}>0, C{row-5}/C{row-6}*100, 0)'
-            ws[f'D{row}'] = f'=B{row}-C{row}'
-            ws[f'E{row}'] = f'=IF(B{row}+C{row}>0, B{row}/(B{row}+C{row})*100, 0)'
-            ws[f'F{row}'] = f'=IF(D{row}>0, "{team_a}", IF(D{row}<0, "{team_b}", "{equal_text}"))'
-            for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-                ws[f'{col}{row}'].border = border
-                ws[f'{col}{row}'].font = Font(bold=True)
-                if col in ['B', 'C', 'D', 'E']:
-                    ws[f'{col}{row}'].alignment = center_align
+            write_stat_row(row, shot_on_target_rate_text,
+                           f'=IF(B{row-6}>0, B{row-5}/B{row-6}*100, 0)',
+                           f'=IF(C{row-6}>0, C{row-5}/C{row-6}*100, 0)',
+                           share_formula(row), bold=True)
             row += 1
             
-            ws[f'A{row}'] = goal_conversion_rate_text
-            ws[f'B{row}'] = f'=IF(B{row-7}>0, B{row-6}/B{row-7}*100, 0)'
-            ws[f'C{row}'] = f'=IF(C{row-7}>0, C{row-6}/C{row-7}*100, 0)'
-            ws[f'D{row}'] = f'=B{row}-C{row}'
-            ws[f'E{row}'] = f'=IF(B{row}+C{row}>0, B{row}/(B{row}+C{row})*100, 0)'
-            ws[f'F{row}'] = f'=IF(D{row}>0, "{team_a}", IF(D{row}<0, "{team_b}", "{equal_text}"))'
-            for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-                ws[f'{col}{row}'].border = border
-                ws[f'{col}{row}'].font = Font(bold=True)
-                if col in ['B', 'C', 'D', 'E']:
-                    ws[f'{col}{row}'].alignment = center_align
+            write_stat_row(row, goal_conversion_rate_text,
+                           f'=IF(B{row-7}>0, B{row-6}/B{row-7}*100, 0)',
+                           f'=IF(C{row-7}>0, C{row-6}/C{row-7}*100, 0)',
+                           share_formula(row), bold=True)
             row += 2
             
             # === 2. สถิติการส่งบอล (Passing Statistics) ===
-            ws.merge_cells(f'A{row}:F{row}')
-            ws[f'A{row}'] = passing_stats_text
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            ws[f'A{row}'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+            write_section(row, passing_stats_text)
             row += 1
             
-            pass_types = ["ส่งบอล", "ข้ามบอล", "ผ่านบอล", "ส่งบอลยาว", "ส่งบอลสั้น", "ส่งบอลในเขตโทษ"]
-            all_passes = [e for e in self.events if e.event_type in pass_types]
-            team_a_passes = [e for e in all_passes 
-                           if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()]
-            team_b_passes = [e for e in all_passes 
-                           if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()]
+            team_a_passes = count_events(team_a_counts, PASS_TYPES)
+            team_b_passes = count_events(team_b_counts, PASS_TYPES)
             
-            team_a_passes_success = len([e for e in team_a_passes if e.outcome in ["สำเร็จ", "แอสซิสต์", "คีย์พาส"]])
-            team_b_passes_success = len([e for e in team_b_passes if e.outcome in ["สำเร็จ", "แอสซิสต์", "คีย์พาส"]])
+            team_a_passes_success = count_events(team_a_counts, PASS_TYPES, PASS_SUCCESS_OUTCOMES)
+            team_b_passes_success = count_events(team_b_counts, PASS_TYPES, PASS_SUCCESS_OUTCOMES)
             
-            team_a_passes_failed = len([e for e in team_a_passes if e.outcome == "ไม่สำเร็จ"])
-            team_b_passes_failed = len([e for e in team_b_passes if e.outcome == "ไม่สำเร็จ"])
+            team_a_passes_failed = count_events(team_a_counts, PASS_TYPES, ["ไม่สำเร็จ"])
+            team_b_passes_failed = count_events(team_b_counts, PASS_TYPES, ["ไม่สำเร็จ"])
             
-            team_a_assists = len([e for e in team_a_passes if e.outcome == "แอสซิสต์"])
-            team_b_assists = len([e for e in team_b_passes if e.outcome == "แอสซิสต์"])
+            team_a_assists = count_events(team_a_counts, PASS_TYPES, ["แอสซิสต์"])
+            team_b_assists = count_events(team_b_counts, PASS_TYPES, ["แอสซิสต์"])
             
-            team_a_key_passes = len([e for e in team_a_passes if e.outcome == "คีย์พาส"])
-            team_b_key_passes = len([e for e in team_b_passes if e.outcome == "คีย์พาส"])
+            team_a_key_passes = count_events(team_a_counts, PASS_TYPES, ["คีย์พาส"])
+            team_b_key_passes = count_events(team_b_counts, PASS_TYPES, ["คีย์พาส"])
             
             # Define passing stats based on language
             if current_lang == "EN":
                 stats_passing = [
-                    ('Total Passes', len(team_a_passes), len(team_b_passes)),
+                    ('Total Passes', team_a_passes, team_b_passes),
                     ('Successful Passes', team_a_passes_success, team_b_passes_success),
                     ('Failed Passes', team_a_passes_failed, team_b_passes_failed),
                     ('Assists', team_a_assists, team_b_assists),
@@ -1609,7 +1652,7 @@ class ManualTrackingData:
                 pass_success_rate_text = 'Pass Success Rate (%)'
             else:  # TH
                 stats_passing = [
-                    ('จำนวนการส่งบอลทั้งหมด', len(team_a_passes), len(team_b_passes)),
+                    ('จำนวนการส่งบอลทั้งหมด', team_a_passes, team_b_passes),
                     ('ส่งบอลสำเร็จ', team_a_passes_success, team_b_passes_success),
                     ('ส่งบอลไม่สำเร็จ', team_a_passes_failed, team_b_passes_failed),
                     ('แอสซิสต์', team_a_assists, team_b_assists),
@@ -1617,80 +1660,36 @@ class ManualTrackingData:
                 ]
                 pass_success_rate_text = 'อัตราการส่งบอลสำเร็จ (%)'
             
-            for stat_name, val_a, val_b in stats_passing:
-                ws[f'A{row}'] = stat_name
-                ws[f'B{row}'] = val_a
-                ws[f'C{row}'] = val_b
-                ws[f'D{row}'] = f'=B{row}-C{row}'
-                if val_a + val_b > 0:
-                    ws[f'E{row}'] = f'=IF(B{row}+C{row}>0, B{row}/(B{row}+C{row})*100, 0)'
-                else:
-                    ws[f'E{row}'] = 0
-                ws[f'F{row}'] = f'=IF(D{row}>0, "{team_a}", IF(D{row}<0, "{team_b}", "{equal_text}"))'
-                
-                for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-                    ws[f'{col}{row}'].border = border
-                    if col in ['B', 'C', 'D', 'E']:
-                        ws[f'{col}{row}'].alignment = center_align
-                row += 1
+            row = write_stat_rows(row, stats_passing)
             
             # Pass accuracy formula
-            ws[f'A{row}'] = pass_success_rate_text
-            ws[f'B{row}'] = f'=IF(B{row-5}>0, B{row-4}/(B{row-4}+B{row-3})*100, 0)'
-            ws[f'C{row}'] = f'=IF(C{row-5}>0, C{row-4}/(C{row-4}+C{row-3})*100, 0)'
-            ws[f'D{row}'] = f'=B{row}-C{row}'
-            ws[f'E{row}'] = f'=IF(B{row}+C{row}>0, B{row}/(B{row}+C{row})*100, 0)'
-            ws[f'F{row}'] = f'=IF(D{row}>0, "{team_a}", IF(D{row}<0, "{team_b}", "{equal_text}"))'
-            for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-                ws[f'{col}{row}'].border = border
-                ws[f'{col}{row}'].font = Font(bold=True)
-                if col in ['B', 'C', 'D', 'E']:
-                    ws[f'{col}{row}'].alignment = center_align
+            write_stat_row(row, pass_success_rate_text,
+                           f'=IF(B{row-5}>0, B{row-4}/(B{row-4}+B{row-3})*100, 0)',
+                           f'=IF(C{row-5}>0, C{row-4}/(C{row-4}+C{row-3})*100, 0)',
+                           share_formula(row), bold=True)
             row += 2
             
             # === 3. สถิติการป้องกัน (Defensive Statistics) ===
-            ws.merge_cells(f'A{row}:F{row}')
-            ws[f'A{row}'] = defensive_stats_text
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            ws[f'A{row}'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+            write_section(row, defensive_stats_text)
             row += 1
             
-            defensive_types = ["แย่งบอล", "สกัดบอล", "เคลียร์บอล", "บล็อก", "เซฟ"]
-            all_defensive = [e for e in self.events if e.event_type in defensive_types]
-            team_a_defensive = [e for e in all_defensive 
-                              if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()]
-            team_b_defensive = [e for e in all_defensive 
-                              if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()]
-            
-            all_tackles = [e for e in self.events if e.event_type == "แย่งบอล"]
-            team_a_tackles = len([e for e in all_tackles 
-                                if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()])
-            team_b_tackles = len([e for e in all_tackles 
-                                if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()])
-            
-            all_interceptions = [e for e in self.events if e.event_type == "สกัดบอล"]
-            team_a_interceptions = len([e for e in all_interceptions 
-                                      if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()])
-            team_b_interceptions = len([e for e in all_interceptions 
-                                      if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()])
-            
-            all_clearances = [e for e in self.events if e.event_type == "เคลียร์บอล"]
-            team_a_clearances = len([e for e in all_clearances 
-                                   if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()])
-            team_b_clearances = len([e for e in all_clearances 
-                                   if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()])
-            
-            all_blocks = [e for e in self.events if e.event_type == "บล็อก"]
-            team_a_blocks = len([e for e in all_blocks 
-                               if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()])
-            team_b_blocks = len([e for e in all_blocks 
-                               if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()])
-            
-            all_saves = [e for e in self.events if e.event_type == "เซฟ"]
-            team_a_saves = len([e for e in all_saves 
-                              if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()])
-            team_b_saves = len([e for e in all_saves 
-                              if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()])
+            team_a_defensive = count_events(team_a_counts, DEFENSIVE_TYPES)
+            team_b_defensive = count_events(team_b_counts, DEFENSIVE_TYPES)
+            
+            team_a_tackles = count_events(team_a_counts, ["แย่งบอล"])
+            team_b_tackles = count_events(team_b_counts, ["แย่งบอล"])
+            
+            team_a_interceptions = count_events(team_a_counts, ["สกัดบอล"])
+            team_b_interceptions = count_events(team_b_counts, ["สกัดบอล"])
+            
+            team_a_clearances = count_events(team_a_counts, ["เคลียร์บอล"])
+            team_b_clearances = count_events(team_b_counts, ["เคลียร์บอล"])
+            
+            team_a_blocks = count_events(team_a_counts, ["บล็อก"])
+            team_b_blocks = count_events(team_b_counts, ["บล็อก"])
+            
+            team_a_saves = count_events(team_a_counts, ["เซฟ"])
+            team_b_saves = count_events(team_b_counts, ["เซฟ"])
             
             # Define defensive stats based on language
             if current_lang == "EN":
@@ -1700,7 +1699,7 @@ class ManualTrackingData:
                     ('Clearances', team_a_clearances, team_b_clearances),
                     ('Blocks', team_a_blocks, team_b_blocks),
                     ('Saves', team_a_saves, team_b_saves),
-                    ('Total Defensive Actions', len(team_a_defensive), len(team_b_defensive)),
+                    ('Total Defensive Actions', team_a_defensive, team_b_defensive),
                 ]
             else:  # TH
                 stats_defensive = [
@@ -1709,32 +1708,14 @@ class ManualTrackingData:
                     ('เคลียร์บอล', team_a_clearances, team_b_clearances),
                     ('บล็อก', team_a_blocks, team_b_blocks),
                     ('เซฟ', team_a_saves, team_b_saves),
-                    ('รวมการป้องกัน', len(team_a_defensive), len(team_b_defensive)),
+                    ('รวมการป้องกัน', team_a_defensive, team_b_defensive),
                 ]
             
-            for stat_name, val_a, val_b in stats_defensive:
-                ws[f'A{row}'] = stat_name
-                ws[f'B{row}'] = val_a
-                ws[f'C{row}'] = val_b
-                ws[f'D{row}'] = f'=B{row}-C{row}'
-                if val_a + val_b > 0:
-                    ws[f'E{row}'] = f'=IF(B{row}+C{row}>0, B{row}/(B{row}+C{row})*100, 0)'
-                else:
-                    ws[f'E{row}'] = 0
-                ws[f'F{row}'] = f'=IF(D{row}>0, "{team_a}", IF(D{row}<0, "{team_b}", "{equal_text}"))'
-                
-                for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-                    ws[f'{col}{row}'].border = border
-                    if col in ['B', 'C', 'D', 'E']:
-                        ws[f'{col}{row}'].alignment = center_align
-                row += 1
+            row = write_stat_rows(row, stats_defensive)
             row += 1
             
             # === 4. สถิติการทำผิดกติกา (Disciplinary Statistics) ===
-            ws.merge_cells(f'A{row}:F{row}')
-            ws[f'A{row}'] = disciplinary_stats_text
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            ws[f'A{row}'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+            write_section(row, disciplinary_stats_text)
             row += 1
             
             # Count disciplinary events - handle overlapping actions and outcomes
@@ -1743,36 +1724,17 @@ class ManualTrackingData:
             # - "ใบเหลือง" = action "ใบเหลือง" + action "ฟาวล์" ที่ outcome เป็น "ใบเหลือง"
             # - "ใบแดง" = action "ใบแดง" + action "ฟาวล์" ที่ outcome เป็น "ใบแดง"
             
-            # Get all foul events
-            all_foul_events = [e for e in self.events if e.event_type == "ฟาวล์"]
-            # Get all yellow card events (both action "ใบเหลือง" and fouls with outcome "ใบเหลือง")
-            all_yellow_events = [e for e in self.events if e.event_type == "ใบเหลือง"]
-            all_yellow_from_fouls = [e for e in all_foul_events if e.outcome == "ใบเหลือง"]
-            # Get all red card events (both action "ใบแดง" and fouls with outcome "ใบแดง")
-            all_red_events = [e for e in self.events if e.event_type == "ใบแดง"]
-            all_red_from_fouls = [e for e in all_foul_events if e.outcome == "ใบแดง"]
-            
             # Count fouls (only fouls without yellow/red card outcomes)
-            team_a_fouls = len([e for e in all_foul_events 
-                              if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()
-                              and e.outcome != "ใบเหลือง" and e.outcome != "ใบแดง"])
-            team_b_fouls = len([e for e in all_foul_events 
-                              if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()
-                              and e.outcome != "ใบเหลือง" and e.outcome != "ใบแดง"])
+            team_a_fouls = count_events(team_a_counts, ["ฟาวล์"]) - count_events(team_a_counts, ["ฟาวล์"], ["ใบเหลือง", "ใบแดง"])
+            team_b_fouls = count_events(team_b_counts, ["ฟาวล์"]) - count_events(team_b_counts, ["ฟาวล์"], ["ใบเหลือง", "ใบแดง"])
             
             # Count yellow cards (action "ใบเหลือง" + fouls with outcome "ใบเหลือง")
-            all_yellow_combined = all_yellow_events + all_yellow_from_fouls
-            team_a_yellow = len([e for e in all_yellow_combined 
-                               if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()])
-            team_b_yellow = len([e for e in all_yellow_combined 
-                               if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()])
+            team_a_yellow = count_events(team_a_counts, ["ใบเหลือง"]) + count_events(team_a_counts, ["ฟาวล์"], ["ใบเหลือง"])
+            team_b_yellow = count_events(team_b_counts, ["ใบเหลือง"]) + count_events(team_b_counts, ["ฟาวล์"], ["ใบเหลือง"])
             
             # Count red cards (action "ใบแดง" + fouls with outcome "ใบแดง")
-            all_red_combined = all_red_events + all_red_from_fouls
-            team_a_red = len([e for e in all_red_combined 
-                            if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()])
-            team_b_red = len([e for e in all_red_combined 
-                            if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()])
+            team_a_red = count_events(team_a_counts, ["ใบแดง"]) + count_events(team_a_counts, ["ฟาวล์"], ["ใบแดง"])
+            team_b_red = count_events(team_b_counts, ["ใบแดง"]) + count_events(team_b_counts, ["ฟาวล์"], ["ใบแดง"])
             
             # Define disciplinary stats based on language
             if current_lang == "EN":
@@ -1788,55 +1750,24 @@ class ManualTrackingData:
                     ('ใบแดง', team_a_red, team_b_red),
                 ]
             
-            for stat_name, val_a, val_b in stats_disciplinary:
-                ws[f'A{row}'] = stat_name
-                ws[f'B{row}'] = val_a
-                ws[f'C{row}'] = val_b
-                ws[f'D{row}'] = f'=B{row}-C{row}'
-                if val_a + val_b > 0:
-                    ws[f'E{row}'] = f'=IF(B{row}+C{row}>0, B{row}/(B{row}+C{row})*100, 0)'
-                else:
-                    ws[f'E{row}'] = 0
-                ws[f'F{row}'] = f'=IF(D{row}>0, "{team_a}", IF(D{row}<0, "{team_b}", "{equal_text}"))'
-                
-                for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-                    ws[f'{col}{row}'].border = border
-                    if col in ['B', 'C', 'D', 'E']:
-                        ws[f'{col}{row}'].alignment = center_align
-                row += 1
+            row = write_stat_rows(row, stats_disciplinary)
             row += 1
             
             # === 5. สถิติการโจมตี (Attacking Statistics) ===
-            ws.merge_cells(f'A{row}:F{row}')
-            ws[f'A{row}'] = attacking_stats_text
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            ws[f'A{row}'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+            write_section(row, attacking_stats_text)
             row += 1
             
-            attacking_types = ["ยิง", "ส่งบอล", "ข้ามบอล", "ผ่านบอล", "ส่งบอลยาว", "ส่งบอลในเขตโทษ", "เตะมุม", "ฟรีคิก"]
-            all_attacking = [e for e in self.events if e.event_type in attacking_types]
-            team_a_attacking = [e for e in all_attacking 
-                              if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()]
-            team_b_attacking = [e for e in all_attacking 
-                              if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()]
-            
-            all_corners = [e for e in self.events if e.event_type == "เตะมุม"]
-            team_a_corners = len([e for e in all_corners 
-                                if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()])
-            team_b_corners = len([e for e in all_corners 
-                                if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()])
-            
-            all_free_kicks = [e for e in self.events if e.event_type == "ฟรีคิก"]
-            team_a_free_kicks = len([e for e in all_free_kicks 
-                                   if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()])
-            team_b_free_kicks = len([e for e in all_free_kicks 
-                                   if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()])
-            
-            all_penalties = [e for e in self.events if e.event_type == "ลูกโทษ"]
-            team_a_penalties = len([e for e in all_penalties 
-                                  if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()])
-            team_b_penalties = len([e for e in all_penalties 
-                                  if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()])
+            team_a_attacking = count_events(team_a_counts, ATTACKING_TYPES)
+            team_b_attacking = count_events(team_b_counts, ATTACKING_TYPES)
+            
+            team_a_corners = count_events(team_a_counts, ["เตะมุม"])
+            team_b_corners = count_events(team_b_counts, ["เตะมุม"])
+            
+            team_a_free_kicks = count_events(team_a_counts, ["ฟรีคิก"])
+            team_b_free_kicks = count_events(team_b_counts, ["ฟรีคิก"])
+            
+            team_a_penalties = count_events(team_a_counts, ["ลูกโทษ"])
+            team_b_penalties = count_events(team_b_counts, ["ลูกโทษ"])
             
             # Define attacking stats based on language
             if current_lang == "EN":
@@ -1844,51 +1775,30 @@ class ManualTrackingData:
                     ('Corner Kicks', team_a_corners, team_b_corners),
                     ('Free Kicks', team_a_free_kicks, team_b_free_kicks),
                     ('Penalties', team_a_penalties, team_b_penalties),
-                    ('Total Attacking Actions', len(team_a_attacking), len(team_b_attacking)),
+                    ('Total Attacking Actions', team_a_attacking, team_b_attacking),
                 ]
             else:  # TH
                 stats_attacking = [
                     ('เตะมุม', team_a_corners, team_b_corners),
                     ('ฟรีคิก', team_a_free_kicks, team_b_free_kicks),
                     ('ลูกโทษ', team_a_penalties, team_b_penalties),
-                    ('รวมการโจมตี', len(team_a_attacking), len(team_b_attacking)),
+                    ('รวมการโจมตี', team_a_attacking, team_b_attacking),
                 ]
             
-            for stat_name, val_a, val_b in stats_attacking:
-                ws[f'A{row}'] = stat_name
-                ws[f'B{row}'] = val_a
-                ws[f'C{row}'] = val_b
-                ws[f'D{row}'] = f'=B{row}-C{row}'
-                if val_a + val_b > 0:
-                    ws[f'E{row}'] = f'=IF(B{row}+C{row}>0, B{row}/(B{row}+C{row})*100, 0)'
-                else:
-                    ws[f'E{row}'] = 0
-                ws[f'F{row}'] = f'=IF(D{row}>0, "{team_a}", IF(D{row}<0, "{team_b}", "{equal_text}"))'
-                
-                for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-                    ws[f'{col}{row}'].border = border
-                    if col in ['B', 'C', 'D', 'E']:
-                        ws[f'{col}{row}'].alignment = center_align
-                row += 1
+            row = write_stat_rows(row, stats_attacking)
             row += 1
             
             # === 6. สรุปภาพรวม (Overall Summary) ===
-            ws.merge_cells(f'A{row}:F{row}')
-            ws[f'A{row}'] = overall_summary_text
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            ws[f'A{row}'].fill = PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid")
+            write_section(row, overall_summary_text, STATS_SUMMARY_FILL)
             row += 1
             
             # Calculate total events
-            total_a = len(team_a_events)
-            total_b = len(team_b_events)
+            total_a = count_events(team_a_counts, list(team_a_counts))
+            total_b = count_events(team_b_counts, list(team_b_counts))
             
             # Count total goals from all actions (not just shots)
-            all_goals_events = [e for e in self.events if e.outcome == "ประตู"]
-            team_a_total_goals = len([e for e in all_goals_events 
-                                    if e.team and str(e.team).strip().lower() == str(team_a).strip().lower()])
-            team_b_total_goals = len([e for e in all_goals_events 
-                                    if e.team and str(e.team).strip().lower() == str(team_b).strip().lower()])
+            team_a_total_goals = count_events(team_a_counts, list(team_a_counts), ["ประตู"])
+            team_b_total_goals = count_events(team_b_counts, list(team_b_counts), ["ประตู"])
             
             # Define summary stats based on language
             if current_lang == "EN":
@@ -1911,45 +1821,23 @@ class ManualTrackingData:
                 ]
             
             for stat_name, val_a, val_b in summary_stats:
-                ws[f'A{row}'] = stat_name
-                if isinstance(val_a, (int, float)):
-                    ws[f'B{row}'] = val_a
-                else:
-                    ws[f'B{row}'] = val_a
-                if isinstance(val_b, (int, float)):
-                    ws[f'C{row}'] = val_b
-                else:
-                    ws[f'C{row}'] = val_b
-                ws[f'D{row}'] = f'=B{row}-C{row}'
-                ws[f'E{row}'] = f'=IF(B{row}+C{row}>0, B{row}/(B{row}+C{row})*100, 0)'
-                ws[f'F{row}'] = f'=IF(D{row}>0, "{team_a}", IF(D{row}<0, "{team_b}", "{equal_text}"))'
-                
-                for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-                    ws[f'{col}{row}'].border = border
-                    ws[f'{col}{row}'].font = Font(bold=True)
-                    if col in ['B', 'C', 'D', 'E']:
-                        ws[f'{col}{row}'].alignment = center_align
+                write_stat_row(row, stat_name, val_a, val_b, share_formula(row), bold=True)
                 row += 1
             
-            # Auto-adjust column widths
-            from openpyxl.utils import get_column_letter
-            for col in range(1, ws.max_column + 1):
-                column_letter = get_column_letter(col)
-                max_length = 0
-                
-                # Check all cells in this column
-                for row in range(1, ws.max_row + 1):
-                    cell = ws.cell(row=row, column=col)
-                    if cell.value:
+            # Auto-adjust column widths from one iter_rows walk over all cells
+            max_lengths = [0] * ws.max_column
+            for values in ws.iter_rows(values_only=True):
+                for col, value in enumerate(values):
+                    if value:
                         try:
-                            cell_length = len(str(cell.value))
-                            max_length = max(max_length, cell_length)
+                            max_lengths[col] = max(max_lengths[col], len(str(value)))
                         except:
                             pass
-                
+            
+            for col, max_length in enumerate(max_lengths, start=1):
                 # Set width with padding (min 10, max 50)
                 adjusted_width = min(max(max_length + 2, 10), 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+                ws.column_dimensions[get_column_letter(col)].width = adjusted_width
             
             # Freeze header row
             ws.freeze_panes = 'A3'  # Freeze after title and header row
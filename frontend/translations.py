@@ -5,6 +5,7 @@ Format: Column A = Thai (TH), Column B = English (EN)
 """
 import os
 import sys
+from functools import lru_cache
 from typing import Dict, Optional
 from pathlib import Path
 
@@ -428,6 +429,7 @@ class TranslationManager:
         """Reload translations from file"""
         self.translations.clear()
         self._load_translations()
+        _cached_translate.cache_clear()
 
 # Global translation manager instance
 _translation_manager = None
@@ -439,7 +441,12 @@ def get_translation_manager() -> TranslationManager:
         _translation_manager = TranslationManager()
     return _translation_manager
 
+@lru_cache(maxsize=4096)
+def _cached_translate(text: str, default: Optional[str], lang: str) -> str:
+    """Memoized translate() - lang is part of the key so switching language needs no invalidation"""
+    return get_translation_manager().translate(text, default)
+
 def t(text: str, default: Optional[str] = None) -> str:
     """Global translation function"""
-    return get_translation_manager().translate(text, default)
+    return _cached_translate(text, default, get_translation_manager().current_language)
 